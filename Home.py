@@ -3,6 +3,7 @@ from PIL import Image
 import base64
 from io import BytesIO
 from app.sidebar_manager import SidebarManager
+from app.font_registry import WARMUP_FONTS, font_registry
 import qrcode
 
 # 페이지 설정
@@ -17,6 +18,9 @@ st.set_page_config(
     }
 )
 
+# 폰트 미리 불러오기 (프로세스당 한 번, 이후 렌더링은 캐시된 폰트 사용)
+font_registry.warmup(WARMUP_FONTS)
+
 # 사이드바 설정
 st.markdown("""
     <style>
@@ -0,0 +1,221 @@
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from app.absence_excel_processing import ABSENCE_TYPES, UNEXCUSED_TYPE
+
+ANALYTICS_PATH_ENV = "HANOL_ABSENCE_ANALYTICS"
+DEFAULT_ANALYTICS_PATH = Path(__file__).parent.parent.absolute() / "data" / "absence_analytics.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS absence_runs (
+    grade TEXT NOT NULL,
+    class_name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    attendance_type TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    month TEXT NOT NULL,
+    days INTEGER NOT NULL,
+    reason TEXT,
+    PRIMARY KEY (grade, class_name, number, name, attendance_type, start_date, end_date)
+);
+CREATE TABLE IF NOT EXISTS student_month_totals (
+    grade TEXT NOT NULL,
+    class_name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    month TEXT NOT NULL,
+    attendance_type TEXT NOT NULL,
+    runs INTEGER NOT NULL,
+    days INTEGER NOT NULL,
+    PRIMARY KEY (grade, class_name, number, name, month, attendance_type)
+);
+CREATE INDEX IF NOT EXISTS student_month_totals_month ON student_month_totals (month);
+"""
+
+
+class AbsenceRollups:
+    """
+    학생별/월별/출결구분별 결석 합계를 미리 집계해 두는 로컬 SQLite 저장소.
+
+    처리된 결석 데이터(process_excel 결과)를 학급 단위로 ingest하면 결석 기간 원본(absence_runs)을
+    갱신한 뒤 그 학급의 월별 합계(student_month_totals)만 다시 집계합니다. 조회는 집계 표만 읽으므로
+    1년치 데이터도 월별 파일을 다시 올리지 않고 바로 확인할 수 있습니다.
+    결석 기간은 시작일이 속한 달로 집계합니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or os.environ.get(ANALYTICS_PATH_ENV) or DEFAULT_ANALYTICS_PATH)
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with self._lock:
+                connection.executescript(SCHEMA)
+                self._initialized = True
+        return connection
+
+    def ingest(self, data, grade, class_name):
+        """
+        한 학급의 처리된 결석 데이터를 반영하고 학급 집계를 갱신합니다.
+
+        파일이 다루는 기간(첫 결석 시작일 ~ 마지막 결석 종료일) 안의 기존 결석 기간은 새 데이터로
+        교체하므로, 누적 파일을 다시 올리거나 기간이 늘어난 결석이 있어도 중복 집계되지 않습니다.
+        """
+        if data.empty:
+            return
+        grade, class_name = str(grade), str(class_name)
+        runs = pd.DataFrame({
+            "number": data['번호'].astype(int),
+            "name": data['성명'].astype(str),
+            "attendance_type": data['출결구분'].astype(str),
+            "start_date": data['결석시작일'].astype(str),
+            "end_date": data['결석종료일'].astype(str),
+            "days": data['결석일수'].astype(int),
+            "reason": data['사유'].astype(str),
+        })
+        # 'YYYY.MM.DD' → 'YYYY-MM'
+        runs["month"] = runs["start_date"].str.slice(0, 7).str.replace('.', '-', regex=False)
+        first_date, last_date = runs["start_date"].min(), runs["end_date"].max()
+        rows = [
+            (grade, class_name, *row)
+            for row in runs[
+                ["number", "name", "attendance_type", "start_date", "end_date", "month", "days", "reason"]
+            ].itertuples(index=False, name=None)
+        ]
+
+        with closing(self._connect()) as connection, connection:
+            connection.execute(
+                "DELETE FROM absence_runs WHERE grade = ? AND class_name = ? AND start_date BETWEEN ? AND ?",
+                (grade, class_name, first_date, last_date),
+            )
+            connection.executemany(
+                "INSERT OR REPLACE INTO absence_runs "
+                "(grade, class_name, number, name, attendance_type, start_date, end_date, month, days, reason) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            connection.execute(
+                "DELETE FROM student_month_totals WHERE grade = ? AND class_name = ?", (grade, class_name)
+            )
+            connection.execute(
+                "INSERT INTO student_month_totals "
+                "SELECT grade, class_name, number, name, month, attendance_type, COUNT(*), SUM(days) "
+                "FROM absence_runs WHERE grade = ? AND class_name = ? "
+                "GROUP BY grade, class_name, number, name, month, attendance_type",
+                (grade, class_name),
+            )
+
+    def _totals(self, grade=None, class_name=None, start_month=None, end_month=None):
+        """조건에 맞는 월별 집계 행을 DataFrame으로 읽습니다."""
+        if not self.path.exists():
+            return pd.DataFrame(
+                columns=["grade", "class_name", "number", "name", "month", "attendance_type", "runs", "days"]
+            )
+        conditions, params = [], []
+        for column, value in (("grade", grade), ("class_name", class_name)):
+            if value:
+                conditions.append(f"{column} = ?")
+                params.append(str(value))
+        if start_month:
+            conditions.append("month >= ?")
+            params.append(start_month)
+        if end_month:
+            conditions.append("month <= ?")
+            params.append(end_month)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with closing(self._connect()) as connection:
+            return pd.read_sql_query(
+                f"SELECT * FROM student_month_totals{where}", connection, params=params
+            )
+
+    def months(self):
+        """집계된 달('YYYY-MM') 목록을 반환합니다."""
+        return sorted(self._totals()["month"].unique())
+
+    def student_totals(self, grade=None, class_name=None, start_month=None, end_month=None):
+        """
+        학생별 출결구분별 결석 일수 합계를 반환합니다.
+
+        Returns:
+            DataFrame: 학년, 반, 번호, 성명, 출석인정결석, 질병결석, 기타결석, 미인정결석, 합계
+        """
+        totals = self._totals(grade, class_name, start_month, end_month)
+        table = totals.pivot_table(
+            index=["grade", "class_name", "number", "name"],
+            columns="attendance_type",
+            values="days",
+            aggfunc="sum",
+            fill_value=0,
+        ).reindex(columns=ABSENCE_TYPES, fill_value=0)
+        table["합계"] = table.sum(axis=1)
+        table = table.reset_index().rename(
+            columns={"grade": "학년", "class_name": "반", "number": "번호", "name": "성명"}
+        )
+        table.columns.name = None
+        return table.sort_values(["학년", "반", "번호"], key=_natural_key, ignore_index=True)
+
+    def class_totals(self, grade=None, start_month=None, end_month=None):
+        """
+        학급별 출결구분별 결석 일수 합계를 반환합니다.
+
+        Returns:
+            DataFrame: 학년, 반, 출석인정결석, 질병결석, 기타결석, 미인정결석, 합계, 결석 학생 수
+        """
+        students = self.student_totals(grade, None, start_month, end_month)
+        table = students.groupby(["학년", "반"], sort=False)[ABSENCE_TYPES + ["합계"]].sum()
+        table["결석 학생 수"] = students.groupby(["학년", "반"], sort=False).size()
+        return table.reset_index()
+
+    def monthly_totals(self, grade=None, class_name=None):
+        """
+        월별 출결구분별 결석 일수 합계를 반환합니다.
+
+        Returns:
+            DataFrame: 월, 출석인정결석, 질병결석, 기타결석, 미인정결석
+        """
+        totals = self._totals(grade, class_name)
+        table = totals.pivot_table(
+            index="month", columns="attendance_type", values="days", aggfunc="sum", fill_value=0
+        ).reindex(columns=ABSENCE_TYPES, fill_value=0)
+        table.columns.name = None
+        return table.rename_axis("월").reset_index()
+
+    def near_threshold(self, threshold, warning_ratio=0.8, grade=None, class_name=None,
+                       start_month=None, end_month=None, attendance_type=UNEXCUSED_TYPE):
+        """
+        미인정 결석 일수가 기준의 warning_ratio 이상인 학생을 많은 순으로 반환합니다.
+
+        Returns:
+            DataFrame: student_totals 열 + 남은 일수
+        """
+        students = self.student_totals(grade, class_name, start_month, end_month)
+        near = students[students[attendance_type] >= threshold * warning_ratio].copy()
+        near["남은 일수"] = (threshold - near[attendance_type]).clip(lower=0)
+        return near.sort_values(attendance_type, ascending=False, ignore_index=True)
+
+
+def _natural_key(column):
+    """학년/반/번호를 숫자 순서로 정렬합니다."""
+    return pd.to_numeric(column, errors="coerce")
+
+
+def current_school_year_start():
+    """현재 학년도 시작 달('YYYY-03')을 반환합니다. (1~2월은 전년도 학년도)"""
+    today = datetime.now()
+    year = today.year if today.month >= 3 else today.year - 1
+    return f"{year}-03"
+
+
+# 모든 세션이 공유하는 결석 집계 저장소
+absence_rollups = AbsenceRollups()
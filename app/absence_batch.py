@@ -0,0 +1,252 @@
+import io
+import logging
+import os
+import re
+import sqlite3
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import PurePosixPath
+
+from openpyxl import load_workbook
+
+from app.absence_analytics import AbsenceRollups
+from app.absence_excel_processing import load_absence_data, report_rows
+from app.absence_index import IssuedReportIndex
+from app.absence_pdf import build_absence_pdf_reports
+from app.absence_report import build_absence_reports
+from app.absence_store import processed_data_store
+from app.absence_summary import iter_summary_rows
+
+EXPORT_EXTENSIONS = (".xlsx", ".xls")
+REPORT_FORMATS = ("docx", "pdf")
+
+logger = logging.getLogger(__name__)
+
+# 학년, 반을 찾는 패턴 (예: "1학년 3반")
+CLASS_NAME_PATTERN = re.compile(r"([1-3])\s*학년\s*(\d{1,2})\s*반")
+# 파일 이름/시트 이름/담임 목록에서만 쓰는 짧은 표기 (예: "1-3", "1_03")
+# 앞에 숫자(와 구분 기호)가 있거나, 뒤에 구분 기호와 월/일 모양의 1~2자리 숫자가 이어지면
+# 날짜("2024.3.2", "2024-03-02", "3.2.1")로 보고 건너뜀 ("출결_1-3_20240305"는 학급으로 인정)
+SHORT_CLASS_PATTERN = re.compile(r"(?<!\d)(?<!\d[-_./])([1-3])\s*[-_.]\s*(\d{1,2})(?!\d|\s*[-_./]\s*\d{1,2}(?!\d))")
+CLASS_PATTERNS = [CLASS_NAME_PATTERN, SHORT_CLASS_PATTERN]
+
+
+def _decode_zip_name(info):
+    """UTF-8 플래그가 없는 ZIP 항목 이름(윈도우 압축)을 cp949로 복원합니다."""
+    if info.flag_bits & 0x800:
+        return info.filename
+    try:
+        return info.filename.encode("cp437").decode("cp949")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return info.filename
+
+
+def collect_export_files(uploads):
+    """
+    업로드된 파일 목록에서 NEIS 엑셀 파일을 모읍니다. ZIP 파일은 압축을 풀어 포함합니다.
+
+    ZIP 안의 파일은 "ZIP 이름/폴더/파일 이름" 전체 경로를 이름으로 쓰므로, 학급 폴더마다 같은 파일 이름
+    (예: "1학년 3반/출결.xlsx", "1학년 4반/출결.xlsx")이 있어도 겹치지 않고 폴더 이름으로 학년/반을 찾습니다.
+
+    Args:
+        uploads: (파일 이름, 파일 내용 bytes) 목록
+
+    Returns:
+        list: (파일 이름, 파일 내용 bytes) 목록
+    """
+    files = []
+    for file_name, file_bytes in uploads:
+        if file_name.lower().endswith(".zip"):
+            with zipfile.ZipFile(io.BytesIO(file_bytes)) as archive:
+                for info in archive.infolist():
+                    name = _decode_zip_name(info)
+                    base_name = PurePosixPath(name).name
+                    if info.is_dir() or name.startswith("__MACOSX/") or base_name.startswith("~$"):
+                        continue
+                    if base_name.lower().endswith(EXPORT_EXTENSIONS):
+                        files.append((f"{file_name}/{name}", archive.read(info)))
+        elif file_name.lower().endswith(EXPORT_EXTENSIONS):
+            files.append((file_name, file_bytes))
+    return files
+
+
+def _match_class(text, patterns=CLASS_PATTERNS):
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            return match.group(1), str(int(match.group(2)))
+    return None
+
+
+def infer_class_info(file_name, file_bytes, max_rows=5):
+    """
+    파일 이름에서 학년/반을 찾고, 없으면 폴더를 포함한 경로, 시트 이름, 첫 몇 행의 셀 내용 순으로 찾습니다.
+    셀 내용에는 날짜가 많으므로 "1학년 3반"처럼 학년/반이 적힌 표기만 인정합니다.
+
+    Returns:
+        tuple: (학년, 반) 문자열. 찾지 못하면 None
+    """
+    path = PurePosixPath(file_name.replace("\\", "/"))
+    # 예: "1학년/3반.xlsx" → "1학년 3반"
+    class_info = _match_class(path.stem) or _match_class(" ".join(path.parent.parts + (path.stem,)))
+    if class_info or not zipfile.is_zipfile(io.BytesIO(file_bytes)):
+        return class_info
+
+    workbook = load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+    try:
+        for sheet in workbook.worksheets:
+            class_info = _match_class(sheet.title)
+            if class_info:
+                return class_info
+            for row in sheet.iter_rows(max_row=max_rows, values_only=True):
+                for cell in row:
+                    if isinstance(cell, str):
+                        class_info = _match_class(cell, (CLASS_NAME_PATTERN,))
+                        if class_info:
+                            return class_info
+    finally:
+        workbook.close()
+    return None
+
+
+def parse_teacher_names(text):
+    """
+    "1-3 홍길동" 또는 "1학년 3반 홍길동" 형식의 줄에서 학급별 담임교사 성명을 읽습니다.
+
+    Returns:
+        dict: {(학년, 반): 담임교사 성명}
+    """
+    teacher_names = {}
+    for line in (text or "").splitlines():
+        for pattern in CLASS_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                name = line[match.end():].strip(" :,\t")
+                if name:
+                    teacher_names[(match.group(1), str(int(match.group(2))))] = name
+                break
+    return teacher_names
+
+
+def process_class_export(file_name, file_bytes, teacher_names=None, month=None, report_format="docx", class_info=None,
+                         only_new=False, index_path=None):
+    """
+    학급 엑셀 파일 하나를 처리해 출결구분별 결석신고서를 만듭니다. (프로세스 풀 작업 단위)
+
+    Args:
+        report_format (str): "docx" 또는 "pdf"
+        class_info (tuple): (학년, 반). 없으면 파일 이름/내용에서 찾음
+        only_new (bool): 발급 기록 색인에 없는(새로 생기거나 달라진) 결석 기간만 만들고 기록
+        index_path (str): 발급 기록 색인 파일 경로 (기본값: IssuedReportIndex 기본 경로)
+
+    Returns:
+        dict: 파일 이름, 학년, 반, 출결구분별 건수, 이미 발급되어 뺀 결석 기간 수, {파일 이름: 문서 bytes}, 오류 메시지
+    """
+    result = {"file_name": file_name, "grade": None, "class_name": None, "counts": {}, "issued": 0, "documents": {},
+              "error": None}
+    try:
+        class_info = class_info or infer_class_info(file_name, file_bytes)
+        if class_info is None:
+            result["error"] = "파일 이름이나 내용에서 학년/반을 찾을 수 없습니다."
+            return result
+        grade, class_name = class_info
+        result["grade"], result["class_name"] = grade, class_name
+        teacher_name = (teacher_names or {}).get((grade, class_name), "")
+
+        # 처리 결과는 디스크 저장소에 남겨 요약 엑셀/다음 실행에서 다시 읽지 않음
+        data = processed_data_store.get_or_process(file_bytes, grade, class_name, load_absence_data, file_name)
+        try:
+            AbsenceRollups().ingest(data, grade, class_name)
+        except sqlite3.Error as e:
+            logger.warning("%s학년 %s반 결석 집계를 갱신하지 못했습니다: %s", grade, class_name, e)
+        data = report_rows(data)
+        if only_new:
+            index = IssuedReportIndex(index_path)
+            new_data = index.new_runs(data, grade, class_name)
+            result["issued"] = len(data) - len(new_data)
+            data = new_data
+
+        if report_format == "pdf":
+            reports = build_absence_pdf_reports(data, grade, class_name, teacher_name, month)
+        else:
+            # 프로세스 풀 안에서 실행되므로 출결구분별 문서는 순서대로 생성
+            reports = build_absence_reports(data, grade, class_name, teacher_name, month, max_workers=1)
+        for attendance_type, (output_name, document_bytes) in reports.items():
+            result["documents"][output_name] = document_bytes
+            result["counts"][attendance_type] = int((data['출결구분'] == attendance_type).sum())
+        if only_new:
+            index.record(data, grade, class_name)
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+def run_batch(files, teacher_names=None, month=None, max_workers=None, report_format="docx", only_new=False,
+              index_path=None):
+    """
+    여러 학급 엑셀 파일을 프로세스 풀에서 병렬로 처리합니다.
+
+    Args:
+        files: (파일 이름, 파일 내용 bytes) 목록
+        teacher_names (dict): {(학년, 반): 담임교사 성명}
+        max_workers (int): 작업 프로세스 수 (기본값: CPU 수)
+        report_format (str): "docx" 또는 "pdf"
+        only_new (bool), index_path (str): process_class_export 참고
+
+    Returns:
+        list: 파일별 처리 결과 (process_class_export 반환값), 학년/반 순으로 정렬
+    """
+    if not files:
+        return []
+
+    workers = min(len(files), max_workers or os.cpu_count() or 1)
+    if workers == 1:
+        results = [
+            process_class_export(name, data, teacher_names, month, report_format, None, only_new, index_path)
+            for name, data in files
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(
+                    process_class_export, name, data, teacher_names, month, report_format, None, only_new, index_path
+                )
+                for name, data in files
+            ]
+            results = [future.result() for future in futures]
+
+    return sorted(results, key=lambda r: (int(r["grade"] or 0), int(r["class_name"] or 0), r["file_name"]))
+
+
+def class_folder_name(result):
+    """처리 결과를 저장할 학년/반 폴더 이름을 반환합니다."""
+    return f"{result['grade']}학년 {result['class_name']}반"
+
+
+def iter_class_sheets(results, files):
+    """
+    처리 결과 순서대로 학급별 (시트 이름, 요약 행 생성기)를 하나씩 만듭니다. (write_summary_workbook 입력)
+
+    학급 데이터는 시트를 쓸 차례가 되었을 때 저장소에서 읽으므로 한 번에 한 학급만 메모리에 올립니다.
+    """
+    file_bytes_by_name = dict(files)
+    for result in results:
+        if result["error"]:
+            continue
+        data = processed_data_store.get_or_process(
+            file_bytes_by_name[result["file_name"]], result["grade"], result["class_name"],
+            load_absence_data, result["file_name"]
+        )
+        yield class_folder_name(result), iter_summary_rows(data)
+
+
+def build_batch_zip(results):
+    """학급별 결석신고서를 학년/반 폴더로 묶은 ZIP 파일(bytes)을 만듭니다."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for result in results:
+            folder = class_folder_name(result)
+            for output_name, document_bytes in result["documents"].items():
+                archive.writestr(f"{folder}/{output_name}", document_bytes)
+    return buffer.getvalue()
+
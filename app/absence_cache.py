@@ -0,0 +1,68 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+from app.absence_excel_processing import PROCESSING_VERSION
+
+
+class ProcessedDataCache:
+    """
+    업로드된 NEIS 엑셀 파일의 처리 결과를 보관하는 프로세스 전역 LRU 캐시.
+
+    키는 업로드 파일의 SHA-256과 처리 코드 버전(PROCESSING_VERSION)으로 구성되므로
+    같은 파일을 다시 처리할 때는 엑셀을 다시 읽지 않습니다.
+    항목 수와 전체 메모리 사용량이 한도를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_entries=32, max_bytes=256 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(file_bytes):
+        return hashlib.sha256(file_bytes).hexdigest(), PROCESSING_VERSION
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            data, _ = entry
+        return data.copy()
+
+    def put(self, key, data):
+        size = int(data.memory_usage(index=True, deep=True).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._total_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (data.copy(), size)
+            self._total_bytes += size
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def get_or_process(self, file_bytes, process):
+        """
+        캐시에 처리 결과가 있으면 복사본을 반환하고, 없으면 process(file_bytes)를 실행해 저장합니다.
+        """
+        key = self.make_key(file_bytes)
+        data = self.get(key)
+        if data is None:
+            data = process(file_bytes)
+            self.put(key, data)
+        return data
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+
+# 모든 세션이 공유하는 캐시 인스턴스
+processed_data_cache = ProcessedDataCache()
@@ -0,0 +1,134 @@
+"""
+결석신고서 명령줄 생성 도구
+
+Streamlit 페이지 없이 NEIS 출결 엑셀 파일에서 결석신고서(DOCX/PDF)를 만들어 폴더에 저장합니다.
+페이지와 같은 처리 함수(load_absence_data, build_absence_reports, build_absence_pdf_reports)를 사용합니다.
+
+    python -m app.absence_cli 1-3.xlsx 1-4.xlsx --output-dir out
+    python -m app.absence_cli exports.zip --teachers teachers.txt --format pdf --month 5 --output-dir out
+    python -m app.absence_cli export.xlsx --grade 1 --class 3 --teacher 홍길동 --output-dir out
+    python -m app.absence_cli exports/ --only-new --output-dir out   # 이전에 발급한 결석 기간은 제외
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from app.absence_batch import (
+    EXPORT_EXTENSIONS,
+    REPORT_FORMATS,
+    class_folder_name,
+    collect_export_files,
+    iter_class_sheets,
+    parse_teacher_names,
+    process_class_export,
+    run_batch,
+)
+from app.absence_summary import write_summary_workbook
+
+SUMMARY_FILE_NAME = "결석 요약.xlsx"
+
+
+def _read_inputs(paths):
+    """
+    파일/폴더 경로에서 (파일 이름, bytes) 목록을 만듭니다. 폴더는 엑셀/ZIP 파일만 포함하며,
+    폴더 안 파일의 이름은 "폴더 이름/파일 이름"입니다. (폴더 이름으로도 학년/반을 찾음)
+    """
+    uploads = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            uploads.extend(
+                (f"{path.resolve().name}/{p.name}", p.read_bytes())
+                for p in sorted(path.iterdir())
+                if p.is_file() and p.suffix.lower() in EXPORT_EXTENSIONS + (".zip",) and not p.name.startswith("~$")
+            )
+        else:
+            uploads.append((path.name, path.read_bytes()))
+    return collect_export_files(uploads)
+
+
+def write_results(results, output_dir):
+    """
+    처리 결과의 문서를 output_dir/학년 반/ 폴더에 저장합니다.
+
+    Returns:
+        list: 저장한 파일 경로 목록
+    """
+    written = []
+    for result in results:
+        if not result["documents"]:
+            continue
+        folder = Path(output_dir) / class_folder_name(result)
+        folder.mkdir(parents=True, exist_ok=True)
+        for output_name, document_bytes in result["documents"].items():
+            path = folder / output_name
+            path.write_bytes(document_bytes)
+            written.append(path)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="NEIS 출결 엑셀 파일로 결석신고서를 생성합니다.")
+    parser.add_argument("inputs", nargs="+", help="NEIS 출결 엑셀(xlsx/xls), ZIP 파일 또는 폴더")
+    parser.add_argument("--output-dir", "-o", required=True, help="결석신고서를 저장할 폴더")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="docx", help="파일 형식 (기본값: docx)")
+    parser.add_argument("--grade", type=int, choices=[1, 2, 3], help="학년 (입력 파일이 하나일 때 파일 이름 대신 사용)")
+    parser.add_argument("--class", dest="class_name", type=int, help="반 (입력 파일이 하나일 때 파일 이름 대신 사용)")
+    parser.add_argument("--teacher", default="", help="담임교사 성명 (--grade/--class와 함께 사용)")
+    parser.add_argument("--teachers", help='학급별 담임교사 목록 파일 (한 줄에 "1-3 홍길동")')
+    parser.add_argument("--month", type=int, help="파일 이름에 표시할 달 (기본값: 현재 달)")
+    parser.add_argument("--workers", type=int, help="동시에 처리할 프로세스 수 (기본값: CPU 수)")
+    parser.add_argument("--only-new", action="store_true", help="발급 기록에 없는(새로 생기거나 달라진) 결석 기간만 생성")
+    parser.add_argument("--index", help="발급 기록 색인 파일 경로 (기본값: data/absence_index.sqlite3)")
+    parser.add_argument("--summary", action="store_true", help=f"학급별 시트의 결석 요약 엑셀({SUMMARY_FILE_NAME})도 저장")
+    args = parser.parse_args(argv)
+
+    if (args.grade is None) != (args.class_name is None):
+        parser.error("--grade와 --class는 함께 지정해야 합니다.")
+    if args.class_name is not None and args.class_name < 1:
+        parser.error("--class는 1 이상의 숫자여야 합니다.")
+
+    files = _read_inputs(args.inputs)
+    if not files:
+        parser.error("처리할 엑셀 파일이 없습니다.")
+
+    if args.grade is not None:
+        if len(files) != 1:
+            parser.error("--grade/--class는 입력 파일이 하나일 때만 사용할 수 있습니다.")
+        class_info = (str(args.grade), str(args.class_name))
+        file_name, file_bytes = files[0]
+        results = [process_class_export(
+            file_name, file_bytes, {class_info: args.teacher}, args.month, args.format, class_info,
+            args.only_new, args.index
+        )]
+    else:
+        teacher_names = {}
+        if args.teachers:
+            teacher_names = parse_teacher_names(Path(args.teachers).read_text(encoding="utf-8"))
+        results = run_batch(files, teacher_names, args.month, args.workers, args.format, args.only_new, args.index)
+
+    written = write_results(results, args.output_dir)
+    if args.summary:
+        summary_path = Path(args.output_dir) / SUMMARY_FILE_NAME
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        write_summary_workbook(iter_class_sheets(results, files), summary_path)
+        written.append(summary_path)
+
+    failed = 0
+    for result in results:
+        if result["error"]:
+            failed += 1
+            print(f"[오류] {result['file_name']}: {result['error']}", file=sys.stderr)
+        else:
+            counts = ", ".join(f"{t} {n}건" for t, n in result["counts"].items())
+            issued = result.get("issued", 0)
+            if issued:
+                # --only-new로 빠진 결석이 있으면 결석이 없는 학급과 구분해 알림
+                counts = f"{counts or '새 결석 없음'} (이미 발급됨 {issued}건)"
+            counts = counts or "결석 없음"
+            print(f"{class_folder_name(result)} ({result['file_name']}): {counts}")
+    print(f"{len(written)}개 파일을 {args.output_dir}에 저장했습니다.")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
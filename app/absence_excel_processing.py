@@ -1,148 +1,300 @@
+import zipfile
+import numpy as np
 import pandas as pd
+import io
+import logging
 from datetime import datetime
+from openpyxl import load_workbook
+from app.instrumentation import log_stage
+from app.school_calendar import get_school_calendar
+
+logger = logging.getLogger(__name__)
+
+# 처리 결과가 달라지는 변경을 할 때마다 올려서 기존 캐시를 무효화합니다.
+PROCESSING_VERSION = "7"
+
+# 결석신고서 양식이 있는 출결구분
+REPORT_TYPES = ['출석인정결석', '질병결석', '기타결석']
+# 미인정결석은 결석신고서를 만들지 않지만 결석 통계(미인정 결석 기준)를 위해 함께 읽음
+UNEXCUSED_TYPE = '미인정결석'
+ABSENCE_TYPES = REPORT_TYPES + [UNEXCUSED_TYPE]  # '출석'은 제외
+SOURCE_COLUMNS = ['번호', '성명', '일자', '출결구분', '사유']
+RESULT_COLUMNS = ['번호', '성명', '일자', '출결구분', '사유', '결석시작일', '결석종료일', '결석일수']
+
+# 출결구분은 고정된 범주로 저장하고, 값의 종류가 적은 열도 범주형으로 저장해 메모리를 줄입니다.
+ATTENDANCE_TYPE_DTYPE = pd.CategoricalDtype(ABSENCE_TYPES)
+CATEGORY_COLUMNS = ['성명', '사유', '결석시작일', '결석종료일', '결석확인일']
+
+
+def _format_dates(dates):
+    """datetime64[D] 배열을 'YYYY.MM.DD' 문자열 배열로 변환합니다. (고유 날짜만 포맷)"""
+    unique_dates, inverse = np.unique(dates, return_inverse=True)
+    labels = np.array([str(d).replace('-', '.') for d in unique_dates], dtype=object)
+    return labels[inverse]
+
+
+def merge_consecutive_absences(filtered_data):
+    """
+    (번호, 출결구분)별로 연속된 날짜를 하나의 결석 기간으로 병합합니다.
+
+    정렬 한 번으로 전체 데이터를 훑어 날짜 차이가 1일이 아닌 곳마다 새 기간을 시작하고,
+    각 기간의 첫 행을 대표 행으로 사용합니다.
+    """
+    data = filtered_data.dropna(subset=['번호', '일자'])
+    if data.empty:
+        return pd.DataFrame(columns=RESULT_COLUMNS)
+
+    with log_stage(logger, "group") as stage:
+        data = data.assign(출결구분=data['출결구분'].astype(ATTENDANCE_TYPE_DTYPE))
+        # 범주형 출결구분은 ABSENCE_TYPES 순서(범주 코드)로 정렬됨
+        data = data.sort_values(['번호', '출결구분', '일자'], kind='mergesort')
+
+        numbers = data['번호'].to_numpy()
+        types = data['출결구분'].cat.codes.to_numpy()
+        dates = data['일자'].to_numpy(dtype='datetime64[D]')
+
+        # 학생/출결구분이 바뀌거나 날짜가 하루 넘게 벌어지면 새로운 기간 시작
+        is_start = np.ones(len(data), dtype=bool)
+        is_start[1:] = (
+            (numbers[1:] != numbers[:-1])
+            | (types[1:] != types[:-1])
+            | (np.diff(dates).astype(np.int64) != 1)
+        )
+        start_pos = np.flatnonzero(is_start)
+        end_pos = np.append(start_pos[1:] - 1, len(data) - 1)
+        stage['rows'] = len(data)
+        stage['runs'] = len(start_pos)
+
+    with log_stage(logger, "merge") as stage:
+        start_dates = dates[start_pos]
+        end_dates = dates[end_pos]
+        start_text = _format_dates(start_dates)
+        end_text = _format_dates(end_dates)
+
+        processed_data = data.iloc[start_pos].copy()
+        processed_data['결석시작일'] = start_text
+        processed_data['결석종료일'] = end_text
+        processed_data['결석일수'] = (end_dates - start_dates).astype(np.int64) + 1
+        processed_data['일자'] = np.where(
+            start_dates == end_dates,
+            start_text,
+            start_text + ' ~ ' + end_text
+        )
+        # NaN 사유를 '사유입력'으로 대체
+        processed_data['사유'] = processed_data['사유'].fillna('사유입력')
+        stage['rows'] = len(processed_data)
+
+    return processed_data[RESULT_COLUMNS]
+
+
+def _normalize_attendance_type(value):
+    """
+    출결구분 값 하나를 정규화합니다.
+    ('질병' + '결석'은 '질병결석', '미인정' 또는 예전 표기 '무단' + '결석'은 '미인정결석', 그 밖에는 앞뒤 공백 제거)
+    """
+    text = str(value)
+    if '결석' in text:
+        if '질병' in text:
+            return '질병결석'
+        if '미인정' in text or '무단' in text:
+            return UNEXCUSED_TYPE
+    return text.strip()
+
+
+def normalize_attendance_types(values):
+    """출결구분 Series를 정규화합니다. (값마다 _normalize_attendance_type과 같은 규칙)"""
+    return values.astype(str).map(_normalize_attendance_type)
+
+
+def normalize_reasons(values):
+    """사유 Series에서 '(으)로 인한' 뒷부분을 제거합니다. 빈 사유는 None으로 유지합니다."""
+    text = values.astype(str)
+    has_euro = text.str.contains('으로 인한', regex=False)
+    result = text.str.replace(r'(?s)로 인한.*', '', n=1, regex=True)
+    result = result.mask(has_euro, text.str.replace(r'(?s)으로 인한.*', '', n=1, regex=True))
+    return result.astype(object).where(values.notna(), None)
+
+
+def _normalize_unique(values, normalize):
+    """고유값에만 normalize를 적용한 뒤 원래 위치로 펼칩니다. (결측값은 None)"""
+    codes, uniques = pd.factorize(values)
+    normalized = normalize(pd.Series(uniques, dtype=object)).to_numpy(dtype=object)
+    result = np.append(normalized, None)[codes]  # 코드 -1(결측값)은 마지막 None을 가리킴
+    return pd.Series(result, index=values.index, dtype=object)
+
+
+def _is_xlsx(file_path):
+    """xlsx(zip) 형식인지 확인합니다. 파일 객체인 경우 읽기 위치를 되돌려 놓습니다."""
+    if hasattr(file_path, 'seek'):
+        file_path.seek(0)
+        result = zipfile.is_zipfile(file_path)
+        file_path.seek(0)
+        return result
+    return zipfile.is_zipfile(file_path)
+
+
+def iter_absence_rows(file_path, sheet_index=0):
+    """
+    NEIS 출결 엑셀(xlsx)을 읽기 전용 모드로 한 행씩 읽으며 결석 행만 반환합니다.
+
+    병합된 번호/성명 셀은 읽는 동안 앞의 값으로 채우고, 결석(ABSENCE_TYPES)이
+    아닌 행은 바로 버리므로 시트 전체를 메모리에 올리지 않습니다.
+
+    Yields:
+        tuple: (번호, 성명, 일자, 출결구분, 원본 사유)
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[sheet_index].iter_rows(values_only=True)
+        header = [str(cell).strip() if cell is not None else '' for cell in next(rows, ())]
+        missing = [column for column in SOURCE_COLUMNS if column not in header]
+        if missing:
+            raise ValueError(f"엑셀 파일에 필요한 열이 없습니다: {', '.join(missing)}")
+        number_pos, name_pos, date_pos, type_pos, reason_pos = (header.index(column) for column in SOURCE_COLUMNS)
+
+        number = name = None
+        type_cache = {}
+        for row in rows:
+            if len(row) <= max(number_pos, name_pos, date_pos, type_pos, reason_pos):
+                row = tuple(row) + (None,) * (len(header) - len(row))
+
+            # 병합 셀 해제 (번호, 성명)
+            if row[number_pos] is not None:
+                number = row[number_pos]
+            if row[name_pos] is not None:
+                name = row[name_pos]
+
+            raw_type = row[type_pos]
+            attendance_type = type_cache.get(raw_type)
+            if attendance_type is None:
+                attendance_type = type_cache[raw_type] = _normalize_attendance_type(raw_type)
+            if attendance_type not in ABSENCE_TYPES:
+                continue
+
+            date_value = row[date_pos]
+            if isinstance(date_value, str):
+                date_value = date_value.strip().strip('.')
+
+            yield number, name, date_value, attendance_type, row[reason_pos]
+    finally:
+        workbook.close()
+
+
+def read_absence_rows(file_path):
+    """
+    엑셀 파일에서 결석 행(번호, 성명, 일자, 출결구분, 사유)만 읽어 DataFrame으로 반환합니다.
+
+    xlsx 파일은 iter_absence_rows로 스트리밍하고, 그 밖의 형식(xls 등)은 pandas로 읽습니다.
+    """
+    if _is_xlsx(file_path):
+        # 스트리밍 읽기 중에 병합 해제, 출결구분 정규화, 결석 행 필터링이 함께 이루어짐
+        with log_stage(logger, "read+filter") as stage:
+            df = pd.DataFrame.from_records(iter_absence_rows(file_path), columns=SOURCE_COLUMNS)
+            stage['rows'] = len(df)
+        with log_stage(logger, "normalize") as stage:
+            df['출결구분'] = df['출결구분'].astype(ATTENDANCE_TYPE_DTYPE)
+            df['사유'] = _normalize_unique(df['사유'], normalize_reasons)
+            stage['rows'] = len(df)
+        return df
+
+    with log_stage(logger, "read") as stage:
+        # Load the Excel file with explicit header definition
+        df = pd.read_excel(
+            file_path,
+            sheet_name=0,
+            header=0
+        )
+        stage['rows'] = len(df)
+
+    with log_stage(logger, "normalize") as stage:
+        # Step 1: Unmerge B, C columns (columns '번호', '성명')
+        df[['번호', '성명']] = df[['번호', '성명']].ffill()
+
+        # Step 2: 출결구분, 일자 데이터 전처리
+        df['출결구분'] = _normalize_unique(df['출결구분'].astype(str), normalize_attendance_types)
+        df['일자'] = df['일자'].astype(str).str.strip().str.strip('.')
+        stage['rows'] = len(df)
+
+    with log_stage(logger, "filter") as stage:
+        df = df.loc[df['출결구분'].isin(ABSENCE_TYPES), SOURCE_COLUMNS].copy()
+        df['출결구분'] = df['출결구분'].astype(ATTENDANCE_TYPE_DTYPE)
+        df['사유'] = _normalize_unique(df['사유'], normalize_reasons)
+        stage['rows'] = len(df)
+    return df
+
 
 def process_excel(file_path):
-    # Load the Excel file with explicit header definition
-    df = pd.read_excel(
-        file_path, 
-        sheet_name=0, 
-        header=0
-    )
-
-    print("1. 원본 데이터의 출결구분 값들:", df['출결구분'].unique())
-
-    # Step 1: Unmerge B, C columns (columns '번호', '성명')
-    df[['번호', '성명']] = df[['번호', '성명']].ffill()
-
-    # Step 2: 출결구분 데이터 전처리 및 필터링
-    print("2-1. 변환 전 출결구분 값들:", df['출결구분'].unique())
-    df['출결구분'] = df['출결구분'].astype(str).apply(
-        lambda x: '질병결석' if ('질병' in x and '결석' in x) else 
-                 '출석인정결석' if x.strip() == '출석인정결석' else 
-                 '출석' if x.strip() == '출석' else
-                 '기타결석' if x.strip() == '기타결석' else x.strip()
-    )
-    
-    # 사유 열 전처리
-    df['사유'] = df['사유'].astype(str).apply(
-        lambda x: x.split('으로 인한')[0] if '으로 인한' in x else
-                 x.split('로 인한')[0] if '로 인한' in x else
-                 x
-    )
-    
-    print("2-2. 변환 후 출결구분 값들:", df['출결구분'].unique())
-    
-    # Step 3: Filter valid data rows
-    valid_types = ['출석인정결석', '질병결석', '기타결석']  # '출석'은 제외
-    filtered_data = df[df['출결구분'].isin(valid_types)].copy()
-    
-    print("3. 필터링 후 출결구분 값들:", filtered_data['출결구분'].unique())
-    print("4. 필터링 후 데이터 건수:", len(filtered_data))
+    # file_path에는 파일 경로 또는 BytesIO 같은 파일 객체를 전달할 수 있습니다.
+    # Step 1-3: 결석 행만 읽기 (번호/성명 병합 해제, 출결구분/사유 정규화, 출석 등 제외)
+    filtered_data = read_absence_rows(file_path)
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("출결구분별 건수: %s", filtered_data['출결구분'].value_counts().to_dict())
 
     if filtered_data.empty:
-        print("경고: 필터링 후 데이터가 비어있습니다!")
-        return pd.DataFrame(columns=['번호', '성명', '일자', '출결구분', '사유', '결석시작일', '결석종료일', '결석일수'])
+        logger.info("필터링 후 결석 데이터가 없습니다")
+        return pd.DataFrame(columns=RESULT_COLUMNS)
 
     # Step 4: Convert '일자' column to datetime format
-    filtered_data['일자'] = pd.to_datetime(
-        filtered_data['일자'].str.strip('.'),
-        format='%Y.%m.%d',
-        errors='coerce'
-    )
-    
-    print("5. 날짜 변환 후 데이터 건수:", len(filtered_data))
-
-    # Step 5: Add new columns
-    filtered_data['결석시작일'] = None
-    filtered_data['결석종료일'] = None
-    filtered_data['결석일수'] = None
-
-    # Step 6: Group by columns and process
-    group_columns = ['번호', '출결구분']  # '사유' 컬럼 제외
-    merged_rows = []
-
-    # 그룹화 전 데이터 확인
-    print("\n질병결석 데이터 확인:")
-    sick_data = filtered_data[filtered_data['출결구분'] == '질병결석']
-    print(sick_data[['번호', '출결구분', '사유', '일자']].to_string())
-    
-    for name, group_data in filtered_data.groupby(group_columns):
-        print(f"\n6. 처리 중인 그룹: {name}")
-        print(f"   - 출결구분: {name[1]}")
-        print(f"   - 데이터 건수: {len(group_data)}")
-        print(f"   - 날짜 데이터: {group_data['일자'].tolist()}")
-        
-        group_data = group_data.sort_values('일자')
-        dates = group_data['일자'].dropna().tolist()
-        
-        if not dates:
-            print(f"   - 그룹 {name}에 유효한 날짜가 없습니다")
-            continue
-            
-        # 연속된 날짜 그룹 찾기
-        current_group = []
-        current_group.append(dates[0])
-        
-        for i in range(1, len(dates)):
-            if (dates[i] - dates[i-1]).days == 1:
-                current_group.append(dates[i])
-            else:
-                # 현재 그룹 처리
-                if current_group:
-                    start_date = current_group[0]
-                    end_date = current_group[-1]
-                    
-                    base_row = group_data[group_data['일자'] == start_date].iloc[0].copy()
-                    base_row['결석시작일'] = start_date.strftime('%Y.%m.%d')
-                    base_row['결석종료일'] = end_date.strftime('%Y.%m.%d')
-                    
-                    days_diff = (end_date - start_date).days + 1
-                    base_row['결석일수'] = days_diff
-                    
-                    if start_date != end_date:
-                        base_row['일자'] = f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}"
-                    else:
-                        base_row['일자'] = start_date.strftime('%Y.%m.%d')
-                    
-                    # NaN 사유를 '사유입력'으로 대체
-                    if pd.isna(base_row['사유']):
-                        base_row['사유'] = '사유입력'
-                    
-                    merged_rows.append(base_row)
-                
-                current_group = [dates[i]]
-        
-        # 마지막 그룹 처리
-        if current_group:
-            start_date = current_group[0]
-            end_date = current_group[-1]
-            
-            base_row = group_data[group_data['일자'] == start_date].iloc[0].copy()
-            base_row['결석시작일'] = start_date.strftime('%Y.%m.%d')
-            base_row['결석종료일'] = end_date.strftime('%Y.%m.%d')
-            
-            days_diff = (end_date - start_date).days + 1
-            base_row['결석일수'] = days_diff
-            
-            if start_date != end_date:
-                base_row['일자'] = f"{start_date.strftime('%Y.%m.%d')} ~ {end_date.strftime('%Y.%m.%d')}"
-            else:
-                base_row['일자'] = start_date.strftime('%Y.%m.%d')
-            
-            # NaN 사유를 '사유입력'으로 대체
-            if pd.isna(base_row['사유']):
-                base_row['사유'] = '사유입력'
-            
-            merged_rows.append(base_row)
-
-    # Create final DataFrame
-    columns_order = ['번호', '성명', '일자', '출결구분', '사유', '결석시작일', '결석종료일', '결석일수']
-    if merged_rows:
-        processed_data = pd.DataFrame(merged_rows)
-        processed_data = processed_data[columns_order]
-        print("7. 최종 처리된 데이터 건수:", len(processed_data))
-    else:
-        print("7. 처리된 데이터가 없습니다")
-        processed_data = pd.DataFrame(columns=columns_order)
+    with log_stage(logger, "parse dates") as stage:
+        filtered_data['일자'] = pd.to_datetime(
+            filtered_data['일자'],
+            format='%Y.%m.%d',
+            errors='coerce'
+        )
+        stage['rows'] = len(filtered_data)
 
+    # Step 5: 연속된 날짜를 하나의 결석 기간으로 병합
+    processed_data = merge_consecutive_absences(filtered_data)
+
+    logger.info("결석 기간 %d건 처리 (원본 결석 %d행)", len(processed_data), len(filtered_data))
     return processed_data
+
+
+def calculate_confirmation_dates(end_dates):
+    """
+    결석종료일 열 전체에 대해 결석확인일(종료일 다음 첫 수업일, 공휴일/학교 휴업일 제외)을 한 번에 계산합니다.
+
+    Args:
+        end_dates (Series): 'YYYY.MM.DD' 또는 'YYYY-MM-DD' 형식의 결석종료일
+
+    Returns:
+        Series: 'YYYY.MM.DD' 형식의 결석확인일 (날짜를 읽을 수 없으면 오늘 날짜)
+    """
+    parsed = pd.to_datetime(end_dates, format='%Y.%m.%d', errors='coerce')
+    parsed = parsed.fillna(pd.to_datetime(end_dates, format='%Y-%m-%d', errors='coerce'))
+
+    result = pd.Series(datetime.now().strftime('%Y.%m.%d'), index=end_dates.index, dtype=object)
+    valid = parsed.notna().to_numpy()
+    if valid.any():
+        days = parsed.to_numpy(dtype='datetime64[D]')[valid]
+        calendar = get_school_calendar(days.min().item(), days.max().item())
+        result[valid] = _format_dates(calendar.next_school_days(days + 1))
+    return result
+
+
+def load_absence_data(file_bytes):
+    """업로드된 엑셀 파일을 처리하고 결석확인일을 계산합니다."""
+    data = process_excel(io.BytesIO(file_bytes))
+
+    # 출결구분 필터링 추가 - 질병결석, 출석인정결석, 기타결석, 미인정결석만 유지
+    data = data[data['출결구분'].isin(ABSENCE_TYPES)].copy()
+
+    # 각 학생의 결석종료일에 따라 결석확인일 자동 계산
+    data['결석확인일'] = calculate_confirmation_dates(data['결석종료일'])
+    return to_compact_dtypes(data)
+
+
+def report_rows(data):
+    """결석신고서를 만드는 출결구분(REPORT_TYPES)의 행만 반환합니다. (미인정결석 제외)"""
+    return data[data['출결구분'].isin(REPORT_TYPES)]
+
+
+def to_compact_dtypes(data):
+    """출결구분은 고정 범주형으로, 값의 종류가 적은 문자열 열은 범주형으로 변환합니다."""
+    data = data.copy()
+    data['출결구분'] = data['출결구분'].astype(ATTENDANCE_TYPE_DTYPE)
+    for column in CATEGORY_COLUMNS:
+        if column in data.columns:
+            data[column] = data[column].astype('category')
+    return data
@@ -0,0 +1,140 @@
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+INDEX_PATH_ENV = "HANOL_ABSENCE_INDEX"
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent.absolute() / "data" / "absence_index.sqlite3"
+
+# 결석 기간 상태
+STATUS_NEW = "신규"        # 발급 기록이 없는 결석 기간
+STATUS_CHANGED = "변경"    # 발급한 기간과 겹치지만 기간 또는 사유가 달라진 결석 기간
+STATUS_ISSUED = "발급됨"   # 같은 기간, 같은 사유로 이미 발급한 결석 기간
+
+KEY_COLUMNS = ["number", "name", "attendance_type", "start_date", "end_date"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS issued_runs (
+    grade TEXT NOT NULL,
+    class_name TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    attendance_type TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    reason TEXT,
+    days INTEGER,
+    issued_at TEXT NOT NULL,
+    PRIMARY KEY (grade, class_name, number, name, attendance_type, start_date, end_date)
+)
+"""
+
+
+def _run_keys(data):
+    """결석 데이터(process_excel 결과)를 색인 열 이름의 DataFrame으로 변환합니다."""
+    return pd.DataFrame({
+        "number": data['번호'].astype(int),
+        "name": data['성명'].astype(str),
+        "attendance_type": data['출결구분'].astype(str),
+        "start_date": data['결석시작일'].astype(str),
+        "end_date": data['결석종료일'].astype(str),
+        "reason": data['사유'].astype(str),
+        "days": data['결석일수'].astype(int),
+    }, index=data.index)
+
+
+class IssuedReportIndex:
+    """
+    결석신고서를 이미 발급한 결석 기간을 기록하는 로컬 SQLite 색인.
+
+    키는 (학년, 반, 번호, 성명, 출결구분, 결석시작일, 결석종료일)이며, 누적 NEIS 파일을 다시
+    올렸을 때 새로 생기거나 달라진 결석 기간만 골라 신고서를 만들 수 있게 합니다.
+    """
+
+    def __init__(self, path=None):
+        self.path = Path(path or os.environ.get(INDEX_PATH_ENV) or DEFAULT_INDEX_PATH)
+        self._initialized = False
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            with self._lock:
+                connection.execute(SCHEMA)
+                connection.commit()
+                self._initialized = True
+        return connection
+
+    def issued_runs(self, grade, class_name):
+        """학급의 발급 기록을 DataFrame으로 반환합니다."""
+        if not self.path.exists():
+            return pd.DataFrame(columns=KEY_COLUMNS + ["reason"])
+        with closing(self._connect()) as connection:
+            return pd.read_sql_query(
+                "SELECT number, name, attendance_type, start_date, end_date, reason "
+                "FROM issued_runs WHERE grade = ? AND class_name = ?",
+                connection,
+                params=(str(grade), str(class_name)),
+            )
+
+    def run_status(self, data, grade, class_name):
+        """
+        결석 기간별 발급 상태(신규/변경/발급됨)를 계산합니다.
+
+        Returns:
+            Series: data와 같은 인덱스의 상태 문자열
+        """
+        status = pd.Series(STATUS_NEW, index=data.index, dtype=object)
+        if data.empty:
+            return status
+        issued = self.issued_runs(grade, class_name)
+        if issued.empty:
+            return status
+
+        runs = _run_keys(data).reset_index(names="row")
+        candidates = runs.merge(
+            issued, on=["number", "name", "attendance_type"], suffixes=("", "_issued")
+        )
+        # 'YYYY.MM.DD' 문자열은 사전순 비교가 날짜 비교와 같음
+        overlaps = candidates[
+            (candidates["start_date"] <= candidates["end_date_issued"])
+            & (candidates["end_date"] >= candidates["start_date_issued"])
+        ]
+        same = overlaps[
+            (overlaps["start_date"] == overlaps["start_date_issued"])
+            & (overlaps["end_date"] == overlaps["end_date_issued"])
+            & (overlaps["reason"] == overlaps["reason_issued"])
+        ]
+        status[overlaps["row"].unique()] = STATUS_CHANGED
+        status[same["row"].unique()] = STATUS_ISSUED
+        return status
+
+    def new_runs(self, data, grade, class_name):
+        """발급하지 않았거나 달라진 결석 기간만 반환합니다."""
+        return data[self.run_status(data, grade, class_name) != STATUS_ISSUED]
+
+    def record(self, data, grade, class_name):
+        """결석신고서를 만든 결석 기간을 발급 기록에 추가합니다. (같은 키는 사유/발급 시각 갱신)"""
+        if data.empty:
+            return
+        issued_at = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (str(grade), str(class_name), *row, issued_at)
+            for row in _run_keys(data)[KEY_COLUMNS + ["reason", "days"]].itertuples(index=False, name=None)
+        ]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as connection, connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO issued_runs "
+                "(grade, class_name, number, name, attendance_type, start_date, end_date, reason, days, issued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+
+
+# 모든 세션이 공유하는 발급 기록 색인
+issued_report_index = IssuedReportIndex()
@@ -0,0 +1,218 @@
+import io
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.pdfgen import canvas
+
+from app.absence_report import build_replacements, report_file_name
+from app.font_registry import font_registry
+
+# TTF를 찾지 못했을 때 사용하는 Adobe 한글 CID 폰트 (PDF에 포함되지 않음)
+FALLBACK_CID_FONT = "HYGothic-Medium"
+
+# 출결구분별 양식 (제목에 들어갈 구분, 하단 안내문)
+PDF_LAYOUTS = {
+    "출석인정결석": {
+        "label": "출석인정",
+        "form_name": "AbsenceFormExcused",
+        "notes": [
+            "출석 인정 결석에 해당 하는 경우",
+            "1. 천재지변 또는 법정 감염병, 공적의무(병역관계 등) 또는 공권력의 행사",
+            "2. 학교장의 허가를 받은 ‘학교ㆍ시도(교육청)ㆍ국가를 대표한 대회 및 훈련 참가, 산업체 실습과정(현장실습, "
+            "현장실습과 연계한 취업), 교환학습, 교외체험학습, 「학교보건법」 제8조에 따른 등교중지’ 등으로 출석하지 못한 경우",
+            "3. 「초ㆍ중등교육법 시행령」 제31조제1항에 따른 학교 내의 봉사, 사회봉사, 특별교육이수 기간",
+            "4. 「초ㆍ중등교육법」제28조제6항에 따른 상담, 진로 프로그램 등 숙려제 참여 인정 기간",
+            "5. 경조사",
+            "6. 기타 부득이한 사유로 학교장의 허가를 받은 경우",
+            "7.「학교폭력예방 및 대책에 관한 법률」 제12조에 따른 학교폭력대책심의위원회의 개최 및 동 위원회의 학교폭력 "
+            "피해학생에 대한 보호조치 요청 이전에, 학교폭력 피해자가 학교폭력으로 인한 피해로 출석하지 못하였음을 같은 법 "
+            "제14조제3항에 따른 학교폭력 전담기구의 조사 및 확인을 거쳐 학교의 장이 인정한 경우",
+            "8. 경찰청 「소년업무규칙」 제31조부터 제33조에 따른 경찰청관서의 선도프로그램에 참여하는 경우",
+        ],
+    },
+    "질병결석": {
+        "label": "질병",
+        "form_name": "AbsenceFormSick",
+        "notes": [
+            "질병 결석에 해당 하는 경우",
+            "1. 결석한 날부터 5일 이내에 의사의 진단서 또는 의견서(의사 소견서, 진료 확인서 등으로 병명, 진료기간 등이 "
+            "기록된 증빙서류)를 첨부한 결석계를 제출하여 학교장의 승인을 받은 경우",
+            "2. 다만, 상습적이지 않은 2일 이내의 결석은 질병으로 인한 결석임을 증명할 수 있는 자료(학부모 의견서, 처방전, "
+            "담임교사 확인서 등)가 첨부된 결석계를 5일 이내에 제출하여 학교장의 승인을 받은 경우",
+        ],
+    },
+    "기타결석": {
+        "label": "기타",
+        "form_name": "AbsenceFormOther",
+        "notes": [
+            "기타 결석에 해당하는 경우",
+            "1. 부모⋅가족 봉양, 가사 조력, 간병 등 부득이한 개인 사정에 의한 결석임을 학교장이 인정하는 경우",
+            "2. 기타 합당한 사유에 의한 결석임을 학교장이 인정하는 경우",
+        ],
+    },
+}
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGIN = 20 * mm
+CONTENT_WIDTH = PAGE_WIDTH - 2 * MARGIN
+
+_registered_fonts = None
+
+
+def register_fonts():
+    """
+    한글 폰트를 reportlab에 한 번만 등록하고 (본문 폰트 이름, 굵은 폰트 이름)을 반환합니다.
+
+    TTF는 PDF에 포함될 때 사용된 글자만 서브셋으로 들어갑니다.
+    """
+    global _registered_fonts
+    if _registered_fonts is not None:
+        return _registered_fonts
+
+    # 한글 TTF는 폰트 레지스트리에서 찾은 경로를 사용 (dotum_bold가 없으면 dotum 경로가 반환됨)
+    regular_path = font_registry.resolve("dotum")
+    if regular_path is None:
+        pdfmetrics.registerFont(UnicodeCIDFont(FALLBACK_CID_FONT))
+        _registered_fonts = (FALLBACK_CID_FONT, FALLBACK_CID_FONT)
+        return _registered_fonts
+
+    pdfmetrics.registerFont(TTFont("AbsenceRegular", regular_path))
+    bold_path = font_registry.resolve("dotum_bold")
+    if bold_path != regular_path:
+        pdfmetrics.registerFont(TTFont("AbsenceBold", bold_path))
+        _registered_fonts = ("AbsenceRegular", "AbsenceBold")
+    else:
+        _registered_fonts = ("AbsenceRegular", "AbsenceRegular")
+    return _registered_fonts
+
+
+def wrap_pdf_text(text, font_name, font_size, max_width):
+    """글자 폭을 누적해 최대 너비에 맞게 줄을 나눕니다. (한 번의 선형 순회)"""
+    lines = []
+    current = []
+    width = 0.0
+    for char in text:
+        char_width = pdfmetrics.stringWidth(char, font_name, font_size)
+        if current and width + char_width > max_width:
+            lines.append("".join(current).rstrip())
+            current = [] if char == " " else [char]
+            width = 0.0 if char == " " else char_width
+        else:
+            current.append(char)
+            width += char_width
+    if current:
+        lines.append("".join(current))
+    return lines
+
+
+def _draw_static_form(pdf, attendance_type, fonts):
+    """모든 페이지에 공통인 양식 부분을 PDF Form XObject로 한 번만 그립니다."""
+    regular, bold = fonts
+    layout = PDF_LAYOUTS[attendance_type]
+
+    pdf.beginForm(layout["form_name"])
+    pdf.setLineWidth(1)
+    pdf.rect(MARGIN, MARGIN, CONTENT_WIDTH, PAGE_HEIGHT - 2 * MARGIN)
+
+    pdf.setFont(bold, 24)
+    pdf.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT - 45 * mm, f"결 석 신 고 서 ({layout['label']})")
+
+    pdf.setFont(regular, 13)
+    right = PAGE_WIDTH - MARGIN - 10 * mm
+    pdf.drawRightString(right, PAGE_HEIGHT - 145 * mm, "학 생 : _______________ (인 또는 서명)")
+    pdf.drawRightString(right, PAGE_HEIGHT - 157 * mm, "보호자 : _______________ (인 또는 서명)")
+
+    pdf.line(MARGIN, PAGE_HEIGHT - 170 * mm, PAGE_WIDTH - MARGIN, PAGE_HEIGHT - 170 * mm)
+    pdf.setFont(bold, 18)
+    pdf.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT - 183 * mm, "확 인 서")
+    pdf.setFont(regular, 13)
+    pdf.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT - 196 * mm, "위 내용을 확인하였으며, 사실과 다름없습니다.")
+
+    pdf.setFont(bold, 16)
+    pdf.drawString(MARGIN + 10 * mm, PAGE_HEIGHT - 228 * mm, "한올고등학교장 귀하")
+
+    # 하단 안내문
+    pdf.line(MARGIN, PAGE_HEIGHT - 236 * mm, PAGE_WIDTH - MARGIN, PAGE_HEIGHT - 236 * mm)
+    note_size = 8
+    y = PAGE_HEIGHT - 242 * mm
+    for i, note in enumerate(layout["notes"]):
+        font = bold if i == 0 else regular
+        pdf.setFont(font, note_size)
+        for line in wrap_pdf_text(note, font, note_size, CONTENT_WIDTH - 10 * mm):
+            pdf.drawString(MARGIN + 5 * mm, y, line)
+            y -= note_size * 1.4
+    pdf.endForm()
+
+
+def _draw_record(pdf, values, fonts):
+    """학생 한 명의 입력값을 그립니다."""
+    regular, _ = fonts
+    right = PAGE_WIDTH - MARGIN - 10 * mm
+
+    pdf.setFont(regular, 14)
+    pdf.drawRightString(
+        right, PAGE_HEIGHT - 62 * mm,
+        f"학 년 :   제 {values['{1}']}학년 {values['{2}']}반 {values['{3}']}번"
+    )
+    pdf.drawRightString(right, PAGE_HEIGHT - 72 * mm, f"성 명 :   {values['{성명}']}")
+
+    sentence = (
+        f"위 학생은 {values['{결석사유}']}(으)로 인하여 {values['{결석시작일}']}부터 "
+        f"{values['{결석종료일}']}까지 {values['{결석일수}']}일간 결석하였기에 "
+        "보호자 연서로 이 결석계를 제출합니다."
+    )
+    y = PAGE_HEIGHT - 92 * mm
+    for line in wrap_pdf_text(sentence, regular, 14, CONTENT_WIDTH - 20 * mm):
+        pdf.drawString(MARGIN + 10 * mm, y, line)
+        y -= 14 * 1.8
+
+    pdf.setFont(regular, 13)
+    pdf.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT - 130 * mm, values['{결석확인일}'])
+    pdf.drawCentredString(PAGE_WIDTH / 2, PAGE_HEIGHT - 206 * mm, values['{결석확인일}'])
+    pdf.drawRightString(right, PAGE_HEIGHT - 218 * mm, f"담임교사 : {values['{담임교사 성명}']} (인)")
+
+
+def build_absence_pdf(rows, attendance_type, grade, class_name, teacher_name):
+    """
+    같은 출결구분의 결석신고서를 한 장씩 그려 하나의 PDF(bytes)로 만듭니다.
+
+    양식의 고정된 부분은 Form XObject로 한 번만 기록하고 페이지마다 참조하므로,
+    페이지 수가 많아도 학생별 입력값만 추가됩니다.
+    """
+    fonts = register_fonts()
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=A4, pageCompression=1)
+    pdf.setTitle(f"{grade}학년 {class_name}반 {attendance_type} 결석신고서")
+
+    _draw_static_form(pdf, attendance_type, fonts)
+    form_name = PDF_LAYOUTS[attendance_type]["form_name"]
+
+    for data_row in rows.to_dict('records'):
+        pdf.doForm(form_name)
+        _draw_record(pdf, build_replacements(data_row, grade, class_name, teacher_name), fonts)
+        pdf.showPage()
+
+    pdf.save()
+    return buffer.getvalue()
+
+
+def build_absence_pdf_reports(data, grade, class_name, teacher_name, month=None):
+    """
+    출결구분별 PDF 결석신고서를 만듭니다.
+
+    Returns:
+        dict: {출결구분: (파일 이름, PDF bytes)} - build_absence_reports와 같은 형식
+    """
+    reports = {}
+    for attendance_type in PDF_LAYOUTS:
+        type_data = data[data['출결구분'] == attendance_type]
+        if type_data.empty:
+            continue
+        reports[attendance_type] = (
+            report_file_name(grade, class_name, attendance_type, month, extension="pdf"),
+            build_absence_pdf(type_data, attendance_type, grade, class_name, teacher_name)
+        )
+    return reports
@@ -0,0 +1,107 @@
+import io
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from datetime import datetime
+from app.docx_template import get_compiled_template
+
+# 템플릿 디렉토리 경로 설정
+TEMPLATE_DIR = Path(__file__).parent.parent.absolute() / "templates"
+
+# 템플릿 파일 경로 설정
+TEMPLATE_FILES = {
+    "출석인정결석": TEMPLATE_DIR / "출석인정 결석계 템플릿.docx",
+    "질병결석": TEMPLATE_DIR / "질병결석계 템플릿.docx",
+    "기타결석": TEMPLATE_DIR / "기타결석계 템플릿.docx",
+}
+
+
+def build_replacements(data_row, grade, class_name, teacher_name):
+    """학생 한 명의 결석 정보로 템플릿 치환값을 만듭니다."""
+    return {
+        "{1}": str(grade),
+        "{2}": str(class_name),
+        "{3}": str(int(data_row['번호'])),
+        "{성명}": str(data_row['성명']),
+        "{결석사유}": str(data_row['사유']),
+        "{결석시작일}": str(data_row['결석시작일']),
+        "{결석종료일}": str(data_row['결석종료일']),
+        "{결석일수}": str(data_row['결석일수']),
+        "{결석확인일}": str(data_row['결석확인일']),
+        "{담임교사 성명}": str(teacher_name)
+    }
+
+
+def build_absence_docx(template_path, rows, grade, class_name, teacher_name):
+    """
+    선택된 학생들의 결석신고서를 하나의 문서로 합쳐 반환합니다.
+
+    템플릿은 get_compiled_template으로 한 번만 파싱되고, 학생마다 본문 XML만 새로 찍어냅니다.
+
+    Args:
+        template_path: 출결구분에 맞는 템플릿 파일 경로
+        rows (DataFrame): 같은 출결구분의 결석 데이터
+        grade, class_name, teacher_name: 학년, 반, 담임교사 성명
+
+    Returns:
+        Document: 통합된 결석신고서 문서
+    """
+    template = get_compiled_template(template_path)
+    return template.render(
+        build_replacements(data_row, grade, class_name, teacher_name)
+        for data_row in rows.to_dict('records')
+    )
+
+
+def report_file_name(grade, class_name, attendance_type, month=None, extension="docx"):
+    """다운로드 파일 이름 (예: 1학년 3반 질병결석 결석신고서(5월).docx)"""
+    if month is None:
+        month = datetime.now().month
+    return f"{grade}학년 {class_name}반 {attendance_type} 결석신고서({month}월).{extension}"
+
+
+def _render_docx_bytes(template_path, rows, grade, class_name, teacher_name):
+    buffer = io.BytesIO()
+    build_absence_docx(template_path, rows, grade, class_name, teacher_name).save(buffer)
+    return buffer.getvalue()
+
+
+def build_absence_reports(data, grade, class_name, teacher_name, month=None, max_workers=None):
+    """
+    출결구분별 통합 결석신고서를 작업 풀에서 동시에 만들어 메모리(BytesIO)에 저장합니다.
+
+    Args:
+        data (DataFrame): 결석 데이터 (여러 출결구분 포함 가능)
+        grade, class_name, teacher_name: 학년, 반, 담임교사 성명
+        month (int): 파일 이름에 표시할 달 (기본값: 현재 달)
+        max_workers (int): 작업 스레드 수 (기본값: 출결구분 수)
+
+    Returns:
+        dict: {출결구분: (파일 이름, DOCX bytes)} - TEMPLATE_FILES 순서
+    """
+    jobs = []
+    for attendance_type, template_path in TEMPLATE_FILES.items():
+        type_data = data[data['출결구분'] == attendance_type]
+        if not type_data.empty:
+            jobs.append((attendance_type, template_path, type_data))
+    if not jobs:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(jobs)) as executor:
+        futures = {
+            attendance_type: executor.submit(_render_docx_bytes, template_path, type_data, grade, class_name, teacher_name)
+            for attendance_type, template_path, type_data in jobs
+        }
+        return {
+            attendance_type: (report_file_name(grade, class_name, attendance_type, month), future.result())
+            for attendance_type, future in futures.items()
+        }
+
+
+def build_reports_zip(reports):
+    """build_absence_reports 결과를 하나의 ZIP 파일(bytes)로 묶습니다."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file_name, document_bytes in reports.values():
+            archive.writestr(file_name, document_bytes)
+    return buffer.getvalue()
@@ -0,0 +1,86 @@
+import math
+
+import pandas as pd
+
+# 선택 표에 보내는 열 (브라우저로는 현재 페이지의 이 열들만 전송)
+DISPLAY_COLUMNS = ['번호', '성명', '일자', '사유', '결석일수', '결석확인일', '발급상태']
+PAGE_SIZES = [20, 50, 100]
+
+
+class RowSelection:
+    """
+    결석 기간 선택 상태를 행 인덱스 집합으로 보관합니다. (st.session_state에 저장)
+
+    데이터(업로드 파일)가 바뀌면 선택을 비우고, '모두 선택'/'선택 초기화'처럼 표 밖에서 선택을
+    바꿀 때마다 version을 올려 표(data_editor)가 새 선택 상태로 다시 그려지게 합니다.
+    """
+
+    def __init__(self, dataset_id=None):
+        self.dataset_id = dataset_id
+        self.selected = set()
+        self.version = 0
+
+    def reset_for(self, dataset_id):
+        """다른 데이터가 올라오면 선택을 비웁니다."""
+        if dataset_id != self.dataset_id:
+            self.dataset_id = dataset_id
+            self.selected = set()
+            self.version += 1
+
+    def select(self, row_ids):
+        self.selected.update(row_ids)
+        self.version += 1
+
+    def deselect(self, row_ids):
+        self.selected.difference_update(row_ids)
+        self.version += 1
+
+    def apply_page(self, page_ids, checked_ids):
+        """현재 페이지 표의 체크 상태를 반영합니다. (다른 페이지의 선택은 유지)"""
+        self.selected.difference_update(page_ids)
+        self.selected.update(checked_ids)
+
+    def selected_rows(self, data):
+        """data에서 선택된 행만 원래 순서대로 반환합니다."""
+        return data[data.index.isin(self.selected)]
+
+
+def filter_runs(data, numbers=None, date_range=None, reason_text=None):
+    """
+    번호, 기간(결석 기간이 겹치는 행), 사유(포함 문자열)로 결석 기간을 거릅니다.
+
+    Args:
+        numbers (list): 번호 목록
+        date_range (tuple): (시작 date, 종료 date)
+        reason_text (str): 사유에 포함된 문자열
+    """
+    mask = pd.Series(True, index=data.index)
+    if numbers:
+        mask &= data['번호'].isin(numbers)
+    if date_range:
+        start, end = (d.strftime('%Y.%m.%d') for d in date_range)
+        # 'YYYY.MM.DD' 문자열은 사전순 비교가 날짜 비교와 같음
+        mask &= (data['결석시작일'].astype(str) <= end) & (data['결석종료일'].astype(str) >= start)
+    if reason_text:
+        mask &= data['사유'].astype(str).str.contains(reason_text, regex=False)
+    return data[mask]
+
+
+def page_slice(data, page, page_size):
+    """
+    page(1부터 시작)번째 페이지의 행과 전체 페이지 수를 반환합니다.
+
+    Returns:
+        tuple: (페이지 DataFrame, 페이지 수)
+    """
+    page_count = max(1, math.ceil(len(data) / page_size))
+    page = min(max(page, 1), page_count)
+    return data.iloc[(page - 1) * page_size:page * page_size], page_count
+
+
+def display_frame(page_data, selection):
+    """현재 페이지 행을 화면 표시용 열과 '선택' 열만 남긴 DataFrame으로 만듭니다."""
+    columns = [column for column in DISPLAY_COLUMNS if column in page_data.columns]
+    frame = page_data[columns].astype({column: str for column in columns if column not in ('번호', '결석일수')})
+    frame.insert(0, '선택', page_data.index.isin(selection.selected))
+    return frame
@@ -0,0 +1,200 @@
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from app.absence_excel_processing import PROCESSING_VERSION, to_compact_dtypes
+
+STORE_DIR_ENV = "HANOL_PROCESSED_DIR"
+DEFAULT_STORE_DIR = Path(__file__).parent.parent.absolute() / "data" / "processed"
+
+# 저장한 처리 결과를 보관하는 기간 (NEIS 파일은 한 학기 안에서 다시 쓰므로 학기 길이 정도)
+DEFAULT_MAX_AGE_DAYS = 120
+
+
+def _replace_file(path, write):
+    """
+    같은 폴더의 고유한 임시 파일에 write(파일 객체)로 쓴 뒤 path로 바꿔 끼웁니다.
+    여러 프로세스가 같은 항목을 동시에 저장해도 서로의 임시 파일을 덮어쓰지 않고, 읽는 쪽은 완성된 파일만 봅니다.
+    """
+    temp_file = tempfile.NamedTemporaryFile(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False)
+    try:
+        with temp_file:
+            write(temp_file)
+        os.replace(temp_file.name, path)
+    except BaseException:
+        Path(temp_file.name).unlink(missing_ok=True)
+        raise
+
+
+def _write_meta(meta_path, meta):
+    _replace_file(meta_path, lambda f: f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8")))
+
+
+class ProcessedDataStore:
+    """
+    처리된 결석 데이터를 Parquet(열 기반) 파일로 저장해 다음 방문 때 엑셀을 다시 읽지 않게 하는 디스크 캐시.
+
+    항목 키는 (학년, 반, 데이터의 마지막 결석 연월, 업로드 파일 SHA-256)이며, 각 항목은 Parquet 파일과
+    목록 표시용 JSON(원본 파일 이름, 저장 시각, 건수, 올린 사용자 토큰 목록)으로 저장됩니다.
+    최근 목록(recent)은 그 항목을 올린 사용자(owner)에게만 보입니다.
+    PROCESSING_VERSION이 다른 항목은 읽지 않습니다. 저장한 지 max_age_days가 지난 항목은 읽지 않고,
+    저장할 때 오래된 항목과 max_entries를 넘는 항목을 지웁니다.
+    pyarrow가 없으면 저장/읽기를 모두 건너뜁니다.
+    """
+
+    def __init__(self, directory=None, max_entries=200, max_age_days=DEFAULT_MAX_AGE_DAYS):
+        self.directory = Path(directory or os.environ.get(STORE_DIR_ENV) or DEFAULT_STORE_DIR)
+        self.max_entries = max_entries
+        self.max_age = max_age_days * 24 * 60 * 60
+        self.available = importlib.util.find_spec("pyarrow") is not None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(file_bytes):
+        return hashlib.sha256(file_bytes).hexdigest()[:16]
+
+    @staticmethod
+    def data_month(data):
+        """데이터의 마지막 결석종료일이 속한 달('YYYY-MM'). 결석이 없으면 현재 달"""
+        end_dates = data['결석종료일'].dropna().astype(str) if '결석종료일' in data.columns else ()
+        if len(end_dates):
+            return end_dates.max()[:7].replace('.', '-')
+        return datetime.now().strftime("%Y-%m")
+
+    @classmethod
+    def make_key(cls, file_bytes, grade, class_name, month):
+        return f"{grade}-{class_name}_{month}_{cls._digest(file_bytes)}_v{PROCESSING_VERSION}"
+
+    def _paths(self, key):
+        return self.directory / f"{key}.parquet", self.directory / f"{key}.json"
+
+    def _is_expired(self, meta_path):
+        try:
+            return time.time() - meta_path.stat().st_mtime > self.max_age
+        except OSError:
+            return True
+
+    def find(self, file_bytes, grade, class_name):
+        """같은 학급, 같은 파일의 저장된 항목 키를 찾습니다. 없거나 만료되었으면 None"""
+        if not self.available or not self.directory.exists():
+            return None
+        pattern = f"{grade}-{class_name}_*_{self._digest(file_bytes)}_v{PROCESSING_VERSION}.json"
+        for meta_path in self.directory.glob(pattern):
+            if meta_path.with_suffix(".parquet").exists() and not self._is_expired(meta_path):
+                return meta_path.stem
+        return None
+
+    def load(self, key):
+        """저장된 처리 결과를 읽습니다. 없거나 읽을 수 없으면 None을 반환합니다."""
+        if not self.available:
+            return None
+        data_path, _ = self._paths(key)
+        try:
+            return to_compact_dtypes(pd.read_parquet(data_path))
+        except (ImportError, OSError, ValueError):
+            return None
+
+    def save(self, key, data, file_name="", owner=None):
+        """처리 결과와 목록 정보를 저장합니다. (임시 파일에 쓴 뒤 교체)"""
+        if not self.available:
+            return
+        data_path, meta_path = self._paths(key)
+        meta = {
+            "key": key,
+            "file_name": file_name,
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            "rows": len(data),
+            "owners": [owner] if owner else [],
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        _replace_file(data_path, lambda f: data.to_parquet(f, index=True))
+        _write_meta(meta_path, meta)
+        with self._lock:
+            self._prune()
+
+    def _add_owner(self, key, owner):
+        """이미 저장된 항목의 목록 정보에 사용자를 추가합니다."""
+        _, meta_path = self._paths(key)
+        with self._lock:
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return
+            if owner in meta.setdefault("owners", []):
+                return
+            meta["owners"].append(owner)
+            _write_meta(meta_path, meta)
+
+    def _prune(self):
+        entries = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+        expired = [meta_path for meta_path in entries[:self.max_entries] if self._is_expired(meta_path)]
+        for meta_path in entries[self.max_entries:] + expired:
+            meta_path.with_suffix(".parquet").unlink(missing_ok=True)
+            meta_path.unlink(missing_ok=True)
+
+    def recent(self, owner, grade=None, class_name=None, limit=10):
+        """
+        owner가 올린 최근 항목 목록을 최신순으로 반환합니다. 학년/반을 주면 해당 학급만 반환합니다.
+        (다른 사용자가 올린 학생 결석 자료는 보이지 않음)
+
+        Returns:
+            list: {"key", "file_name", "saved_at", "rows"} 사전 목록
+        """
+        if not self.available or not self.directory.exists():
+            return []
+        prefix = f"{grade}-{class_name}_" if grade and class_name else ""
+        entries = []
+        for meta_path in self.directory.glob(f"{prefix}*_v{PROCESSING_VERSION}.json"):
+            if not meta_path.with_suffix(".parquet").exists() or self._is_expired(meta_path):
+                continue
+            try:
+                entry = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            if owner in entry.get("owners", []):
+                entries.append(entry)
+        entries.sort(key=lambda entry: entry["saved_at"], reverse=True)
+        return entries[:limit]
+
+    def save_upload(self, file_bytes, grade, class_name, data, file_name="", owner=None):
+        """
+        학급의 처리 결과를 저장합니다. 같은 학급, 같은 파일이 이미 저장되어 있으면 owner만 추가합니다.
+
+        Returns:
+            str: 항목 키 (저장하지 못했으면 None)
+        """
+        if not self.available:
+            return None
+        key = self.find(file_bytes, grade, class_name)
+        if key is None:
+            key = self.make_key(file_bytes, grade, class_name, self.data_month(data))
+            try:
+                self.save(key, data, file_name, owner)
+            except (ImportError, OSError, ValueError):
+                return None  # 저장하지 못해도 처리 결과는 그대로 사용
+        elif owner:
+            self._add_owner(key, owner)
+        return key
+
+    def get_or_process(self, file_bytes, grade, class_name, process, file_name=""):
+        """
+        저장된 처리 결과가 있으면 읽고, 없으면 process(file_bytes)를 실행해 저장합니다.
+        """
+        key = self.find(file_bytes, grade, class_name)
+        data = self.load(key) if key else None
+        if data is None:
+            data = process(file_bytes)
+            self.save_upload(file_bytes, grade, class_name, data, file_name)
+        return data
+
+
+# 모든 세션이 공유하는 처리 결과 저장소
+processed_data_store = ProcessedDataStore()
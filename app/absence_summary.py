@@ -0,0 +1,89 @@
+import io
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+
+from app.absence_excel_processing import ABSENCE_TYPES
+
+SUMMARY_COLUMNS = ['번호', '성명', '출결구분', '결석시작일', '결석종료일', '결석일수', '사유', '결석확인일']
+SUMMARY_COLUMN_WIDTHS = [6, 10, 14, 13, 13, 9, 30, 13]
+TOTALS_SHEET_TITLE = "학급별 합계"
+TOTALS_COLUMNS = ['학급', '결석 기간 수'] + [f"{t} 일수" for t in ABSENCE_TYPES] + ['합계 일수']
+
+HEADER_FONT = Font(bold=True)
+HEADER_FILL = PatternFill("solid", fgColor="DDEBF7")
+
+
+def iter_summary_rows(data):
+    """
+    처리된 결석 데이터(load_absence_data 결과)에서 요약 시트의 행을 번호/출결구분/시작일 순으로 만듭니다.
+
+    Yields:
+        tuple: SUMMARY_COLUMNS 순서의 값
+    """
+    rows = data.reindex(columns=SUMMARY_COLUMNS).sort_values(['번호', '출결구분', '결석시작일'], kind='mergesort')
+    for row in rows.itertuples(index=False, name=None):
+        yield tuple(None if pd.isna(value) else value for value in row)
+
+
+def _header_cells(worksheet, titles):
+    cells = []
+    for title in titles:
+        cell = WriteOnlyCell(worksheet, value=title)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+        cells.append(cell)
+    return cells
+
+
+def _setup_sheet(worksheet, titles, widths):
+    for index, width in enumerate(widths):
+        worksheet.column_dimensions[chr(ord('A') + index)].width = width
+    worksheet.freeze_panes = "A2"
+    worksheet.append(_header_cells(worksheet, titles))
+
+
+def write_summary_workbook(sheets, output=None):
+    """
+    학급별 결석 요약 엑셀 파일을 쓰기 전용(write-only) 모드로 만듭니다.
+
+    시트 행을 생성기에서 받아 바로 파일로 내보내므로, 한 학급이든 전교든 메모리 사용량이 일정합니다.
+    학급 시트 뒤에 학급별 합계 시트를 추가합니다.
+
+    Args:
+        sheets: (시트 이름, 행 iterable) 생성기. 행은 iter_summary_rows 형식
+        output: 저장할 경로 또는 파일 객체 (없으면 bytes 반환)
+
+    Returns:
+        bytes: output이 없을 때 엑셀 파일 내용
+    """
+    workbook = Workbook(write_only=True)
+    type_pos = SUMMARY_COLUMNS.index('출결구분')
+    days_pos = SUMMARY_COLUMNS.index('결석일수')
+    totals = []
+
+    for title, rows in sheets:
+        worksheet = workbook.create_sheet(title=str(title)[:31])
+        _setup_sheet(worksheet, SUMMARY_COLUMNS, SUMMARY_COLUMN_WIDTHS)
+        run_count = 0
+        days = dict.fromkeys(ABSENCE_TYPES, 0)
+        for row in rows:
+            worksheet.append(row)
+            run_count += 1
+            if row[type_pos] in days:
+                days[row[type_pos]] += int(row[days_pos] or 0)
+        totals.append((worksheet.title, run_count, *days.values(), sum(days.values())))
+
+    totals_sheet = workbook.create_sheet(title=TOTALS_SHEET_TITLE)
+    _setup_sheet(totals_sheet, TOTALS_COLUMNS, [16, 12] + [16] * len(ABSENCE_TYPES) + [12])
+    for row in totals:
+        totals_sheet.append(row)
+
+    if output is not None:
+        workbook.save(output)
+        return None
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
@@ -0,0 +1,75 @@
+"""
+DOCX 템플릿의 쪼개진 자리표시자 합치기
+
+Word는 편집 이력이나 맞춤법 표시 때문에 "{성명}" 같은 자리표시자를 여러 런으로 나눠 저장하기도 합니다.
+템플릿을 컴파일하기 전에 join_split_placeholders를 호출해 각 자리표시자를 하나의 런(텍스트 노드)으로
+합쳐 두면, 이후 치환(app.docx_template)은 텍스트 노드 단위로만 처리하면 됩니다.
+"""
+import re
+
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+# 자리표시자 형식 ({성명}, {1} 등)
+PLACEHOLDER = re.compile(r"\{[^{}]+\}")
+
+
+def _join_paragraph(paragraph):
+    """
+    문단 하나에서 여러 런에 걸친 자리표시자를 자리표시자가 시작된 런으로 옮깁니다.
+    옮긴 글자는 뒤 런에서 지우므로 시작 런의 서식이 그대로 유지됩니다.
+
+    Returns:
+        bool: 런 텍스트가 바뀌었는지 여부
+    """
+    runs = paragraph.runs
+    texts = [run.text for run in runs]
+    full_text = "".join(texts)
+    if "{" not in full_text:
+        return False
+    matches = list(PLACEHOLDER.finditer(full_text))
+    if not matches:
+        return False
+
+    new_texts = []
+    match_index = 0
+    run_start = 0
+    for text in texts:
+        run_end = run_start + len(text)
+        pieces = []
+        position = run_start
+        while position < run_end:
+            # 이 위치 이후의 첫 번째 자리표시자
+            while match_index < len(matches) and matches[match_index].end() <= position:
+                match_index += 1
+            match = matches[match_index] if match_index < len(matches) else None
+            if match is None or match.start() >= run_end:
+                pieces.append(full_text[position:run_end])
+                break
+            if match.start() > position:
+                pieces.append(full_text[position:match.start()])
+            if match.start() >= run_start:
+                # 자리표시자가 시작된 런에 자리표시자 전체를 넣음
+                pieces.append(match.group(0))
+            # 다른 런에 걸친 나머지 글자는 버림
+            position = min(match.end(), run_end)
+        new_texts.append("".join(pieces))
+        run_start = run_end
+
+    changed = False
+    for run, old_text, new_text in zip(runs, texts, new_texts):
+        if new_text != old_text:
+            run.text = new_text
+            changed = True
+    return changed
+
+
+def join_split_placeholders(element):
+    """
+    요소(문서 본문, 머리글 등) 안의 모든 문단에서 여러 런으로 쪼개진 자리표시자를 하나의 런으로 합칩니다.
+    중첩된 표 안의 문단도 포함됩니다.
+    """
+    for p in element.iter(qn("w:p")):
+        paragraph = Paragraph(p, None)
+        if len(paragraph.runs) >= 2:
+            _join_paragraph(paragraph)
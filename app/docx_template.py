@@ -0,0 +1,107 @@
+import io
+import os
+import re
+import threading
+from xml.sax.saxutils import escape
+
+from docx import Document
+from docx.oxml import parse_xml
+from docx.oxml.ns import qn
+from lxml import etree
+
+from app.docx_placeholders import join_split_placeholders
+
+# {성명}, {결석시작일}, {1} 같은 자리표시자
+PLACEHOLDER_PATTERN = re.compile(r"\{[^{}<>\"]+\}")
+
+
+class CompiledTemplate:
+    """
+    한 번만 파싱해 둔 DOCX 템플릿.
+
+    본문 요소(표, 문단)를 XML 문자열로 직렬화한 뒤 자리표시자 위치를 기준으로 조각을 나눠 두고,
+    레코드마다 조각을 이어 붙여 새 본문 XML을 찍어냅니다. 학생마다 템플릿 ZIP을 다시 열거나
+    모든 문단/셀/런을 순회하지 않습니다.
+    """
+
+    def __init__(self, template_path):
+        self.path = str(template_path)
+        self.mtime = os.path.getmtime(self.path)
+        with open(self.path, "rb") as f:
+            self._package_bytes = f.read()
+
+        body = Document(io.BytesIO(self._package_bytes)).element.body
+        # Word가 여러 런으로 쪼갠 자리표시자를 먼저 하나로 합쳐 둠
+        join_split_placeholders(body)
+        # 요소별로 [문자열, 자리표시자, 문자열, ...] 형태의 조각 목록
+        self.parts = [
+            self._split(etree.tostring(element, encoding="unicode"))
+            for element in body
+            if element.tag != qn("w:sectPr")
+        ]
+        self.placeholders = sorted({piece for part in self.parts for piece in part[1::2]})
+
+    @staticmethod
+    def _split(xml):
+        pieces = []
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(xml):
+            pieces.append(xml[position:match.start()])
+            pieces.append(match.group(0))
+            position = match.end()
+        pieces.append(xml[position:])
+        return pieces
+
+    def stamp(self, replacements):
+        """치환값을 적용한 본문 요소 목록을 만듭니다."""
+        values = {key: escape(str(value)) for key, value in replacements.items()}
+        elements = []
+        for pieces in self.parts:
+            xml = "".join(
+                piece if i % 2 == 0 else values.get(piece, piece)
+                for i, piece in enumerate(pieces)
+            )
+            elements.append(parse_xml(xml))
+        return elements
+
+    def render(self, replacements_list):
+        """
+        레코드마다 템플릿 본문을 찍어내 하나의 문서로 합칩니다.
+
+        Args:
+            replacements_list: {자리표시자: 값} 사전의 목록 (레코드 하나당 한 페이지)
+
+        Returns:
+            Document: 통합 문서 (구역 설정은 템플릿의 것을 사용)
+        """
+        document = Document(io.BytesIO(self._package_bytes))
+        body = document.element.body
+        section = body.find(qn("w:sectPr"))
+        for element in list(body):
+            if element is not section:
+                body.remove(element)
+
+        for replacements in replacements_list:
+            for element in self.stamp(replacements):
+                if section is not None:
+                    section.addprevious(element)
+                else:
+                    body.append(element)
+        return document
+
+
+_compiled_templates = {}
+_lock = threading.Lock()
+
+
+def get_compiled_template(template_path):
+    """
+    컴파일된 템플릿을 반환합니다. 파일 수정 시각(mtime)이 바뀌면 다시 컴파일합니다.
+    """
+    path = str(template_path)
+    mtime = os.path.getmtime(path)
+    with _lock:
+        template = _compiled_templates.get(path)
+        if template is None or template.mtime != mtime:
+            template = _compiled_templates[path] = CompiledTemplate(path)
+    return template
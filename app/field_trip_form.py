@@ -0,0 +1,77 @@
+import datetime
+from datetime import date, timedelta
+
+from app.school_calendar import get_school_calendar
+
+DATE_FORMAT = "%Y년 %m월 %d일"
+
+# 레코드에 그대로 옮기는 입력 항목
+TEXT_FIELDS = [
+    "student_name", "student_number", "learning_type", "purpose", "destination",
+    "guardian_name", "guardian_relationship", "guardian_contact",
+    "chaperone_name", "chaperone_relationship", "chaperone_contact",
+]
+
+
+def build_plan_rows(plans, start_date):
+    """
+    일차별 학습 계획을 날짜순으로 펼쳐 표의 행 목록으로 만듭니다.
+    일차 이름은 각 일차의 첫 행에만 넣습니다.
+
+    Args:
+        plans (dict): {'1일차': [{'시간', '장소', '활동내용'}, ...]}
+        start_date (date): 체험학습 시작일
+    """
+    sorted_days = sorted(
+        plans.keys(),
+        key=lambda day_key: start_date + timedelta(days=int(''.join(filter(str.isdigit, day_key))) - 1)
+    )
+    rows = []
+    for day_key in sorted_days:
+        for i, plan in enumerate(plans.get(day_key, [])):
+            rows.append({
+                'day': day_key if i == 0 else '',
+                'time': plan.get('시간', ''),
+                'location': plan.get('장소', ''),
+                'activity': plan.get('활동내용', '')
+            })
+    return rows
+
+
+def build_field_trip_record(state, today=None):
+    """
+    교외체험학습 신청서/결과보고서 양식에 넣을 레코드를 세션 상태에서 만듭니다.
+
+    Raises:
+        ValueError: 시작일/종료일 또는 출석인정 기간이 날짜가 아닐 때
+    """
+    start_date = state.get("start_date")
+    end_date = state.get("end_date")
+    if not (isinstance(start_date, datetime.date) and isinstance(end_date, datetime.date)):
+        raise ValueError("시작일과 종료일이 올바른 날짜 형식이 아닙니다.")
+
+    attendance_start_date = state.get("attendance_start_date")
+    attendance_end_date = state.get("attendance_end_date")
+    if not (isinstance(attendance_start_date, datetime.date) and isinstance(attendance_end_date, datetime.date)):
+        raise ValueError("출석인정 기간이 올바른 날짜 형식이 아닙니다.")
+    # 주말, 공휴일, 학교 휴업일을 뺀 수업일 수 (연도가 바뀌는 기간 포함)
+    attendance_duration = get_school_calendar(
+        attendance_start_date, attendance_end_date
+    ).count_school_days(attendance_start_date, attendance_end_date)
+
+    record = {field: state.get(field, "") for field in TEXT_FIELDS}
+    record.update({
+        "student_grade": state.get("student_grade", "").replace('학년', ''),
+        "student_class": state.get("student_class", "").replace('반', ''),
+        "start_date": start_date.strftime(DATE_FORMAT),
+        "end_date": end_date.strftime(DATE_FORMAT),
+        "duration": (end_date - start_date).days + 1,  # 시작일과 종료일 포함
+        "attendance_start_date": attendance_start_date.strftime(DATE_FORMAT),
+        "attendance_end_date": attendance_end_date.strftime(DATE_FORMAT),
+        "attendance_duration": attendance_duration,
+        "submit_date": (today or date.today()).strftime(DATE_FORMAT),
+        "plans": build_plan_rows(state.get("plans") or {}, start_date),
+        "student_signature": state.get("student_signature_img"),
+        "guardian_signature": state.get("guardian_signature_img"),
+    })
+    return record
@@ -0,0 +1,128 @@
+"""
+프로세스 전역 폰트 레지스트리
+
+폰트 종류(family)마다 후보 경로 중 처음 찾은 파일을 한 번만 결정하고, 파일 내용도 한 번만 읽어 둡니다.
+FreeTypeFont는 (경로, 크기)별로 캐시하며, 처음 쓰는 크기도 메모리의 폰트 데이터에서 만들기 때문에
+렌더링 중에는 폰트 때문에 파일 시스템에 접근하지 않습니다.
+"""
+import io
+import threading
+from pathlib import Path
+
+from PIL import ImageFont
+
+FONT_DIR = Path(__file__).parent.parent.absolute() / "fonts"
+
+_SYSTEM_REGULAR = [
+    Path("/usr/share/fonts/truetype/nanum/NanumGothic.ttf"),
+    Path("/System/Library/Fonts/AppleGothic.ttf"),
+    Path("C:\\Windows\\Fonts\\malgun.ttf"),
+]
+
+# 폰트 종류별 후보 경로 (앞에서부터 먼저 찾은 파일을 사용)
+FONT_FAMILIES = {
+    # 위임장, 결석신고서 PDF
+    "dotum": [FONT_DIR / "HANDotum.ttf", FONT_DIR / "AppleGothic.ttf", *_SYSTEM_REGULAR],
+    "dotum_bold": [
+        FONT_DIR / "HANDotumB.ttf",
+        Path("/usr/share/fonts/truetype/nanum/NanumGothicBold.ttf"),
+        Path("C:\\Windows\\Fonts\\malgunbd.ttf"),
+    ],
+    # 교외체험학습 신청서/결과보고서
+    "gothic": [
+        FONT_DIR / "AppleGothic.ttf",
+        Path("/Library/Fonts/AppleGothic.ttf"),
+        Path("/System/Library/Fonts/AppleGothic.ttf"),
+        Path("/usr/share/fonts/truetype/nanum/NanumGothic.ttf"),
+        Path("C:\\Windows\\Fonts\\malgun.ttf"),
+    ],
+}
+
+# 후보를 모두 찾지 못했을 때 대신 사용할 폰트 종류
+FALLBACK_FAMILIES = {"dotum_bold": "dotum"}
+
+# 폰트를 찾지 못했을 때 안내할 설치 방법
+INSTALL_HINT = "나눔고딕을 설치하세요 (Ubuntu/Debian: sudo apt install fonts-nanum)"
+
+# 앱 시작 시 미리 만들어 둘 (폰트 종류, 크기)
+WARMUP_FONTS = [("dotum", 55), ("dotum_bold", 60), ("gothic", 55)]
+
+
+class FontNotFoundError(FileNotFoundError):
+    pass
+
+
+class FontRegistry:
+    def __init__(self, families=None, fallbacks=None):
+        self.families = FONT_FAMILIES if families is None else families
+        self.fallbacks = FALLBACK_FAMILIES if fallbacks is None else fallbacks
+        self._paths = {}
+        self._data = {}
+        self._fonts = {}
+        self._lock = threading.Lock()
+
+    def _candidates(self, family, seen=()):
+        """폰트 종류의 후보 경로를 대체 폰트 종류까지 포함해 순서대로 반환합니다."""
+        paths = list(self.families.get(family, []))
+        fallback = self.fallbacks.get(family)
+        if fallback and fallback not in seen:
+            paths += self._candidates(fallback, seen + (family,))
+        return paths
+
+    def _find(self, family, seen=()):
+        path = next((str(p) for p in self.families.get(family, []) if p.exists()), None)
+        fallback = self.fallbacks.get(family)
+        if path is None and fallback and fallback not in seen:
+            path = self._find(fallback, seen + (family,))
+        return path
+
+    def resolve(self, family):
+        """폰트 종류의 파일 경로(str)를 반환합니다. 찾지 못하면 None. (결과는 한 번만 계산)"""
+        if family not in self._paths:
+            with self._lock:
+                if family not in self._paths:
+                    self._paths[family] = self._find(family)
+        return self._paths[family]
+
+    def get(self, family, size):
+        """
+        폰트 종류와 크기에 맞는 FreeTypeFont를 반환합니다.
+
+        Raises:
+            FontNotFoundError: 폰트 종류의 후보 파일이 하나도 없을 때
+        """
+        path = self.resolve(family)
+        if path is None:
+            candidates = self._candidates(family)
+            bundled = [p.name for p in candidates if p.parent == FONT_DIR]
+            hint = f"{FONT_DIR}에 {' 또는 '.join(bundled)} 파일을 넣거나 " if bundled else ""
+            raise FontNotFoundError(
+                f"'{family}' 폰트 파일을 찾을 수 없습니다. {hint}{INSTALL_HINT}. "
+                f"(찾아본 경로: {', '.join(str(p) for p in candidates)})"
+            )
+        key = (path, size)
+        font = self._fonts.get(key)
+        if font is None:
+            with self._lock:
+                data = self._data.get(path)
+                if data is None:
+                    data = self._data[path] = Path(path).read_bytes()
+                font = self._fonts[key] = ImageFont.truetype(io.BytesIO(data), size=size)
+        return font
+
+    def warmup(self, fonts=()):
+        """
+        모든 폰트 종류의 경로를 결정하고, fonts에 있는 (폰트 종류, 크기)를 미리 만듭니다. (앱 시작 시 호출)
+
+        Returns:
+            dict: {폰트 종류: 경로 또는 None}
+        """
+        resolved = {family: self.resolve(family) for family in self.families}
+        for family, size in fonts:
+            if self.resolve(family) is not None:
+                self.get(family, size)
+        return resolved
+
+
+# 모든 세션이 공유하는 폰트 레지스트리
+font_registry = FontRegistry()
@@ -0,0 +1,192 @@
+"""
+양식 배경 이미지 캐시
+
+양식 PNG를 프로세스에서 한 번만 디코딩해 메모리에 두고, 렌더링마다 복사본을 내줍니다.
+파일 수정 시각(mtime)이 바뀌면 다시 읽고, 오래 쓰지 않은 양식부터 비웁니다(LRU).
+
+회색조(L)로 그리는 양식은 L로 바꾼 배경을 따로 보관합니다.
+
+PNG 옆에 미리 디코딩한 래스터(<이름>.rgbx.npy / <이름>.rgba.npy / <이름>.l.npy)가 있으면 PNG 대신 읽기 전용
+메모리 맵으로 엽니다. 같은 서버의 여러 Streamlit 프로세스가 OS 페이지 캐시의 같은 메모리를 공유하고,
+렌더링용 복사본도 맵에서 바로 만듭니다. 래스터는 다음 명령으로 만듭니다.
+
+    python -m app.form_backgrounds
+"""
+import argparse
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+BASE_DIR = Path(__file__).parent.parent.absolute()
+LAYOUT_DIR = BASE_DIR / "layouts"
+
+# 그대로 보관하는 모드 (그 밖의 모드는 RGBA로 바꿔 보관)
+NATIVE_MODES = ("RGB", "RGBA")
+
+# 래스터 파일 모드: RGB는 PIL 내부 배치와 같은 4바이트 RGBX로 저장해야 복사 없이 맵핑됨
+RASTER_MODES = {"RGB": "RGBX", "RGBA": "RGBA", "L": "L"}
+
+
+def raster_path(path, mode):
+    """PNG 옆에 둘 래스터 파일 경로 (예: images/studywork001.rgbx.npy)"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.{mode.lower()}.npy")
+
+
+def _find_raster(path, mode=None):
+    """
+    PNG보다 새로운 래스터 파일의 (경로, 래스터 모드)를 찾습니다. 없으면 None.
+
+    Args:
+        mode: 이미지 모드 (None이면 배경 원래 모드인 RGB/RGBA 래스터)
+    """
+    png_mtime = os.path.getmtime(path)
+    raster_modes = (RASTER_MODES["RGB"], RASTER_MODES["RGBA"]) if mode is None else (RASTER_MODES[mode],)
+    for raster_mode in raster_modes:
+        candidate = raster_path(path, raster_mode)
+        try:
+            if os.path.getmtime(candidate) >= png_mtime:
+                return candidate, raster_mode
+        except OSError:
+            continue
+    return None
+
+
+def load_raster(path, mode=None):
+    """
+    래스터 파일을 읽기 전용 메모리 맵으로 열어 이미지로 반환합니다. (픽셀 복사 없음)
+
+    Returns:
+        Image: 읽기 전용 RGBX/RGBA/L 이미지. 최신 래스터가 없으면 None
+    """
+    found = _find_raster(path, mode)
+    if found is None:
+        return None
+    raster, mode = found
+    pixels = np.load(raster, mmap_mode="r")
+    height, width = pixels.shape[:2]
+    return Image.frombuffer(mode, (width, height), pixels, "raw", mode, 0, 1)
+
+
+def _decode_png(path, mode=None):
+    image = Image.open(path)
+    image.load()
+    if mode is not None:
+        return image.convert(mode)
+    if image.mode not in NATIVE_MODES:
+        return image.convert("RGBA")
+    return image
+
+
+def build_raster(path, mode=None, force=False):
+    """
+    PNG를 디코딩해 래스터 파일(.npy)로 저장합니다. 이미 최신이면 건너뜁니다.
+
+    Args:
+        mode: 이미지 모드 (None이면 배경 원래 모드)
+
+    Returns:
+        Path: 래스터 파일 경로 (건너뛰면 None)
+    """
+    if not force and _find_raster(path, mode) is not None:
+        return None
+    image = _decode_png(path, mode)
+    raster_mode = RASTER_MODES[image.mode]
+    target = raster_path(path, raster_mode)
+    temp_path = target.with_name(target.name + ".tmp")
+    with open(temp_path, "wb") as f:
+        np.save(f, np.asarray(image.convert(raster_mode)))
+    # 다른 프로세스가 맵핑 중인 파일도 안전하도록 새 파일로 바꿔 끼움
+    os.replace(temp_path, target)
+    return target
+
+
+def layout_backgrounds():
+    """layouts/*.json에서 쓰는 (배경 이미지 경로, 모드) 목록"""
+    backgrounds = set()
+    for layout in LAYOUT_DIR.glob("*.json"):
+        with open(layout, encoding="utf-8") as f:
+            spec = json.load(f)
+        backgrounds.add((BASE_DIR / spec["background"], spec.get("mode")))
+    return sorted(backgrounds, key=lambda background: (background[0], background[1] or ""))
+
+
+class BackgroundCache:
+    def __init__(self, max_entries=8):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # (경로, 모드) -> (수정 시각, 이미지)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stamp(path, mode):
+        found = _find_raster(path, mode)
+        return os.path.getmtime(path), found and os.path.getmtime(found[0])
+
+    @staticmethod
+    def _decode(path, mode):
+        image = load_raster(path, mode)
+        if image is not None:
+            return image
+        return _decode_png(path, mode)
+
+    def get(self, path, mode=None):
+        """
+        배경 이미지를 반환합니다. (공유 객체이므로 수정하지 말고 copy를 사용)
+
+        Args:
+            mode: 이미지 모드 (None이면 PNG 원래 모드인 RGB/RGBA, "L"이면 회색조)
+        """
+        key = (str(path), mode)
+        stamp = self._stamp(key[0], mode)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+        # 디코딩은 잠금 밖에서 (다른 양식 조회를 막지 않음)
+        image = self._decode(key[0], mode)
+        with self._lock:
+            self._entries[key] = (stamp, image)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return image
+
+    def copy(self, path, mode=None):
+        """렌더링에 쓸 복사본(RGB/RGBA/L)을 반환합니다. (디코딩 없이 픽셀 메모리만 복사)"""
+        image = self.get(path, mode)
+        if image.mode == "RGBX":
+            return image.convert("RGB")
+        return image.copy()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 모든 세션이 공유하는 배경 이미지 캐시
+background_cache = BackgroundCache()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="양식 배경 PNG를 메모리 맵용 래스터(.npy)로 미리 디코딩합니다.")
+    parser.add_argument("images", nargs="*", help="PNG 경로 (없으면 layouts/*.json의 배경 이미지 전체)")
+    parser.add_argument("--mode", choices=["L"], help="images를 줄 때 래스터 모드 (기본: PNG 원래 모드)")
+    parser.add_argument("--force", action="store_true", help="최신 래스터가 있어도 다시 만듦")
+    args = parser.parse_args(argv)
+
+    backgrounds = [(path, args.mode) for path in args.images] or layout_backgrounds()
+    for path, mode in backgrounds:
+        target = build_raster(path, mode, force=args.force)
+        print(f"{path} -> {target}" if target else f"{path}: 최신 래스터 있음")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
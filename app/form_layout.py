@@ -0,0 +1,320 @@
+"""
+양식 이미지 레이아웃 엔진
+
+양식 이미지마다 layouts/<이름>.json에 배경 이미지, 기본 폰트, 요소(텍스트, 선택 표시, 표, 서명/사진 칸)를
+적어 두고, 한 번 컴파일한 레이아웃에 데이터 레코드(dict)를 넣어 이미지를 만듭니다.
+위임장, 교외체험학습 신청서/결과보고서가 모두 같은 렌더링 경로를 사용합니다.
+
+요소 종류
+- text: 레코드 값(field) 또는 고정 문자열(text)을 xy에 그림. fit이 있으면 폰트 크기 맞춤/줄바꿈
+        (값이 목록이면 한 줄씩 line_height 간격으로 그림)
+- choice: 값에 해당하는 위치(marks)에 표시 문자(mark)를 그림. 값이 없으면 missing 안내를 그림
+- rows: 레코드 목록을 영역(areas)에 나눠 표 형태로 그림. 영역에 들어가지 않은 행은 넘침으로 반환
+- image: 서명 등 이미지 한 장을 xy에 붙임 (size가 있으면 크기 조정)
+- images: 사진 목록을 boxes에 비율을 유지해 가운데 맞춤으로 붙임
+
+레이아웃은 "extends"로 공통 레이아웃(layouts/base/*.json)을 이어받을 수 있습니다. 공통 레이아웃의 요소 중
+"id"가 있는 요소는 "overrides": {id: 바꿀 속성}으로 일부 속성만 바꾸고(사전은 키 단위로 합침),
+defaults 등 나머지 최상위 값은 이어받는 레이아웃의 값이 우선합니다.
+
+"mode": "L"인 레이아웃은 흑백 스캔 양식을 회색조(1바이트/픽셀) 그대로 그립니다. 서명은 붙는 자리에만
+합성되고, 색 글자(예: 빨간 안내 문구)를 그려야 하는 레코드만 배경 원래 모드로 그립니다.
+"""
+import json
+import math
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from app.font_registry import font_registry
+from app.form_backgrounds import background_cache
+from app.text_layout import draw_lines, layout_text
+
+BASE_DIR = Path(__file__).parent.parent.absolute()
+LAYOUT_DIR = BASE_DIR / "layouts"
+
+# 정렬 → PIL 앵커 (a: 글자 윗선 기준, draw.text 기본값과 같음)
+ANCHORS = {"left": "la", "center": "ma", "right": "ra"}
+
+
+def _is_gray(color):
+    red, green, blue = ImageColor.getrgb(color)[:3]
+    return red == green == blue
+
+
+def _text(value):
+    return "" if value is None else str(value)
+
+
+def _merge(base, override):
+    """사전은 키 단위로 재귀적으로 합치고, 그 밖의 값(목록 포함)은 override로 바꿉니다."""
+    if not (isinstance(base, dict) and isinstance(override, dict)):
+        return override
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = _merge(base[key], value) if key in base else value
+    return merged
+
+
+def load_layout_spec(path):
+    """
+    레이아웃 JSON을 읽고 extends(공통 레이아웃)를 풀어 합칩니다.
+
+    Returns:
+        tuple: (합친 spec, 읽은 파일 경로 목록 - 수정 시각 확인용)
+
+    Raises:
+        ValueError: overrides의 id가 공통 레이아웃에 없을 때
+    """
+    with open(path, encoding="utf-8") as f:
+        spec = json.load(f)
+    base_name = spec.pop("extends", None)
+    if base_name is None:
+        return spec, [str(path)]
+
+    base, base_sources = load_layout_spec(LAYOUT_DIR / f"{base_name}.json")
+    overrides = dict(spec.pop("overrides", {}))
+    elements = [
+        _merge(element, overrides.pop(element["id"])) if element.get("id") in overrides else element
+        for element in base["elements"]
+    ]
+    if overrides:
+        raise ValueError(f"{path}: {base_name}에 없는 요소 id: {', '.join(overrides)}")
+    merged = _merge({key: value for key, value in base.items() if key != "elements"}, spec)
+    merged["elements"] = elements + spec.get("elements", [])
+    return merged, [str(path)] + base_sources
+
+
+def _source_stamp(paths):
+    return tuple(os.path.getmtime(path) for path in paths)
+
+
+def _to_image(value):
+    """PIL 이미지, 파일(경로/파일 객체), 서명 배열(ndarray)을 RGBA 이미지로 바꿉니다."""
+    if isinstance(value, Image.Image):
+        return value.convert("RGBA")
+    if hasattr(value, "read") or isinstance(value, (str, Path)):
+        return Image.open(value).convert("RGBA")
+    return Image.fromarray(np.asarray(value).astype("uint8")).convert("RGBA")
+
+
+class CompiledLayout:
+    """
+    한 번만 읽어 둔 양식 레이아웃.
+
+    요소마다 폰트, 좌표, 앵커를 미리 정해 그리기 함수로 바꿔 두고, render에서는 레코드 값만 꺼내 그립니다.
+    """
+
+    def __init__(self, layout_path):
+        self.path = str(layout_path)
+        spec, self.sources = load_layout_spec(self.path)
+        self.stamp = _source_stamp(self.sources)
+
+        self.name = spec.get("name", Path(self.path).stem)
+        self.background = BASE_DIR / spec["background"]
+        self.mode = spec.get("mode")
+        defaults = spec.get("defaults", {})
+        self.font_family = defaults.get("font", "gothic")
+        self.font_size = defaults.get("size", 55)
+        self.fill = defaults.get("fill", "black")
+        # 레코드를 받아 색 글자를 그리는지 알려 주는 함수 목록 (회색조 렌더링 여부 판단용)
+        self._color_checks = []
+
+        compilers = {
+            "text": self._compile_text,
+            "choice": self._compile_choice,
+            "rows": self._compile_rows,
+            "image": self._compile_image,
+            "images": self._compile_images,
+        }
+        self.steps = [compilers[element["type"]](element) for element in spec["elements"]]
+
+    def _font(self, element):
+        return element.get("font", self.font_family), element.get("size", self.font_size)
+
+    def _compile_text(self, element):
+        family, size = self._font(element)
+        font = font_registry.get(family, size)
+        x, y = element["xy"]
+        fill = element.get("fill", self.fill)
+        anchor = ANCHORS[element.get("align", "left")]
+        field = element.get("field")
+        fixed_text = element.get("text", "")
+        fit = element.get("fit")
+        line_height = (fit or element).get("line_height", round(size * 1.2))
+        if not _is_gray(fill):
+            self._color_checks.append(lambda record: bool(record.get(field)) if field else bool(fixed_text))
+
+        def draw_text(image, draw, record, overflow):
+            value = record.get(field) if field else fixed_text
+            if value is None or value == "":
+                return
+            if isinstance(value, (list, tuple)):
+                for index, line in enumerate(value):
+                    draw.text((x, y + index * line_height), _text(line), font=font, fill=fill, anchor=anchor)
+                return
+            if fit is None:
+                draw.text((x, y), _text(value), font=font, fill=fill, anchor=anchor)
+                return
+            fit_lines = fit.get("fit_lines", 1)
+            text_font, lines = layout_text(
+                _text(value), fit["width"], family, size, fit["min_size"],
+                fit_lines=fit_lines, max_lines=fit.get("max_lines", fit_lines)
+            )
+            top = y
+            if element.get("valign") == "middle":
+                # 여러 줄이면 한 줄일 때의 위치를 가운데로 두고 위아래로 펼침
+                top -= (len(lines) - 1) * line_height // 2
+            for index, line in enumerate(lines):
+                draw.text((x, top + index * line_height), line, font=text_font, fill=fill, anchor=anchor)
+
+        return draw_text
+
+    def _compile_choice(self, element):
+        font = font_registry.get(*self._font(element))
+        field = element["field"]
+        mark = element.get("mark", "0")
+        fill = element.get("fill", self.fill)
+        marks = {value: tuple(xy) for value, xy in element["marks"].items()}
+        missing = element.get("missing")
+        if not _is_gray(fill):
+            self._color_checks.append(lambda record: record.get(field) in marks)
+        if missing and not _is_gray(missing.get("fill", fill)):
+            self._color_checks.append(lambda record: record.get(field) not in marks)
+
+        def draw_choice(image, draw, record, overflow):
+            xy = marks.get(record.get(field))
+            if xy is not None:
+                draw.text(xy, mark, font=font, fill=fill)
+            elif missing:
+                draw.text(tuple(missing["xy"]), missing["text"], font=font, fill=missing.get("fill", fill))
+
+        return draw_choice
+
+    def _compile_rows(self, element):
+        family, size = self._font(element)
+        font = font_registry.get(family, size)
+        field = element["field"]
+        fill = element.get("fill", self.fill)
+        areas = [(area["x"], area["y"], area["width"]) for area in element["areas"]]
+        max_y = element["max_y"]
+        line_height = element["line_height"]
+        group_field = element.get("group_field")
+        columns = [(column["field"], column.get("dx", 0), column.get("fit")) for column in element["columns"]]
+        if not _is_gray(fill):
+            self._color_checks.append(lambda record: bool(record.get(field)))
+
+        def draw_area(draw, rows, area):
+            x, y_start, width = area
+            y = y_start
+            current_group = None
+            leftover = []
+            for row in rows:
+                if y >= max_y:
+                    leftover.append(row)
+                    continue
+                group = row.get(group_field) if group_field else None
+                if group and group != current_group:
+                    if y != y_start:  # 첫 그룹이 아니면 한 줄 띄움
+                        y += line_height
+                    current_group = group
+                    draw.text((x, y), _text(group), font=font, fill=fill)
+                    y += line_height
+                row_lines = 1
+                for column_field, dx, fit in columns:
+                    value = _text(row.get(column_field))
+                    if fit is None:
+                        draw.text((x + dx, y), value, font=font, fill=fill)
+                        continue
+                    max_lines = fit.get("max_lines", 1)
+                    column_font, lines = layout_text(
+                        value, width - dx, family, size, fit["min_size"], fit_lines=1, max_lines=max_lines
+                    )
+                    row_lines = max(row_lines, draw_lines(draw, (x + dx, y), lines, column_font, line_height, fill))
+                y += line_height * row_lines
+            return leftover
+
+        def draw_rows(image, draw, record, overflow):
+            rows = list(record.get(field) or [])
+            if not rows:
+                return
+            # 영역마다 같은 수로 나눔 (나머지는 앞 영역에)
+            chunk = math.ceil(len(rows) / len(areas))
+            for index, area in enumerate(areas):
+                overflow.extend(draw_area(draw, rows[index * chunk:(index + 1) * chunk], area))
+
+        return draw_rows
+
+    def _compile_image(self, element):
+        field = element["field"]
+        xy = tuple(element["xy"])
+        size = tuple(element["size"]) if "size" in element else None
+
+        def paste_image(image, draw, record, overflow):
+            value = record.get(field)
+            if value is None:
+                return
+            picture = _to_image(value)
+            if size is not None:
+                picture = picture.resize(size, Image.Resampling.LANCZOS)
+            image.paste(picture, xy, picture)
+
+        return paste_image
+
+    def _compile_images(self, element):
+        field = element["field"]
+        boxes = [tuple(box) for box in element["boxes"]]
+
+        def paste_images(image, draw, record, overflow):
+            for value, (x, y, width, height) in zip(record.get(field) or [], boxes):
+                picture = _to_image(value)
+                ratio = min(width / picture.width, height / picture.height)
+                new_size = (int(picture.width * ratio), int(picture.height * ratio))
+                picture = picture.resize(new_size, Image.Resampling.LANCZOS)
+                # 칸 가운데에 붙임
+                image.paste(picture, (x + (width - new_size[0]) // 2, y + (height - new_size[1]) // 2), picture)
+
+        return paste_images
+
+    def render(self, record):
+        """
+        레코드를 양식 이미지에 그립니다.
+
+        Args:
+            record (dict): {필드 이름: 값}
+
+        Returns:
+            tuple: (레이아웃 모드(L) 또는 배경 이미지 모드(RGB/RGBA)의 이미지, 표 영역에 들어가지 않은 행 목록)
+        """
+        mode = self.mode
+        if mode is not None and any(check(record) for check in self._color_checks):
+            mode = None  # 색 글자가 있으면 배경 원래 모드로 그림
+        image = background_cache.copy(self.background, mode)
+        draw = ImageDraw.Draw(image)
+        overflow = []
+        for step in self.steps:
+            step(image, draw, record, overflow)
+        return image, overflow
+
+
+_compiled_layouts = {}
+_lock = threading.Lock()
+
+
+def get_form_layout(name):
+    """
+    layouts/<name>.json을 컴파일한 레이아웃을 반환합니다.
+    레이아웃 파일이나 이어받은 공통 레이아웃 파일의 수정 시각(mtime)이 바뀌면 다시 컴파일합니다.
+
+    Raises:
+        FontNotFoundError: 레이아웃에 쓰인 폰트를 찾을 수 없을 때 (설치할 폰트 파일을 안내함)
+    """
+    path = str(LAYOUT_DIR / f"{name}.json")
+    with _lock:
+        layout = _compiled_layouts.get(path)
+        if layout is None or layout.stamp != _source_stamp(layout.sources):
+            layout = _compiled_layouts[path] = CompiledLayout(path)
+    return layout
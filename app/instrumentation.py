@@ -0,0 +1,71 @@
+"""
+처리 단계별 소요 시간과 행 수를 기록하는 로깅 도구
+
+기본값은 꺼져 있으며(로거 레벨 미설정 → WARNING), 환경 변수 HANOL_LOG_LEVEL
+(예: DEBUG, INFO)을 지정하면 app 로거에 콘솔 핸들러를 붙여 단계별 기록을 출력합니다.
+꺼져 있을 때는 시간 측정과 메시지 포맷을 모두 건너뜁니다.
+"""
+import logging
+import os
+import time
+from contextlib import contextmanager
+
+LOG_LEVEL_ENV = "HANOL_LOG_LEVEL"
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+_configured = False
+
+
+def configure_logging(level=None):
+    """
+    app 로거의 레벨과 콘솔 핸들러를 설정합니다. (여러 번 호출해도 핸들러는 하나만 추가)
+
+    Args:
+        level (str | int, optional): 로그 레벨. 없으면 HANOL_LOG_LEVEL 환경 변수를 사용하며,
+            둘 다 없으면 아무것도 하지 않습니다. 알 수 없는 레벨이면 경고를 남기고 WARNING으로 설정합니다.
+    """
+    global _configured
+    level = level or os.environ.get(LOG_LEVEL_ENV)
+    if not level:
+        return
+
+    logger = logging.getLogger("app")
+    if not _configured:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logger.addHandler(handler)
+        _configured = True
+    try:
+        logger.setLevel(level.upper() if isinstance(level, str) else level)
+    except (TypeError, ValueError):
+        # 잘못된 레벨 이름 때문에 앱 import가 실패하지 않도록 기본 레벨로 설정
+        logger.setLevel(logging.WARNING)
+        logger.warning("알 수 없는 로그 레벨 %r (%s), WARNING으로 설정합니다.", level, LOG_LEVEL_ENV)
+
+
+@contextmanager
+def log_stage(logger, stage, level=logging.DEBUG):
+    """
+    with 블록의 소요 시간을 측정해 기록합니다.
+
+    블록 안에서 반환된 사전에 'rows' 등을 넣으면 함께 기록됩니다.
+    로거가 해당 레벨을 기록하지 않으면 측정하지 않습니다.
+
+    Example:
+        with log_stage(logger, "read") as stage:
+            data = read(...)
+            stage['rows'] = len(data)
+    """
+    details = {}
+    if not logger.isEnabledFor(level):
+        yield details
+        return
+
+    started = time.perf_counter()
+    yield details
+    elapsed = time.perf_counter() - started
+    extra = ", ".join(f"{key}={value}" for key, value in details.items())
+    logger.log(level, "%s: %.4fs%s", stage, elapsed, f" ({extra})" if extra else "")
+
+
+configure_logging()
@@ -1,16 +1,19 @@
 import pathlib
 import streamlit as st
 import os
+from app.font_registry import font_registry
 
 class ResourceManager:
     def __init__(self):
         self.base_dir = pathlib.Path(__file__).parent.parent.absolute()
         self.image_dir = self.base_dir / "images"
-        self.font_dir = self.base_dir / "fonts"
         self.paths = {
             "신청서 양식": self.image_dir / "delegation_form.png",
-            "폰트": self.font_dir / "HANDotum.ttf",
-            "폰트_볼드": self.font_dir / "HANDotumB.ttf"
+        }
+        # 폰트는 폰트 레지스트리에서 한 번만 찾음
+        self.fonts = {
+            "폰트": "dotum",
+            "폰트_볼드": "dotum_bold"
         }
 
     def validate_resources(self):
@@ -18,6 +21,9 @@ class ResourceManager:
         for name, path in self.paths.items():
             if not os.path.exists(path):
                 missing_files.append(f"{name}: {path}")
+        for name, family in self.fonts.items():
+            if font_registry.resolve(family) is None:
+                missing_files.append(f"{name}: {family}")
         
         if missing_files:
             error_msg = "다음 파일들을 찾을 수 없습니다:\n" + "\n".join(missing_files)
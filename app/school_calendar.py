@@ -0,0 +1,147 @@
+"""
+학교 달력 (수업일 계산)
+
+주말, 대한민국 공휴일, 학교 휴업일(개교기념일, 재량휴업일 등)을 합쳐 여러 해의 수업일 비트맵을
+한 번 만들어 두고 프로세스 전체에서 공유합니다.
+
+- 기간 안의 수업일 수: 누적합 배열로 O(1)
+- 다음 수업일: 수업일 위치 배열에서 이진 탐색으로 O(log n)
+
+학교 휴업일은 프로젝트 루트의 school_calendar.json에 설정합니다. (파일 수정 시각이 바뀌면 달력을 다시 만듦)
+
+    {
+        "annual_closure_days": {"06-10": "개교기념일"},
+        "closure_days": {"2025-05-02": "재량휴업일"}
+    }
+"""
+import json
+import os
+import threading
+from datetime import date
+from pathlib import Path
+
+import holidays
+import numpy as np
+
+CALENDAR_CONFIG_PATH = Path(__file__).parent.parent.absolute() / "school_calendar.json"
+
+# 요청한 날짜가 범위를 벗어나면 앞뒤로 이만큼 여유를 두고 다시 만듦
+YEAR_MARGIN = 2
+
+
+def load_closure_config(path=CALENDAR_CONFIG_PATH):
+    """학교 휴업일 설정을 읽습니다. 파일이 없으면 빈 설정을 반환합니다."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        config = {}
+    return config.get("closure_days", {}), config.get("annual_closure_days", {})
+
+
+def _config_stamp(path):
+    """설정 파일의 수정 시각. 파일이 없으면 None."""
+    try:
+        return os.path.getmtime(path)
+    except FileNotFoundError:
+        return None
+
+
+class SchoolCalendar:
+    """first_year 1월 1일 ~ last_year 12월 31일의 수업일 비트맵."""
+
+    def __init__(self, first_year, last_year, closure_days=None, annual_closure_days=None):
+        self.first_year = first_year
+        self.last_year = last_year
+        self.origin = np.datetime64(f"{first_year}-01-01", "D")
+        end = np.datetime64(f"{last_year + 1}-01-01", "D")
+        days = np.arange(self.origin, end)
+
+        is_school_day = np.is_busday(days)  # 월~금
+        off_days = set(holidays.KR(years=range(first_year, last_year + 1)).keys())
+        off_days.update(date.fromisoformat(day) for day in (closure_days or {}))
+        for month_day in annual_closure_days or {}:
+            for year in range(first_year, last_year + 1):
+                try:
+                    off_days.add(date.fromisoformat(f"{year}-{month_day}"))
+                except ValueError:  # 윤년이 아닌 해의 02-29 등
+                    continue
+        off_index = (np.array(sorted(off_days), dtype="datetime64[D]") - self.origin).astype(np.int64)
+        off_index = off_index[(off_index >= 0) & (off_index < len(days))]
+        is_school_day[off_index] = False
+
+        self.is_school_day = is_school_day
+        # school_day_counts[i] = origin부터 i일 전까지의 수업일 수
+        self.school_day_counts = np.concatenate(([0], np.cumsum(is_school_day, dtype=np.int32)))
+        self.school_day_positions = np.flatnonzero(is_school_day)
+
+    def _index(self, day):
+        return int((np.datetime64(day, "D") - self.origin).astype(np.int64))
+
+    def is_school_day_on(self, day):
+        return bool(self.is_school_day[self._index(day)])
+
+    def count_school_days(self, start, end):
+        """start ~ end(양 끝 포함) 사이의 수업일 수를 반환합니다."""
+        if end < start:
+            return 0
+        return int(self.school_day_counts[self._index(end) + 1] - self.school_day_counts[self._index(start)])
+
+    def next_school_days(self, days):
+        """
+        각 날짜와 같거나 그 뒤의 첫 수업일을 구합니다.
+
+        Args:
+            days: datetime64[D] 배열
+
+        Returns:
+            ndarray: datetime64[D] 배열
+        """
+        index = (np.asarray(days, dtype="datetime64[D]") - self.origin).astype(np.int64)
+        found = np.searchsorted(self.school_day_positions, index, side="left")
+        return self.origin + self.school_day_positions[found]
+
+    def next_school_day(self, day, include_today=False):
+        """day 다음(include_today면 day 포함) 첫 수업일을 date로 반환합니다."""
+        start = np.datetime64(day, "D") + (0 if include_today else 1)
+        return self.next_school_days([start])[0].item()
+
+
+_calendar = None
+_calendar_stamp = None
+_calendar_lock = threading.Lock()
+
+
+def _covers(calendar, first, last):
+    return calendar is not None and calendar.first_year <= first.year and last.year + 1 <= calendar.last_year
+
+
+def get_school_calendar(first=None, last=None):
+    """
+    first ~ last 날짜(및 다음 수업일 탐색 여유)를 포함하는 공유 달력을 반환합니다.
+
+    범위를 벗어난 날짜가 요청되면 앞뒤로 YEAR_MARGIN년을 더해 다시 만듭니다.
+    school_calendar.json의 수정 시각이 바뀌었으면 휴업일 설정을 다시 읽어 새로 만듭니다.
+    """
+    global _calendar, _calendar_stamp
+    first = first or date.today()
+    last = last or first
+    stamp = _config_stamp(CALENDAR_CONFIG_PATH)
+    calendar = _calendar
+    if _covers(calendar, first, last) and _calendar_stamp == stamp:
+        return calendar
+
+    with _calendar_lock:
+        calendar = _calendar
+        if _calendar_stamp != stamp:
+            calendar = None
+        if not _covers(calendar, first, last):
+            first_year = min(first.year, date.today().year) - YEAR_MARGIN
+            last_year = max(last.year, date.today().year) + YEAR_MARGIN
+            if calendar is not None:
+                first_year = min(first_year, calendar.first_year)
+                last_year = max(last_year, calendar.last_year)
+            closure_days, annual_closure_days = load_closure_config(CALENDAR_CONFIG_PATH)
+            calendar = _calendar = SchoolCalendar(first_year, last_year, closure_days, annual_closure_days)
+            _calendar_stamp = stamp
+        return calendar
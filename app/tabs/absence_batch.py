@@ -0,0 +1,72 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+from app.absence_batch import collect_export_files, parse_teacher_names, run_batch, build_batch_zip, iter_class_sheets
+from app.absence_excel_processing import REPORT_TYPES
+from app.absence_summary import write_summary_workbook
+
+
+def render():
+    st.write("### 전체 학급 일괄 처리")
+    st.info(
+        "학급별 나이스 엑셀 파일 여러 개 또는 ZIP 파일을 업로드하세요.\n\n"
+        "학년/반은 파일 이름(예: '1학년 3반.xlsx', '1-3.xlsx')에서 자동으로 인식합니다."
+    )
+
+    uploaded_files = st.file_uploader(
+        "엑셀/ZIP 파일 업로드",
+        type=["xlsx", "xls", "zip"],
+        accept_multiple_files=True,
+        key="batch_file_uploader"
+    )
+    teacher_text = st.text_area(
+        "학급별 담임교사 성명 (선택)",
+        placeholder="1-1 홍길동\n1-2 김철수",
+        key="batch_teacher_names"
+    )
+
+    if st.button("일괄 생성", key="batch_generate_button", disabled=not uploaded_files):
+        files = collect_export_files([(f.name, f.getvalue()) for f in uploaded_files])
+        if not files:
+            st.error("처리할 엑셀 파일이 없습니다.")
+            return
+
+        month = datetime.now().month
+        with st.spinner(f"{len(files)}개 학급 파일을 처리하는 중..."):
+            results = run_batch(files, parse_teacher_names(teacher_text), month)
+
+        st.session_state['batch_summary'] = pd.DataFrame([
+            {
+                "파일": r["file_name"],
+                "학년": r["grade"],
+                "반": r["class_name"],
+                **{t: r["counts"].get(t, 0) for t in REPORT_TYPES},
+                "오류": r["error"] or ""
+            }
+            for r in results
+        ])
+        st.session_state['batch_zip'] = build_batch_zip(results)
+        st.session_state['batch_summary_xlsx'] = write_summary_workbook(iter_class_sheets(results, files))
+        st.session_state['batch_month'] = month
+
+    if 'batch_zip' in st.session_state:
+        summary = st.session_state['batch_summary']
+        st.dataframe(summary, hide_index=True)
+        failed = summary[summary["오류"] != ""]
+        if not failed.empty:
+            st.warning(f"{len(failed)}개 파일을 처리하지 못했습니다. 오류 내용을 확인하세요.")
+
+        st.download_button(
+            label="전체 학급 결석신고서 ZIP 다운로드",
+            data=st.session_state['batch_zip'],
+            file_name=f"결석신고서({st.session_state['batch_month']}월).zip",
+            mime="application/zip",
+            key="batch_zip_download"
+        )
+        st.download_button(
+            label="전체 학급 결석 요약 엑셀 다운로드",
+            data=st.session_state['batch_summary_xlsx'],
+            file_name=f"결석 요약({st.session_state['batch_month']}월).xlsx",
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            key="batch_summary_download"
+        )
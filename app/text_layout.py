@@ -0,0 +1,137 @@
+"""
+양식 이미지에 넣을 텍스트 배치 (폰트 크기 맞춤, 줄바꿈)
+
+글자별 폭(advance)을 폰트마다 캐시해 두고 더해서 텍스트 폭을 구합니다.
+- 폰트 크기: 최소~최대 크기 사이를 이진 탐색
+- 줄바꿈: 텍스트를 한 번만 훑으며 글자 단위로 나누고, 줄 수를 넘으면 마지막 줄을 말줄임표로 자름
+"""
+import weakref
+
+from app.font_registry import font_registry
+
+ELLIPSIS = "..."
+
+# 처음 쓰는 폰트에서 미리 재 둘 글자 (숫자, 영문, 기호)
+_PRELOAD_CHARS = "".join(chr(code) for code in range(0x20, 0x7F))
+
+# 폰트별 {글자: 폭} (폰트 객체가 사라지면 함께 정리)
+_advance_tables = weakref.WeakKeyDictionary()
+
+
+def _advance_table(font):
+    table = _advance_tables.get(font)
+    if table is None:
+        table = {char: font.getlength(char) for char in _PRELOAD_CHARS}
+        _advance_tables[font] = table
+    return table
+
+
+def _advance(table, font, char):
+    width = table.get(char)
+    if width is None:
+        width = table[char] = font.getlength(char)
+    return width
+
+
+def text_width(text, font):
+    """캐시된 글자 폭을 더해 텍스트 폭(px)을 구합니다."""
+    table = _advance_table(font)
+    return sum(_advance(table, font, char) for char in text)
+
+
+def _truncate(line, font, max_width, ellipsis):
+    """line 뒤에 ellipsis를 붙여도 max_width를 넘지 않도록 자릅니다."""
+    table = _advance_table(font)
+    limit = max_width - text_width(ellipsis, font)
+    width = 0.0
+    for index, char in enumerate(line):
+        width += _advance(table, font, char)
+        if width > limit:
+            return line[:index].rstrip() + ellipsis
+    return line.rstrip() + ellipsis
+
+
+def wrap_lines(text, font, max_width, max_lines=None, ellipsis=ELLIPSIS):
+    """
+    텍스트를 max_width에 맞게 글자 단위로 줄바꿈합니다. (줄바꿈 문자는 그대로 줄을 나눔)
+    끝의 줄바꿈 문자는 줄로 세지 않고, 폭 때문에 나뉜 줄의 앞 공백만 버립니다.
+
+    Args:
+        max_lines (int): 최대 줄 수. 넘치면 마지막 줄 끝을 ellipsis로 바꿈
+
+    Returns:
+        list: 줄 목록
+    """
+    table = _advance_table(font)
+    lines = []
+    overflow = False
+    # text_area 입력은 줄바꿈으로 끝나는 경우가 많으므로 끝의 빈 줄은 버림
+    for paragraph in str(text or "").rstrip("\n").split("\n"):
+        start = 0
+        width = 0.0
+        for index, char in enumerate(paragraph):
+            if index == start and start > 0 and char == " ":
+                # 폭 때문에 나뉜 줄의 앞 공백은 버림 (문단 첫 줄의 들여쓰기는 유지)
+                start = index + 1
+                continue
+            advance = _advance(table, font, char)
+            if width + advance > max_width and index > start:
+                lines.append(paragraph[start:index])
+                start = index
+                width = 0.0
+                if max_lines and len(lines) >= max_lines:
+                    overflow = True
+                    break
+                if char == " ":
+                    start = index + 1
+                    continue
+            width += advance
+        if overflow:
+            break
+        lines.append(paragraph[start:])
+        if max_lines and len(lines) > max_lines:
+            overflow = True
+            break
+
+    if overflow:
+        lines = lines[:max_lines]
+        lines[-1] = _truncate(lines[-1], font, max_width, ellipsis)
+    return lines
+
+
+def fit_font(text, max_width, font_family, max_size, min_size, max_lines=1):
+    """
+    텍스트가 max_lines 줄 안에 들어가는 가장 큰 폰트를 이진 탐색으로 찾습니다.
+    최소 크기로도 넘치면 최소 크기 폰트를 반환합니다.
+    """
+    low, high = min_size, max_size
+    while low < high:
+        size = (low + high + 1) // 2
+        if len(wrap_lines(text, font_registry.get(font_family, size), max_width)) <= max_lines:
+            low = size
+        else:
+            high = size - 1
+    return font_registry.get(font_family, low)
+
+
+def layout_text(text, max_width, font_family, max_size, min_size, fit_lines=1, max_lines=None, ellipsis=ELLIPSIS):
+    """
+    폰트 크기를 맞춘 뒤 줄바꿈합니다.
+
+    Args:
+        fit_lines (int): 폰트를 줄일 때 기준 줄 수 (이 줄 수에 들어갈 때까지 줄임)
+        max_lines (int): 줄바꿈 후 최대 줄 수 (기본값 fit_lines)
+
+    Returns:
+        tuple: (폰트, 줄 목록)
+    """
+    font = fit_font(text, max_width, font_family, max_size, min_size, fit_lines)
+    return font, wrap_lines(text, font, max_width, max_lines or fit_lines, ellipsis)
+
+
+def draw_lines(draw, xy, lines, font, line_height, fill="black"):
+    """줄 목록을 xy부터 line_height 간격으로 그립니다. 그린 줄 수를 반환합니다."""
+    x, y = xy
+    for index, line in enumerate(lines):
+        draw.text((x, y + index * line_height), line, font=font, fill=fill)
+    return len(lines)
@@ -0,0 +1,230 @@
+"""
+결석신고서 처리 파이프라인 벤치마크
+
+나이스 출결 엑셀과 같은 형태(병합된 번호/성명 셀, 여러 형태의 출결구분, '…로 인한' 사유)의
+합성 데이터를 만들어 단계별 처리 시간을 측정하고 JSON으로 저장합니다.
+
+사용법 (저장소 루트에서):
+    python -m benchmarks.absence_pipeline --sizes 10 1000 10000 100000 --output bench.json
+    python -m benchmarks.absence_pipeline --compare bench_before.json bench.json
+"""
+import argparse
+import io
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+from openpyxl import Workbook
+
+from app.absence_excel_processing import (
+    calculate_confirmation_dates,
+    merge_consecutive_absences,
+    read_absence_rows,
+)
+from app.absence_pdf import build_absence_pdf_reports
+from app.absence_report import build_absence_reports
+
+HEADER = ['순', '번호', '성명', '일자', '출결구분', '사유']
+
+# 실제 나이스 엑셀에서 볼 수 있는 출결구분 표기 (가중치)
+ATTENDANCE_TYPES = [
+    ('출석', 40),
+    ('질병결석', 12),
+    ('질병 결석', 4),
+    ('출석인정결석', 12),
+    ('기타결석', 8),
+    (' 기타결석 ', 2),
+    ('미인정결석', 4),
+    ('질병지각', 6),
+    ('미인정조퇴', 6),
+    ('출석인정조퇴', 4),
+]
+
+REASONS = [
+    '감기로 인한 결석',
+    '장염으로 인한 결석',
+    '병원 진료로 인한 결석',
+    '교외체험학습으로 인한 출석인정',
+    '경조사로 인한 출석인정',
+    '가사 조력으로 인한',
+    '가정 사정',
+    None,
+]
+
+
+def generate_neis_workbook(rows, seed=0, rows_per_student=40, start=date(2025, 3, 3)):
+    """
+    나이스 학급별 출결현황 형태의 합성 엑셀 파일(bytes)을 만듭니다.
+
+    학생마다 연속된 행 묶음을 만들고 번호/성명 셀은 병합합니다. 날짜는 평일만 사용하며
+    같은 출결구분이 며칠 이어지는 경우도 섞여 있습니다.
+    """
+    rng = random.Random(seed)
+    types, weights = zip(*ATTENDANCE_TYPES)
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("출결현황")
+    sheet.append(HEADER)
+
+    written = 0
+    excel_row = 2
+    number = 0
+    while written < rows:
+        number += 1
+        block = min(rows_per_student, rows - written)
+        day = start + timedelta(days=rng.randrange(5))
+        attendance_type = rng.choices(types, weights)[0]
+        for i in range(block):
+            # 대부분은 다음 평일, 가끔은 며칠 건너뜀
+            day += timedelta(days=1 if rng.random() < 0.7 else rng.randint(2, 6))
+            while day.weekday() >= 5:
+                day += timedelta(days=1)
+            if rng.random() < 0.4:
+                attendance_type = rng.choices(types, weights)[0]
+            sheet.append([
+                written + 1,
+                number if i == 0 else None,
+                f"학생{number:04d}" if i == 0 else None,
+                day.strftime('%Y.%m.%d.'),
+                attendance_type,
+                rng.choice(REASONS),
+            ])
+            written += 1
+        if block > 1:
+            sheet.merged_cells.add(f"B{excel_row}:B{excel_row + block - 1}")
+            sheet.merged_cells.add(f"C{excel_row}:C{excel_row + block - 1}")
+        excel_row += block
+
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    return buffer.getvalue()
+
+
+def _time(function, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - started)
+    return result, timings
+
+
+def run_benchmark(rows, repeat=3, max_report_records=2000, seed=0):
+    """
+    한 데이터 크기에 대해 단계별 시간을 측정합니다.
+
+    Returns:
+        list: 단계별 측정 결과 사전
+    """
+    workbook_bytes = generate_neis_workbook(rows, seed=seed)
+    results = []
+
+    def record(stage, timings, **extra):
+        results.append({
+            "rows": rows,
+            "stage": stage,
+            "min_seconds": min(timings),
+            "mean_seconds": sum(timings) / len(timings),
+            "repeat": len(timings),
+            **extra,
+        })
+
+    # 1. 엑셀 읽기 (병합 해제, 출결구분/사유 정규화, 결석 행 필터링, 날짜 변환)
+    def ingest():
+        data = read_absence_rows(io.BytesIO(workbook_bytes))
+        data['일자'] = pd.to_datetime(data['일자'], format='%Y.%m.%d', errors='coerce')
+        return data
+
+    filtered, timings = _time(ingest, repeat)
+    record("ingest", timings, workbook_bytes=len(workbook_bytes), output_rows=len(filtered))
+
+    # 2. 연속 결석 기간 병합
+    merged, timings = _time(lambda: merge_consecutive_absences(filtered), repeat)
+    record("run_detection", timings, output_rows=len(merged))
+
+    # 3. 결석확인일 계산
+    _, timings = _time(lambda: calculate_confirmation_dates(merged['결석종료일']), repeat)
+    record("confirmation_dates", timings, output_rows=len(merged))
+    merged = merged.assign(결석확인일=calculate_confirmation_dates(merged['결석종료일']))
+
+    # 4. 문서 생성 (페이지 수가 너무 커지지 않도록 레코드 수 제한)
+    report_data = merged.head(max_report_records)
+    reports, timings = _time(lambda: build_absence_reports(report_data, '1', '1', '담임교사'), repeat)
+    record("docx", timings, records=len(report_data), output_bytes=sum(len(b) for _, b in reports.values()))
+
+    reports, timings = _time(lambda: build_absence_pdf_reports(report_data, '1', '1', '담임교사'), repeat)
+    record("pdf", timings, records=len(report_data), output_bytes=sum(len(b) for _, b in reports.values()))
+
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(before_path, after_path, threshold=0.2):
+    """두 결과 파일을 비교해 threshold 이상 느려진 단계를 출력하고, 있으면 1을 반환합니다."""
+    with open(before_path, encoding="utf-8") as f:
+        before = {(r["rows"], r["stage"]): r for r in json.load(f)["results"]}
+    with open(after_path, encoding="utf-8") as f:
+        after = {(r["rows"], r["stage"]): r for r in json.load(f)["results"]}
+
+    regressions = 0
+    for key in sorted(before.keys() & after.keys()):
+        old, new = before[key]["min_seconds"], after[key]["min_seconds"]
+        change = (new - old) / old if old else 0.0
+        flag = "  <-- 느려짐" if change > threshold else ""
+        if flag:
+            regressions += 1
+        print(f"{key[0]:>8} rows  {key[1]:<20} {old:9.4f}s -> {new:9.4f}s  ({change:+.1%}){flag}")
+    return 1 if regressions else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="결석신고서 처리 파이프라인 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 10000, 100000], help="엑셀 행 수")
+    parser.add_argument("--repeat", type=int, default=3, help="단계별 반복 측정 횟수")
+    parser.add_argument("--max-report-records", type=int, default=2000, help="DOCX/PDF 생성에 사용할 최대 결석 건수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일 (기본값: 표준 출력)")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="두 결과 파일 비교")
+    parser.add_argument("--threshold", type=float, default=0.2, help="--compare에서 느려짐으로 볼 비율")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(*args.compare, threshold=args.threshold)
+
+    results = []
+    for rows in args.sizes:
+        print(f"{rows} rows 측정 중...", file=sys.stderr)
+        results.extend(run_benchmark(rows, args.repeat, args.max_report_records, args.seed))
+
+    report = {
+        "commit": _git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import streamlit as st
+from app.sidebar_manager import SidebarManager
+from app.absence_analytics import UNEXCUSED_TYPE, absence_rollups, current_school_year_start
+
+# 페이지 설정
+st.set_page_config(
+    page_title="결석 통계",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# 사이드바 렌더링
+sidebar = SidebarManager()
+sidebar.render_sidebar()
+
+st.markdown("<h1 style='text-align: center;'>결석 통계</h1>", unsafe_allow_html=True)
+st.markdown("---")
+
+st.info(
+    "결석신고서 페이지와 일괄 처리에서 올린 나이스 파일이 학급별로 자동 집계됩니다.\n\n"
+    "같은 기간의 파일을 다시 올리면 최신 내용으로 바뀌며, 결석 기간은 시작일이 속한 달로 집계됩니다."
+)
+
+months = absence_rollups.months()
+if not months:
+    st.warning("집계된 결석 데이터가 없습니다. 결석신고서 페이지에서 나이스 엑셀 파일을 먼저 올려주세요.")
+    st.stop()
+
+# 조회 조건
+col1, col2, col3 = st.columns(3)
+with col1:
+    grade = st.selectbox("학년", ["전체", "1", "2", "3"], format_func=lambda g: g if g == "전체" else f"{g}학년")
+with col2:
+    class_name = st.selectbox(
+        "반", ["전체"] + [str(i) for i in range(1, 13)],
+        format_func=lambda c: c if c == "전체" else f"{c}반",
+        disabled=grade == "전체"
+    )
+with col3:
+    if len(months) > 1:
+        default_start = next((m for m in months if m >= current_school_year_start()), months[0])
+        start_month, end_month = st.select_slider(
+            "기간", options=months, value=(default_start, months[-1])
+        )
+    else:
+        start_month = end_month = months[0]
+        st.text_input("기간", value=months[0], disabled=True)
+
+grade = None if grade == "전체" else grade
+class_name = None if grade is None or class_name == "전체" else class_name
+
+# 미인정 결석 기준
+col1, col2 = st.columns(2)
+with col1:
+    threshold = st.number_input(f"{UNEXCUSED_TYPE} 기준 일수", min_value=1, value=10, step=1)
+with col2:
+    warning_percent = st.slider("주의 표시 기준 (%)", min_value=50, max_value=100, value=80, step=5)
+
+near = absence_rollups.near_threshold(
+    threshold, warning_percent / 100, grade, class_name, start_month, end_month
+)
+st.write(f"### {UNEXCUSED_TYPE} 기준 근접 학생")
+if near.empty:
+    st.success(f"{UNEXCUSED_TYPE}이 기준의 {warning_percent}% 이상인 학생이 없습니다.")
+else:
+    st.dataframe(near, hide_index=True, use_container_width=True)
+
+tab_students, tab_classes, tab_months = st.tabs(["학생별", "학급별", "월별"])
+
+with tab_students:
+    students = absence_rollups.student_totals(grade, class_name, start_month, end_month)
+    st.dataframe(students, hide_index=True, use_container_width=True)
+
+with tab_classes:
+    classes = absence_rollups.class_totals(grade, start_month, end_month)
+    st.dataframe(classes, hide_index=True, use_container_width=True)
+
+with tab_months:
+    monthly = absence_rollups.monthly_totals(grade, class_name)
+    monthly = monthly[(monthly["월"] >= start_month) & (monthly["월"] <= end_month)]
+    st.bar_chart(monthly.set_index("월"))
+    st.dataframe(monthly, hide_index=True, use_container_width=True)
+
+# 푸터
+st.markdown("---")
+st.markdown("<div style='text-align: right;'>제작자: 박기윤</div>", unsafe_allow_html=True)
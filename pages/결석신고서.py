@@ -4,7 +4,16 @@ from pathlib import Path
 import os
 from openpyxl.utils import get_column_letter
 import openpyxl.cell.cell
-from app.absence_excel_processing import process_excel
+from app.absence_excel_processing import load_absence_data, report_rows
+from app.absence_analytics import absence_rollups
+from app.absence_cache import processed_data_cache
+from app.absence_store import processed_data_store
+from app.absence_index import STATUS_ISSUED, issued_report_index
+from app.absence_report import TEMPLATE_DIR, TEMPLATE_FILES, build_absence_reports, build_reports_zip
+from app.absence_pdf import build_absence_pdf_reports
+from app.absence_selection import DISPLAY_COLUMNS, PAGE_SIZES, RowSelection, display_frame, filter_runs, page_slice
+from app.absence_summary import iter_summary_rows, write_summary_workbook
+from app.tabs import absence_batch
 
 # 페이지 설정
 st.set_page_config(
@@ -33,38 +42,12 @@ sidebar = SidebarManager()
 sidebar.render_sidebar()
 
 import pandas as pd
-from datetime import datetime, timedelta
-from docx import Document
-from docx.shared import Pt
-import tempfile
+from datetime import datetime
 import base64
 from openpyxl import load_workbook
 import logging
-
-# 결석확인일 계산 함수 추가
-def calculate_confirmation_date(end_date):
-    """결석종료일로부터 5일 이내의 평일을 찾아 반환"""
-    # datetime 객체로 변환
-    if isinstance(end_date, str):
-        try:
-            end_date = datetime.strptime(end_date, '%Y-%m-%d')
-        except ValueError:
-            try:
-                end_date = datetime.strptime(end_date, '%Y.%m.%d')
-            except ValueError:
-                return datetime.now().strftime('%Y.%m.%d')  # 기본값
-    
-    # 5일 이내의 날짜 중 평일(월-금) 찾기
-    for i in range(1, 6):
-        check_date = end_date + timedelta(days=i)
-        # 평일이면 (0=월요일, 6=일요일)
-        if check_date.weekday() < 5:
-            return check_date.strftime('%Y.%m.%d')
-    
-    # 5일 이내에 평일이 없으면 종료일로부터 다음 월요일
-    while (end_date + timedelta(days=1)).weekday() != 0:
-        end_date = end_date + timedelta(days=1)
-    return (end_date + timedelta(days=1)).strftime('%Y.%m.%d')
+import sqlite3
+import uuid
 
 # 배포 환경에서의 경로 처리
 if os.getenv('STREAMLIT_SERVER_PATH'):  # Streamlit Cloud 환경인 경우
@@ -72,15 +55,57 @@ if os.getenv('STREAMLIT_SERVER_PATH'):  # Streamlit Cloud 환경인 경우
 else:
     ROOT_DIR = Path(__file__).parent.parent.absolute()  # 로컬 환경
 
-# 템플릿 디렉토리 경로 설정
-TEMPLATE_DIR = ROOT_DIR / "templates"
 
-# 템플릿 파일 경로 설정
-TEMPLATE_FILES = {
-    "출석인정결석": TEMPLATE_DIR / "출석인정 결석계 템플릿.docx",
-    "질병결석": TEMPLATE_DIR / "질병결석계 템플릿.docx",
-    "기타결석": TEMPLATE_DIR / "기타결석계 템플릿.docx",
+def upload_owner():
+    """최근 업로드 목록을 구분하는 이 세션의 사용자 토큰 (다른 사람이 올린 파일은 목록에 보이지 않음)"""
+    return st.session_state.setdefault('upload_owner', uuid.uuid4().hex)
+
+
+def register_upload(upload_key, data, file_bytes=None, file_name=""):
+    """
+    처리된 결석 데이터를 현재 학급의 처리 결과 저장소(최근 업로드)와 결석 집계(결석 통계 페이지)에 반영합니다.
+
+    처리 결과 캐시와 별개로 (파일, 학년, 반)마다 세션에서 한 번 반영하므로, 다른 학급이나 다른 세션에서
+    이미 처리된 파일을 올려도 현재 학급에 저장/집계됩니다. (ingest는 같은 기간을 교체하므로 다시 반영해도 안전)
+    """
+    grade, class_name = st.session_state['grade'], st.session_state['class_name']
+    register_key = (upload_key, grade, class_name)
+    if st.session_state.get('registered_upload_key') == register_key:
+        return
+    if file_bytes is not None:
+        processed_data_store.save_upload(file_bytes, grade, class_name, data, file_name, upload_owner())
+    try:
+        absence_rollups.ingest(data, grade, class_name)
+    except sqlite3.Error as e:
+        logging.warning(f"Absence rollup update failed: {e}")
+        return
+    st.session_state['registered_upload_key'] = register_key
+
+
+def record_issued_runs(data):
+    """
+    결석신고서를 내려받은 결석 기간을 발급 기록에 추가합니다. (다운로드 버튼 콜백)
+
+    다음 업로드에서 새 결석 기간만 고를 수 있게 하며, 같은 선택은 형식(DOCX/PDF)이나 파일을 바꿔 여러 번
+    내려받아도 처음 한 번만 기록합니다.
+    """
+    record_key = (tuple(data.index), st.session_state['grade'], st.session_state['class_name'])
+    if st.session_state.get('issued_record_key') == record_key:
+        return
+    try:
+        issued_report_index.record(data, st.session_state['grade'], st.session_state['class_name'])
+    except sqlite3.Error as e:
+        st.session_state['issued_record_error'] = str(e)
+        return
+    st.session_state['issued_record_key'] = record_key
+
+
+# 다운로드 파일 형식
+REPORT_MIME_TYPES = {
+    "DOCX": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "PDF": "application/pdf",
 }
+XLSX_MIME_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
 
 # 템플릿 디렉토리 존재 여부 확인
 if not TEMPLATE_DIR.exists():
@@ -135,115 +160,186 @@ else:
 st.markdown("---")
 
 
-# Step 1: 정보 입력 단계
-st.write("### 정보 입력")
+# 전체 학급 일괄 처리 모드 (교무부용)
+batch_mode = st.toggle("전체 학급 일괄 처리", key="batch_mode_toggle")
 
-if 'grade' not in st.session_state:
-    st.session_state['grade'] = "1"
-if 'class_name' not in st.session_state:
-    st.session_state['class_name'] = "1"
-if 'teacher_name' not in st.session_state:
-    st.session_state['teacher_name'] = ""
-
-# 학년, 반을 한 행에 배치
-col1, col2 = st.columns(2)
-with col1:
-    grade = st.selectbox("학년", ["1학년", "2학년", "3학년"], key="grade_selectbox")[0]
-with col2:
-    class_name = st.selectbox("반", [f"{i}반" for i in range(1, 13)], key="class_selectbox").replace("반", "")
+if batch_mode:
+    absence_batch.render()
+else:
+    # Step 1: 정보 입력 단계
+    st.write("### 정보 입력")
+
+    if 'grade' not in st.session_state:
+        st.session_state['grade'] = "1"
+    if 'class_name' not in st.session_state:
+        st.session_state['class_name'] = "1"
+    if 'teacher_name' not in st.session_state:
+        st.session_state['teacher_name'] = ""
+
+    # 학년, 반을 한 행에 배치
+    col1, col2 = st.columns(2)
+    with col1:
+        grade = st.selectbox("학년", ["1학년", "2학년", "3학년"], key="grade_selectbox")[0]
+    with col2:
+        class_name = st.selectbox("반", [f"{i}반" for i in range(1, 13)], key="class_selectbox").replace("반", "")
 
-# 담임교사 성명만 입력 (결석확인일은 자동 계산)
-teacher_name = st.text_input("담임교사 성명", key="teacher_name_input")
+    # 담임교사 성명만 입력 (결석확인일은 자동 계산)
+    teacher_name = st.text_input("담임교사 성명", key="teacher_name_input")
 
-if st.button("입력 완료", key="next_step_button"):
-    st.session_state['grade'] = grade
-    st.session_state['class_name'] = class_name
-    st.session_state['teacher_name'] = teacher_name
-    st.session_state['step'] = 2
+    if st.button("입력 완료", key="next_step_button"):
+        st.session_state['grade'] = grade
+        st.session_state['class_name'] = class_name
+        st.session_state['teacher_name'] = teacher_name
+        st.session_state['step'] = 2
 
 # Step 2: 엑셀 파일 업로드 및 행 선택 단계
-if 'step' in st.session_state and st.session_state['step'] == 2:
+if not batch_mode and st.session_state.get('step') == 2:
     st.write("### 엑셀 파일 업로드 및 행 선택")
 
-    uploaded_file = st.file_uploader("엑셀 파일 업로드", type=["xlsx", "xls"], key="file_uploader")
-
-    if uploaded_file is not None:
+    # 이 세션에서 이 학급으로 올린 파일은 저장된 처리 결과를 바로 불러옴 (엑셀을 다시 읽지 않음)
+    recent_uploads = processed_data_store.recent(
+        upload_owner(), st.session_state['grade'], st.session_state['class_name']
+    )
+    recent_entry = None
+    if recent_uploads:
+        recent_entry = st.selectbox(
+            "최근 업로드",
+            [None] + recent_uploads,
+            format_func=lambda entry: "새 파일 업로드" if entry is None
+            else f"{entry['file_name']} ({entry['saved_at'].replace('T', ' ')[:16]}, {entry['rows']}건)",
+            key="recent_upload_select"
+        )
+
+    uploaded_file = None
+    if recent_entry is None:
+        uploaded_file = st.file_uploader("엑셀 파일 업로드", type=["xlsx", "xls"], key="file_uploader")
+
+    if uploaded_file is not None or recent_entry is not None:
         try:
-            # 업로드된 파일을 임시 파일로 저장
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as temp_file:
-                temp_file.write(uploaded_file.getvalue())
-                temp_path = temp_file.name
-
-            # 새로운 process_excel 함수 사용
-            data = process_excel(temp_path)
-            
-            # 임시 파일 삭제
-            try:
-                os.unlink(temp_path)
-            except Exception as e:
-                logging.warning(f"임시 파일 삭제 중 오류가 발생했습니다: {e}")
-
-            # 출결구분 필터링 추가 - 질병결석, 출석인정결석, 기타결석만 유지
-            valid_attendance_types = ["질병결석", "출석인정결석", "기타결석"]
-            data = data[data['출결구분'].isin(valid_attendance_types)]
-
-            # 각 학생의 결석종료일에 따라 결석확인일 자동 계산
-            data['결석확인일'] = data['결석종료일'].apply(calculate_confirmation_date)
+            if recent_entry is not None:
+                data = processed_data_store.load(recent_entry['key'])
+                if data is None:
+                    raise ValueError("저장된 처리 결과를 불러올 수 없습니다. 파일을 다시 업로드해주세요.")
+                register_upload(recent_entry['key'], data)
+            else:
+                # 같은 파일이면 캐시된 처리 결과를 사용 (재실행마다 엑셀을 다시 읽지 않음)
+                file_bytes = uploaded_file.getvalue()
+                data = processed_data_cache.get_or_process(
+                    file_bytes,
+                    lambda file_bytes: processed_data_store.get_or_process(
+                        file_bytes,
+                        st.session_state['grade'],
+                        st.session_state['class_name'],
+                        load_absence_data,
+                        uploaded_file.name
+                    )
+                )
+                register_upload(processed_data_cache.make_key(file_bytes), data, file_bytes, uploaded_file.name)
+
+            # 미인정결석은 결석 통계에만 반영하고 결석신고서 대상에서는 제외
+            data = report_rows(data)
+
+            # 누적 NEIS 파일을 다시 올린 경우 이미 결석신고서를 발급한 결석 기간은 기본으로 제외
+            run_status = issued_report_index.run_status(
+                data, st.session_state['grade'], st.session_state['class_name']
+            )
+            issued_count = int((run_status == STATUS_ISSUED).sum())
+            exclude_issued = st.checkbox(
+                "이미 발급한 결석 기간 제외",
+                value=True,
+                key="exclude_issued_runs",
+                help="같은 학생, 출결구분, 기간, 사유로 결석신고서를 만든 적이 있는 결석은 표시하지 않습니다."
+            )
+            if issued_count:
+                st.caption(f"이미 결석신고서를 발급한 결석 기간: {issued_count}건")
+            data = data.assign(발급상태=run_status)
+            if exclude_issued:
+                data = data[run_status != STATUS_ISSUED]
 
             # 데이터 검증 및 표시
-            if data.empty:
+            if data.empty and issued_count:
+                st.success("새로 발급할 결석 기간이 없습니다.")
+            elif data.empty:
                 st.error("처리할 데이터가 없습니다. 질병결석, 출석인정결석, 기타결석 데이터가 있는지 확인하세요.")
             else:
                 st.session_state['processed_data'] = data
-                
+
+                # 선택 상태는 행 인덱스 집합으로 유지 (재실행, 페이지 이동, 필터 변경에도 유지)
+                selection = st.session_state.setdefault('absence_selection', RowSelection())
+                selection.reset_for(recent_entry['key'] if recent_entry is not None else uploaded_file.file_id)
+
                 # 각 출결구분별로 데이터 분리
                 attendance_types = data['출결구분'].unique()
                 st.write("### 결석 신고서 선택")
                 st.info("결석신고서를 생성할 학생을 선택해주세요.")
-                
-                all_selected_indices = []  # 모든 선택된 인덱스를 저장할 리스트
-                
+
+                # 번호, 기간, 사유로 거르기 (모든 탭에 적용)
+                col1, col2, col3, col4 = st.columns([2, 2, 2, 1])
+                with col1:
+                    numbers = st.multiselect("번호", sorted(data['번호'].unique()), key="filter_numbers")
+                with col2:
+                    date_range = st.date_input("기간", value=(), key="filter_dates")
+                with col3:
+                    reason_text = st.text_input("사유 검색", key="filter_reason")
+                with col4:
+                    page_size = st.selectbox("페이지당 행 수", PAGE_SIZES, key="page_size")
+                filtered = filter_runs(
+                    data, numbers, date_range if len(date_range) == 2 else None, reason_text.strip()
+                )
+
                 # 탭 생성
                 tabs = st.tabs([f"{attendance_type}" for attendance_type in attendance_types])
-                
+
                 for tab, attendance_type in zip(tabs, attendance_types):
                     with tab:
-                        type_data = data[data['출결구분'] == attendance_type].copy()
-                        # '선택' 컬럼 추가
-                        type_data['선택'] = False
-                        
-                        # 모두 선택 버튼 추가
+                        type_data = filtered[filtered['출결구분'] == attendance_type]
+
+                        # 모두 선택/선택 초기화는 현재 필터에 맞는 행 전체에 적용
                         col1, col2 = st.columns([1, 1])
                         with col1:
-                            if st.button("모두 선택", key=f"select_all_{attendance_type}"):
-                                type_data['선택'] = True
+                            st.button(
+                                "모두 선택", key=f"select_all_{attendance_type}",
+                                on_click=selection.select, args=(type_data.index.tolist(),)
+                            )
                         with col2:
-                            if st.button("선택 초기화", key=f"reset_{attendance_type}"):
-                                type_data['선택'] = False
-                        
-                        # 데이터프레임을 표시하고 선택 가능하게 만들기
+                            st.button(
+                                "선택 초기화", key=f"reset_{attendance_type}",
+                                on_click=selection.deselect, args=(type_data.index.tolist(),)
+                            )
+
+                        # 현재 페이지 행만 표로 전송
+                        page_count = page_slice(type_data, 1, page_size)[1]
+                        page = 1
+                        if page_count > 1:
+                            page = st.number_input(
+                                "페이지", min_value=1, max_value=page_count, value=1,
+                                key=f"page_{attendance_type}_{page_count}"
+                            )
+                        page_data, _ = page_slice(type_data, page, page_size)
+
                         edited_df = st.data_editor(
-                            type_data,
+                            display_frame(page_data, selection),
                             hide_index=True,
+                            disabled=DISPLAY_COLUMNS,
                             column_config={
                                 "선택": st.column_config.CheckboxColumn(
                                     "선택",
-                                    help="DOCX 파일로 추출할 행을 선택하세요",
+                                    help="결석신고서로 만들 행을 선택하세요",
                                     default=False,
                                 )
                             },
-                            key=f"editor_{attendance_type}"
+                            # 표시 행이나 선택(표 밖에서 변경)이 바뀌면 새 표로 그림
+                            key=f"editor_{attendance_type}_{hash(tuple(page_data.index))}_{selection.version}"
                         )
-                        
-                        # 선택된 행의 인덱스 수집
-                        selected_rows = edited_df[edited_df["선택"]]
-                        all_selected_indices.extend(selected_rows.index.tolist())
-                
+                        selection.apply_page(page_data.index, edited_df.index[edited_df["선택"]])
+
+                        type_selected = data.index[data['출결구분'] == attendance_type].isin(selection.selected).sum()
+                        st.caption(f"{len(type_data)}건 표시 중 · {type_selected}건 선택 · {page}/{page_count} 페이지")
+
                 # 선택된 행 저장
-                if all_selected_indices:
-                    selected_data = data.loc[all_selected_indices]
-                    st.session_state['selected_data'] = selected_data
-                    
+                selected_data = selection.selected_rows(data)
+                st.session_state['selected_data'] = selected_data
+                if not selected_data.empty:
                     # 선택된 데이터 요약 표시
                     st.write("### 선택된 데이터 요약")
                     summary_cols = st.columns(len(attendance_types))
@@ -251,9 +347,7 @@ if 'step' in st.session_state and st.session_state['step'] == 2:
                         with col:
                             count = len(selected_data[selected_data['출결구분'] == attendance_type])
                             st.metric(f"{attendance_type}", f"{count}건")
-                else:
-                    st.session_state['selected_data'] = pd.DataFrame()
-                
+
                 # 버튼 배치
                 col1, col2 = st.columns([1, 1], gap="small")
                 with col1:
@@ -265,89 +359,92 @@ if 'step' in st.session_state and st.session_state['step'] == 2:
             st.error(f"엑셀 데이터 처리 중 오류가 발생했습니다: {e}")
             logging.error(f"Excel processing error: {str(e)}")
 
-# Step 3: DOCX 생성 및 다운로드 단계
-if 'step' in st.session_state and st.session_state['step'] == 3:
-    st.write("### DOCX 생성 및 다운로드")
+# Step 3: 결석신고서(DOCX/PDF) 생성 및 다운로드 단계
+if not batch_mode and st.session_state.get('step') == 3:
+    st.write("### 결석신고서 생성 및 다운로드")
 
     processed_data = st.session_state.get('selected_data', pd.DataFrame())
 
     if not processed_data.empty:
-        for attendance_type, template_file_name in TEMPLATE_FILES.items():
-            # 모든 출결구분에 대해 동일한 필터링 적용
-            filtered_data = processed_data[processed_data['출결구분'] == attendance_type]
-
-            if filtered_data.empty:
-                continue
-
-            template_path = os.path.join(TEMPLATE_DIR, template_file_name)
-
-            if not os.path.exists(template_path):
-                st.error(f"템플릿 파일을 찾을 수 없습니다: {template_file_name}")
-                continue
-
-            output_docx = tempfile.NamedTemporaryFile(delete=False, suffix='.docx')
-
-            # 템플릿 파일 불러오기
-            master_doc = Document(template_path)
-
-            for idx, data_row in filtered_data.iterrows():
-                # 각 학생의 데이터를 템플릿에 적용하여 새로운 문서에 추가
-                temp_doc = Document(template_path)
-                replacements = {
-                    "{1}": str(st.session_state['grade']),
-                    "{2}": str(st.session_state['class_name']),
-                    "{3}": str(int(data_row['번호'])),
-                    "{성명}": str(data_row['성명']),
-                    "{결석사유}": str(data_row['사유']),
-                    "{결석시작일}": str(data_row['결석시작일']),
-                    "{결석종료일}": str(data_row['결석종료일']),
-                    "{결석일수}": str(data_row['결석일수']),
-                    "{결석확인일}": str(data_row['결석확인일']),
-                    "{담임교사 성명}": str(st.session_state['teacher_name'])
-                }
-
-                # 텍스트 치환 함수 수정
-                def replace_text_in_paragraph(paragraph, replacements):
-                    for run in paragraph.runs:
-                        text = run.text
-                        for key, value in replacements.items():
-                            if key in text:
-                                text = text.replace(key, value)
-                        run.text = text
-
-                # 문서 내 텍스트 치환
-                for paragraph in temp_doc.paragraphs:
-                    replace_text_in_paragraph(paragraph, replacements)
-
-                # 표 안의 데이터 치환
-                for table in temp_doc.tables:
-                    for row in table.rows:
-                        for cell in row.cells:
-                            for paragraph in cell.paragraphs:
-                                replace_text_in_paragraph(paragraph, replacements)
-
-                # 수정된 템플릿 내용을 통합 문서에 추가
-                for element in temp_doc.element.body:
-                    master_doc.element.body.append(element)
-
-            # 마지막에 첫 번째 템플릿 페이지 제거
-            if len(master_doc.element.body) > 1:
-                master_doc.element.body.remove(master_doc.element.body[0])
-
-            # 수정된 파일 저장
-            master_doc.save(output_docx.name)
-
-            # 다운로드 버튼 레이블에 현재 달을 표시
-            current_month = datetime.now().month
-            
+        # 파일 형식 선택 (PDF는 워드 없이 바로 인쇄 가능)
+        report_format = st.radio("파일 형식", ["DOCX", "PDF"], horizontal=True, key="report_format")
+        build_reports = build_absence_reports if report_format == "DOCX" else build_absence_pdf_reports
+        mime = REPORT_MIME_TYPES[report_format]
+
+        # 템플릿 파일 존재 여부 확인 (DOCX만 템플릿 사용)
+        missing_templates = [
+            template_path.name for attendance_type, template_path in TEMPLATE_FILES.items()
+            if report_format == "DOCX"
+            and not template_path.exists()
+            and (processed_data['출결구분'] == attendance_type).any()
+        ]
+        for template_file_name in missing_templates:
+            st.error(f"템플릿 파일을 찾을 수 없습니다: {template_file_name}")
+
+        # 같은 선택으로 다시 실행될 때(다운로드 버튼 클릭 등)는 생성된 문서를 재사용
+        report_key = (
+            tuple(processed_data.index),
+            st.session_state['grade'],
+            st.session_state['class_name'],
+            st.session_state['teacher_name'],
+            datetime.now().month,
+            report_format
+        )
+        if st.session_state.get('generated_reports_key') != report_key and not missing_templates:
+            with st.spinner("결석신고서를 생성하는 중..."):
+                reports = build_reports(
+                    processed_data,
+                    st.session_state['grade'],
+                    st.session_state['class_name'],
+                    st.session_state['teacher_name']
+                )
+                st.session_state['generated_reports'] = reports
+                st.session_state['generated_reports_zip'] = build_reports_zip(reports)
+                st.session_state['generated_reports_key'] = report_key
+
+        if st.session_state.get('generated_reports_key') == report_key:
+            reports = st.session_state['generated_reports']
+            if st.session_state.get('issued_record_error'):
+                st.warning(f"발급 기록을 저장하지 못했습니다: {st.session_state.pop('issued_record_error')}")
+
             # Streamlit에서 파일 다운로드 제공
-            with open(output_docx.name, "rb") as f:
+            for attendance_type, (file_name, document_bytes) in reports.items():
                 st.download_button(
-                    label=f"{st.session_state['grade']}학년 {st.session_state['class_name']}반 {attendance_type} 결석신고서({current_month}월).docx 다운로드",
-                    data=f,
-                    file_name=f"{st.session_state['grade']}학년 {st.session_state['class_name']}반 {attendance_type} 결석신고서({current_month}월).docx",
-                    key=f"{attendance_type}_download"
+                    label=f"{file_name} 다운로드",
+                    data=document_bytes,
+                    file_name=file_name,
+                    mime=mime,
+                    key=f"{attendance_type}_download",
+                    on_click=record_issued_runs,
+                    args=(processed_data[processed_data['출결구분'] == attendance_type],)
+                )
+
+            # 모든 출결구분 문서를 한 번에 다운로드
+            st.download_button(
+                label="전체 결석신고서 ZIP 다운로드",
+                data=st.session_state['generated_reports_zip'],
+                file_name=f"{st.session_state['grade']}학년 {st.session_state['class_name']}반 결석신고서({datetime.now().month}월).zip",
+                mime="application/zip",
+                key="all_reports_download",
+                on_click=record_issued_runs,
+                args=(processed_data,)
+            )
+
+            # 선택한 결석 기간 요약 엑셀 (같은 데이터와 학급이면 재실행마다 다시 만들지 않음)
+            class_label = f"{st.session_state['grade']}학년 {st.session_state['class_name']}반"
+            summary_key = (int(pd.util.hash_pandas_object(processed_data).sum()), class_label)
+            if st.session_state.get('summary_workbook_key') != summary_key:
+                st.session_state['summary_workbook'] = write_summary_workbook(
+                    [(class_label, iter_summary_rows(processed_data))]
                 )
+                st.session_state['summary_workbook_key'] = summary_key
+            st.download_button(
+                label="결석 요약 엑셀 다운로드",
+                data=st.session_state['summary_workbook'],
+                file_name=f"{class_label} 결석 요약({datetime.now().month}월).xlsx",
+                mime=XLSX_MIME_TYPE,
+                key="summary_download"
+            )
     else:
         st.error("처리된 데이터가 없습니다. 이전 단계에서 데이터를 확인해주세요.")
 
@@ -1,13 +1,13 @@
 import streamlit as st
 from app.sidebar_manager import SidebarManager
+from app.font_registry import font_registry
+from app.field_trip_form import build_field_trip_record
+from app.form_layout import get_form_layout
 from streamlit_drawable_canvas import st_canvas
 import tempfile
 from datetime import date, timedelta
 import pandas as pd
-from PIL import Image, ImageDraw, ImageFont, ImageOps
-import numpy as np
-import datetime
-import holidays
+from PIL import Image, ImageOps
 import img2pdf
 import os
 import io
@@ -38,15 +38,9 @@ class ResourceManager:
             "신청서 양식": self.image_dir / "studywork003.png",
             "별지 양식": self.image_dir / "studywork002.png",
             "로고": self.image_dir / "logo.png",
-            "폰트": self.font_dir / "AppleGothic.ttf"
         }
-        
-        # 시스템 폰트 백업 경로
-        self.system_font_paths = [
-            "/usr/share/fonts/truetype/nanum/NanumGothic.ttf",
-            "/System/Library/Fonts/AppleGothic.ttf",
-            "C:\\Windows\\Fonts\\malgun.ttf"
-        ]
+        # 폰트는 폰트 레지스트리에서 한 번만 찾음 (fonts/AppleGothic.ttf → 시스템 폰트 순)
+        self.font_family = "gothic"
 
     @staticmethod
     def get_absolute_path():
@@ -60,12 +54,9 @@ class ResourceManager:
 
     def get_font_path(self):
         """폰트 파일 경로를 찾아 반환"""
-        if self.paths["폰트"].exists():
-            return str(self.paths["폰트"])
-        
-        for system_font in self.system_font_paths:
-            if os.path.exists(system_font):
-                return system_font
+        font_path = font_registry.resolve(self.font_family)
+        if font_path is not None:
+            return font_path
         
         st.error("폰트 파일을 찾을 수 없습니다.")
         st.info("나눔고딕 폰트를 설치하거나 fonts 디렉토리에 폰트 파일을 추가해주세요.")
@@ -74,7 +65,7 @@ class ResourceManager:
     def validate_resources(self):
         """리소스 파일 검증"""
         for name, path in self.paths.items():
-            if name != "폰트" and not path.exists():
+            if not path.exists():
                 st.error(f"{name}을(를) 찾을 수 없습니다. 경로: {path}")
                 st.stop()
         
@@ -86,7 +77,7 @@ class ResourceManager:
         st.write(f"BASE_DIR: {self.base_dir}")
         st.write(f"IMAGE_DIR: {self.image_dir}")
         st.write(f"FONT_DIR: {self.font_dir}")
-        st.write(f"사용 중인 폰트 경로: {self.font_path}")
+        st.write(f"사용 중인 폰트 경로: {font_registry.resolve(self.font_family)}")
 
 # ResourceManager 인스턴스 생성
 resources = ResourceManager()
@@ -630,10 +621,6 @@ with tabs[6]:
         </div>
     """, unsafe_allow_html=True)
 
-    # 이미지 파일 경로 설정
-    img_path = IMAGE_DIR / "studywork003.png"
-    extra_img_path = IMAGE_DIR / "studywork002.png"  # 별지 이미지
-
     # 필수 데이터 유효성 검사
     required_fields = [
         "student_name", "student_grade", "student_class", "student_number", 
@@ -645,333 +632,29 @@ with tabs[6]:
         st.error(f"다음 필수 항목이 누락되었습니다: {', '.join(missing_fields)}")
     else:
         try:
-            # 이미지 파일 존재 확인
-            if not img_path.exists():
-                st.error("신청서 양 이미지를 찾을 수 없습니다.")
-                st.stop()
-
-            # 이미지 로드 및 설정
-            image = Image.open(img_path).convert("RGBA")
-            draw = ImageDraw.Draw(image)
-            
-            # 폰트 파일 경로 설정 및 폴백 처리
-            font_paths = [
-                pathlib.Path("/Library/Fonts/AppleGothic.ttf"),  # Mac AppleGothic
-                pathlib.Path("/System/Library/Fonts/AppleGothic.ttf"),  # Mac AppleGothic 대체 경로
-                FONT_DIR / "AppleGothic.ttf",  # 프로젝트 내 폰트
-                pathlib.Path("/usr/share/fonts/truetype/nanum/NanumGothic.ttf"),  # Linux
-                pathlib.Path("C:\\Windows\\Fonts\\malgun.ttf"),  # Windows
-            ]
-            
-            font_path = None
-            for path in font_paths:
-                if path.exists():
-                    font_path = path
-                    break
-            
-            if font_path is None:
-                st.error("""
-                폰트 파일을 찾을 수 없습니다. 
-                다음 중 하나의 방법으로 해결할 수 있습니다:
-                1. Mac OS에 AppleGothic 폰트 설치
-                2. 프로젝트의 fonts 폴더에 AppleGothic.ttf 파일을 추가
-                """)
-                st.stop()
-            
-            font = ImageFont.truetype(str(font_path), size=55)
-
-            # 날짜 계산 로직 (교외체험학습)
-            start_date = st.session_state.get("start_date")
-            end_date = st.session_state.get("end_date")
-
-            today = date.today()  # 제출일
-            submit_date_formatted = today.strftime("%Y년 %m월 %d일")
-            
             try:
-                if isinstance(start_date, datetime.date) and isinstance(end_date, datetime.date):
-                    duration = (end_date - start_date).days + 1  # 시작일과 종료일 포함
-                    start_date_formatted = start_date.strftime("%Y년 %m월 %d일")
-                    end_date_formatted = end_date.strftime("%Y년 %m월 %d일")
-                else:
-                    raise ValueError("시작일과 종료일이 올바른 날짜 형식이 아닙니다.")
-            except Exception as e:
+                record = build_field_trip_record(st.session_state)
+            except ValueError as e:
                 st.error(f"날짜 계산 중 오류 발생: {e}")
                 st.stop()
 
-            # 출석인정 기간 계산 (공휴일 제외)
-            attendance_start_date = st.session_state.get("attendance_start_date")
-            attendance_end_date = st.session_state.get("attendance_end_date")
-            
-            try:
-                kr_holidays = holidays.KR(years=attendance_start_date.year)  # 해 연도의 대한민국 공휴일
-                attendance_days = [
-                    attendance_start_date + timedelta(days=i)
-                    for i in range((attendance_end_date - attendance_start_date).days + 1)
-                    if (attendance_start_date + timedelta(days=i)) not in kr_holidays
-                    and (attendance_start_date + timedelta(days=i)).weekday() < 5  # 주말 제외
-                ]
-                attendance_duration = len(attendance_days)
-                attendance_start_formatted = attendance_start_date.strftime("%Y년 %m월 %d일")
-                attendance_end_formatted = attendance_end_date.strftime("%Y년 %m월 %d일")
-            except Exception as e:
-                st.error(f"출석인정 기간 계산 중 오류 발생: {e}")
-                st.stop()
-
-            # 기본 정보 그리기
-            draw.text((750, 590), st.session_state.get("student_name", ""), fill="black", font=font)
-            draw.text((1830, 590), st.session_state.get("student_grade", "").replace('학년', ''), fill="black", font=font)
-            draw.text((2020, 590), st.session_state.get("student_class", "").replace('반', ''), fill="black", font=font)
-            draw.text((2200, 590), str(st.session_state.get("student_number", "")), fill="black", font=font)
-
-            # 교외체험학습 기간 그리기
-            draw.text((1250, 690), start_date_formatted, fill="black", font=font)
-            draw.text((1840, 690), end_date_formatted, fill="black", font=font)
-            draw.text((2400, 690), f"{duration}", fill="black", font=font)
-
-            # 출석인정 기간 그리기
-            draw.text((1250, 800), attendance_start_formatted, fill="black", font=font)
-            draw.text((1850, 800), attendance_end_formatted, fill="black", font=font)
-            draw.text((2400, 800), f"{attendance_duration}", fill="black", font=font)
-            draw.text((1250, 3350), submit_date_formatted, fill="black", font=font)  # 제출일 추가
-
-            # 학습 태에 따라 '0'의 위치 조정
-            learning_type = st.session_state.get("learning_type", "")
-            if learning_type == "가족 동반 여행":
-                draw.text((940, 875), "0", fill="black", font=font)
-            elif learning_type == "친인척 경조사 참석 및 방문":
-                draw.text((1700, 875), "0", fill="black", font=font)
-            elif learning_type == "유적 탐방":
-                draw.text((2075, 875), "0", fill="black", font=font)
-            elif learning_type == "문학 기행":
-                draw.text((2450, 875), "0", fill="black", font=font)
-            elif learning_type == "우리 문화 및 세계 문화 체험":
-                draw.text((1235, 945), "0", fill="black", font=font)
-            elif learning_type == "국토 순례":
-                draw.text((1590, 945), "0", fill="black", font=font)
-            elif learning_type == "자연 탐사":
-                draw.text((1970, 945), "0", fill="black", font=font)
-            elif learning_type == "직업 체험":
-                draw.text((2350, 945), "0", fill="black", font=font)
-            elif learning_type == "기타":
-                draw.text((2620, 945), "0", fill="black", font=font)
-            else:
-                draw.text((300, 460), "학습 태를 선택하세요", fill="red", font=font)
-
-            draw.text((580, 1050), st.session_state.get("purpose", ""), fill="black", font=font)
-            draw.text((580, 1200), st.session_state.get("destination", ""), fill="black", font=font)
-            draw.text((710, 1330), st.session_state.get("guardian_name", ""), fill="black", font=font)
-            draw.text((2150, 1330), st.session_state.get("guardian_contact", ""), fill="black", font=font)
-            draw.text((710, 1470), st.session_state.get("chaperone_name", ""), fill="black", font=font)
-            draw.text((2150, 1470), st.session_state.get("chaperone_contact", ""), fill="black", font=font)
-            draw.text((1540, 1330), st.session_state.get("guardian_relationship", ""), fill="black", font=font)
-            draw.text((1540, 1470), st.session_state.get("chaperone_relationship", ""), fill="black", font=font)
-            draw.text((2250, 3460), st.session_state.get("student_name", ""), fill="black", font=font)
-            draw.text((2250, 3600), st.session_state.get("guardian_name", ""), fill="black", font=font)
+            # 양식 레이아웃(layouts/field_trip_report.json)에 맞춰 그리기
+            image, remaining_plans = get_form_layout("field_trip_report").render(record)
+            if remaining_plans:
+                st.warning("계획이 너무 많아 일부가 보고서에 포함되지 않았습니다.")
+            st.image(image, caption='교외체험학습 신청서', width=800)
 
-            def add_signatures(image):
-                """서명 이미지를 신청서에 추가하는 헬퍼 함수"""
-                if 'student_signature_img' in st.session_state:
-                    student_signature_img = Image.fromarray(np.array(st.session_state['student_signature_img']).astype('uint8')).convert("RGBA")
-                    new_size = (int(student_signature_img.width), int(student_signature_img.height))
-                    student_signature_img = student_signature_img.resize(new_size, Image.Resampling.LANCZOS)
-                    image.paste(student_signature_img, (2400, 3450), student_signature_img)
-
-                if 'guardian_signature_img' in st.session_state:
-                    guardian_signature_img = Image.fromarray(np.array(st.session_state['guardian_signature_img']).astype('uint8')).convert("RGBA")
-                    new_size = (int(guardian_signature_img.width), int(guardian_signature_img.height))
-                    guardian_signature_img = guardian_signature_img.resize(new_size, Image.Resampling.LANCZOS)
-                    image.paste(guardian_signature_img, (2400, 3600), guardian_signature_img)
-
-            # 학습 계획 데이터 처리를 한 변수 초기화
-            x_start, y_start = 180, 1800  # 첫 번째 칸 시작 위치
-            max_y = 3150
-            font_size = 50
-            min_font_size = 30
-            extra_needed = False
-            first_section_plans = []  # 첫 번째 칸 계획
-            second_section_plans = []  # 두 번째 칸 계획
-            remaining_plans = []  # 남은 계획 (별지용)
-
-            if 'plans' in st.session_state and isinstance(st.session_state.plans, dict):
-                # 전체 계획 텍스트 생성
-                start_date = st.session_state.start_date
-                sorted_days = sorted(
-                    [(day_key, (start_date + timedelta(days=int(''.join(filter(str.isdigit, day_key))) - 1))) 
-                     for day_key in st.session_state.plans.keys()],
-                    key=lambda x: x[1]
-                )
-
-                # 전체 계획을 두 섹션으로 나누기
-                first_section_plans = []
-                second_section_plans = []
-                total_plans = []
-
-                # 모든 계획을 시간순으로 정렬하여 total_plans에 추가
-                for day_key, date in sorted_days:
-                    plans = st.session_state.plans.get(day_key, [])
-                    for i, plan in enumerate(plans):
-                        plan_data = {
-                            'day': day_key if i == 0 else '',  # 각 일차 첫 번째 항에만 일차 표시
-                            'time': plan.get('시간', ''),
-                            'location': plan.get('장소', ''),
-                            'activity': plan.get('활동내용', '')
-                        }
-                        total_plans.append(plan_data)
-
-                # 전체 계획을 두 섹션으로 나누기
-                half_length = len(total_plans) // 2
-                if len(total_plans) % 2 != 0:
-                    half_length += 1  # 홀수인 경우 첫 번째 섹션에 하나 더 할당
-
-                first_section_plans = total_plans[:half_length]
-                second_section_plans = total_plans[half_length:]
-
-                # 열 시작 위치와 줄 간격 설정
-                # 첫 번째 섹션 (왼쪽 칸) 좌표
-                x_time_first = 800    # 시간 시작 위치
-                x_location_first = 1000
-                x_activity_first = 1300
-
-                # 두 번째 섹션 (오른쪽 칸) 좌표
-                x_time_second = 1800   # 시간 시작 위치
-                x_location_second = 2000
-                x_activity_second = 2300
-
-                line_height = 70
-                current_y = y_start
-
-                # 첫 번째 섹션 그리기 (왼쪽 칸)
-                current_y = y_start
-                current_day = None
-                x_start_first = 580  # 왼쪽 칸의 시작 X좌표
-                x_start_second = 1600  # 오른쪽 칸의 시작 X좌표
-
-                for plan in first_section_plans:
-                    if current_y >= max_y:
-                        # 오른쪽 칸으로 이동
-                        current_y = y_start
-                        x_start_first = x_start_second
-                        continue
-
-                    if plan['day'] and plan['day'] != current_day:  # 새로운 일차 시작
-                        if current_y != y_start:  # 첫 번째 일차가 아닌 경우 추가 간격
-                            current_y += line_height
-                        current_day = plan['day']
-                        draw.text((x_start_first, current_y), current_day, fill="black", font=font)  # 일차를 표시
-                        current_y += line_height  # 일차 표시 후 다음 줄로
-                    
-                    # 시간/장소/활동내용을 일차와 같은 X좌표에서 시작
-                    draw.text((x_start_first, current_y), plan['time'], fill="black", font=font)
-                    draw.text((x_start_first + 220, current_y), plan['location'], fill="black", font=font)
-                    draw.text((x_start_first + 440, current_y), plan['activity'], fill="black", font=font)
-                    current_y += line_height
-
-                # 두 번째 섹션 그리기 (오른쪽 칸)
-                current_y = y_start
-                current_day = None
-                x_start_second = 1600  # 오른쪽 섹션의 시작 X좌표
-
-                for plan in second_section_plans:
-                    if current_y >= max_y:  # max_y를 초과하면 별지로 이동
-                        remaining_plans.append(plan)
-                        extra_needed = True
-                        continue
-
-                    if plan['day'] and plan['day'] != current_day:  # 새로운 일차 시작
-                        if current_y != y_start:  # 첫 번째 일차가 아닌 경우 추가 간격
-                            current_y += line_height
-                        current_day = plan['day']
-                        draw.text((x_start_second, current_y), current_day, fill="black", font=font)  # 일차를 표시
-                        current_y += line_height  # 일차 표시 후 다음 줄로
-                    
-                    # 시간/장소/활동내용을 일차와 같은 X좌표에서 시작
-                    draw.text((x_start_second, current_y), plan['time'], fill="black", font=font)
-                    draw.text((x_start_second + 220, current_y), plan['location'], fill="black", font=font)
-                    draw.text((x_start_second + 440, current_y), plan['activity'], fill="black", font=font)
-                    current_y += line_height
-
-                # 별지 필요한 경우 별지 이미지 생성
-                if extra_needed and remaining_plans:
-                    extra_image = Image.open(extra_img_path).convert("RGBA")
-                    extra_draw = ImageDraw.Draw(extra_image)
-                    
-                    # 별지 시작 위치 조정
-                    current_y = 700  # 별지 제목 아래부터 시작
-                    
-                    # 별지에는 왼쪽부터 순차적으로 작성
-                    x_day = 580
-                    x_time = 800
-                    x_location = 1000
-                    x_activity = 1200
-                    
-                    # 남은 계획 모두 별지에 작성
-                    for plan in remaining_plans:
-                        extra_draw.text((x_day, current_y), plan['day'], fill="black", font=font)
-                        extra_draw.text((x_time, current_y), plan['time'], fill="black", font=font)
-                        extra_draw.text((x_location, current_y), plan['location'], fill="black", font=font)
-                        extra_draw.text((x_activity, current_y), plan['activity'], fill="black", font=font)
-                        current_y += line_height
-                        
-                        # 별지의 끝부분에 도달하면 멈춤
-                        if current_y >= 3000:  # 별지의 최대 높이 제한
-                            st.warning("계획이 너무 많아 일부가 별지에 포함되지 않았습니다.")
-                            break
-
-                # 서명 추가 후 기본 신청서 이미지 출력
-                add_signatures(image)
-                st.image(image, caption='교외체험학습 신청서', width=800)
-
-                # 별지 생성 및 사진 추가
+            # 별지에 학습 활동 사진 추가 (최대 4장)
+            photos = []
+            for idx, photo in enumerate(st.session_state.get('uploaded_photos', [])[:4]):
                 try:
-                    extra_image = Image.open(extra_img_path).convert("RGBA")
-                    extra_draw = ImageDraw.Draw(extra_image)
-                    
-                    # 별지 크기 가져오기
-                    page_width, page_height = extra_image.size
-                    
-                    # 4등분 역 계산 (여백 고려)
-                    margin = 50  # 여백
-                    section_width = (page_width - (3 * margin)) // 2
-                    section_height = (page_height - (3 * margin)) // 2
-                    
-                    # 각 섹션의 시작 좌표
-                    sections = [
-                        (margin, margin),  # 좌상단
-                        (margin * 2 + section_width, margin),  # 우상단
-                        (margin, margin * 2 + section_height),  # 좌하단
-                        (margin * 2 + section_width, margin * 2 + section_height)  # 우하단
-                    ]
-                    
-                    # 사진 추가
-                    if 'uploaded_photos' in st.session_state:
-                        for idx, photo in enumerate(st.session_state.uploaded_photos):
-                            if idx < 4:  # 최대 4장까지만 처리
-                                try:
-                                    photo_img = Image.open(photo).convert("RGBA")
-                                    
-                                    # 섹션 크기에 맞게 사진 크기 조정
-                                    photo_width, photo_height = photo_img.size
-                                    ratio = min(section_width / photo_width, section_height / photo_height)
-                                    new_width = int(photo_width * ratio)
-                                    new_height = int(photo_height * ratio)
-                                    photo_img = photo_img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                                    
-                                    # 섹션 중앙에 사진 배치
-                                    x, y = sections[idx]
-                                    x_center = x + (section_width - new_width) // 2
-                                    y_center = y + (section_height - new_height) // 2
-                                    
-                                    # 사진 붙이기
-                                    extra_image.paste(photo_img, (x_center, y_center), photo_img)
-                                    
-                                except Exception as e:
-                                    st.error(f"사진 {idx+1} 처리 중 오류 발생: {e}")
-                
-                    # 별지 이미지 출력
-                    st.image(extra_image, caption='학습 활동 사진', width=800)
-                except FileNotFoundError:
-                    st.error(f"별지 이미지를 찾을 수 없습니다: {extra_img_path}")
-                    st.stop()
+                    photos.append(Image.open(photo).convert("RGBA"))
+                except Exception as e:
+                    st.error(f"사진 {idx+1} 처리 중 오류 발생: {e}")
+            extra_image, _ = get_form_layout("field_trip_report_photos").render({"photos": photos})
+
+            # 별지 이미지 출력
+            st.image(extra_image, caption='학습 활동 사진', width=800)
 
         except Exception as e:
             st.error(f"이미지 또는 폰트 로드 중 오류 발생: {e}")
@@ -0,0 +1,21 @@
+import pandas as pd
+import pytest
+
+RUN_COLUMNS = ['번호', '성명', '출결구분', '결석시작일', '결석종료일']
+
+
+def _make_runs(rows, extra=(), **fixed):
+    """
+    (번호, 성명, 출결구분, 결석시작일, 결석종료일, *extra 열) 행 목록으로 처리된 결석 데이터를 만듭니다.
+    fixed로 모든 행에 같은 값을 넣을 열을 바꿉니다. (기본값: 사유 '사유입력', 결석일수 1)
+    """
+    data = pd.DataFrame(list(rows), columns=RUN_COLUMNS + list(extra))
+    for column, value in {'사유': '사유입력', '결석일수': 1, **fixed}.items():
+        if column not in extra:
+            data[column] = value
+    return data
+
+
+@pytest.fixture
+def make_runs():
+    return _make_runs
@@ -0,0 +1,81 @@
+import pytest
+
+from app.absence_analytics import AbsenceRollups
+
+# (번호, 성명, 출결구분, 결석시작일, 결석종료일, 결석일수)
+MARCH_ROWS = [
+    (1, '김가온', '질병결석', '2025.03.03', '2025.03.04', 2),
+    (1, '김가온', '미인정결석', '2025.03.10', '2025.03.12', 3),
+    (2, '이나래', '기타결석', '2025.03.31', '2025.04.01', 2),
+]
+
+
+@pytest.fixture
+def runs(make_runs):
+    return lambda rows: make_runs(rows, extra=['결석일수'])
+
+
+@pytest.fixture
+def march(runs):
+    return runs(MARCH_ROWS)
+
+
+def _days(rollups, grade="1", class_name="3"):
+    totals = rollups.student_totals(grade, class_name)
+    return {row["번호"]: row.drop(["학년", "반", "번호", "성명"]).to_dict() for _, row in totals.iterrows()}
+
+
+def test_reingest_same_data_does_not_double_count(tmp_path, march):
+    rollups = AbsenceRollups(tmp_path / "analytics.sqlite3")
+    rollups.ingest(march, "1", "3")
+    first = _days(rollups)
+    rollups.ingest(march, "1", "3")
+
+    assert _days(rollups) == first
+    assert first[1]["질병결석"] == 2
+    assert first[1]["미인정결석"] == 3
+    assert first[1]["합계"] == 5
+    assert first[2]["기타결석"] == 2
+
+
+def test_reingest_cumulative_file_replaces_runs(tmp_path, march, runs):
+    rollups = AbsenceRollups(tmp_path / "analytics.sqlite3")
+    rollups.ingest(march, "1", "3")
+    # 누적 파일: 김가온의 미인정결석이 하루 늘고, 4월 결석이 새로 생김
+    cumulative = runs([
+        (1, '김가온', '질병결석', '2025.03.03', '2025.03.04', 2),
+        (1, '김가온', '미인정결석', '2025.03.10', '2025.03.13', 4),
+        (2, '이나래', '기타결석', '2025.03.31', '2025.04.01', 2),
+        (2, '이나래', '질병결석', '2025.04.07', '2025.04.07', 1),
+    ])
+    rollups.ingest(cumulative, "1", "3")
+
+    days = _days(rollups)
+    assert days[1]["미인정결석"] == 4
+    assert days[1]["합계"] == 6
+    assert days[2]["합계"] == 3
+    assert rollups.months() == ["2025-03", "2025-04"]
+    monthly = rollups.monthly_totals("1", "3").set_index("월")
+    assert monthly.loc["2025-04", "질병결석"] == 1
+
+
+def test_ingest_is_scoped_to_class(tmp_path, march):
+    rollups = AbsenceRollups(tmp_path / "analytics.sqlite3")
+    rollups.ingest(march, "1", "3")
+    rollups.ingest(march.iloc[:1], "1", "4")
+
+    assert _days(rollups)[1]["합계"] == 5
+    assert _days(rollups, "1", "4")[1]["합계"] == 2
+    classes = rollups.class_totals("1").set_index("반")
+    assert classes.loc["3", "결석 학생 수"] == 2
+    assert classes.loc["4", "결석 학생 수"] == 1
+
+
+def test_near_threshold_counts_unexcused_absences(tmp_path, march):
+    rollups = AbsenceRollups(tmp_path / "analytics.sqlite3")
+    rollups.ingest(march, "1", "3")
+
+    near = rollups.near_threshold(threshold=3, warning_ratio=0.8)
+
+    assert near["번호"].tolist() == [1]
+    assert near.loc[0, "남은 일수"] == 0
@@ -0,0 +1,38 @@
+import pytest
+
+from app.absence_batch import infer_class_info, parse_teacher_names
+
+
+@pytest.mark.parametrize("file_name, expected", [
+    # 파일 이름
+    ("1-3.xlsx", ("1", "3")),
+    ("2_05.xlsx", ("2", "5")),
+    ("1학년 3반 출결.xlsx", ("1", "3")),
+    ("출결_1-3_2024.xlsx", ("1", "3")),
+    ("출결_1-3_20240305.xlsx", ("1", "3")),
+    ("출결 1-3 2024-03.xlsx", ("1", "3")),
+    # 날짜 모양
+    ("출결 2024.3.2.xlsx", None),
+    ("2024-03-02.xlsx", None),
+    ("출결_2024_03_05.xlsx", None),
+    ("3.2.1 출결.xlsx", None),
+    # 폴더 경로 (ZIP 항목, CLI 폴더 입력)
+    ("학급.zip/1학년/3반.xlsx", ("1", "3")),
+    ("학급.zip/1-4/출결.xlsx", ("1", "4")),
+    ("exports/2학년 7반/출결.xlsx", ("2", "7")),
+    ("학급.zip/2024.3.2/출결.xlsx", None),
+])
+def test_infer_class_info_from_names(file_name, expected):
+    # xlsx가 아닌 내용이면 이름에서만 찾음
+    assert infer_class_info(file_name, b"") == expected
+
+
+@pytest.mark.parametrize("line, expected", [
+    ("1-3 홍길동", {("1", "3"): "홍길동"}),
+    ("1학년 4반: 김철수", {("1", "4"): "김철수"}),
+    ("2_05\t이영희", {("2", "5"): "이영희"}),
+    ("2024.3.2 교직원 회의", {}),
+    ("1-3", {}),
+])
+def test_parse_teacher_names(line, expected):
+    assert parse_teacher_names(line) == expected
@@ -0,0 +1,43 @@
+import pandas as pd
+
+from app.absence_cache import ProcessedDataCache
+
+
+def _process(calls):
+    def process(file_bytes):
+        calls.append(file_bytes)
+        return pd.DataFrame({'번호': [1, 2], '성명': ['김가온', '이나래']})
+    return process
+
+
+def test_same_file_is_processed_once():
+    cache = ProcessedDataCache()
+    calls = []
+
+    first = cache.get_or_process(b"export", _process(calls))
+    first.loc[0, '성명'] = '바뀐 이름'
+    second = cache.get_or_process(b"export", _process(calls))
+
+    assert calls == [b"export"]
+    # 반환값은 복사본이라 한 세션에서 바꿔도 캐시에는 영향이 없음
+    assert second['성명'].tolist() == ['김가온', '이나래']
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = ProcessedDataCache(max_entries=2)
+    calls = []
+    for file_bytes in (b"a", b"b", b"a", b"c"):
+        cache.get_or_process(file_bytes, _process(calls))
+
+    assert cache.get(cache.make_key(b"a")) is not None
+    assert cache.get(cache.make_key(b"b")) is None
+    assert cache.get(cache.make_key(b"c")) is not None
+
+
+def test_entry_larger_than_limit_is_not_kept():
+    cache = ProcessedDataCache(max_bytes=10)
+    calls = []
+    cache.get_or_process(b"export", _process(calls))
+    cache.get_or_process(b"export", _process(calls))
+
+    assert len(calls) == 2
@@ -0,0 +1,87 @@
+import pandas as pd
+from openpyxl import Workbook
+
+from app.absence_excel_processing import REPORT_TYPES, merge_consecutive_absences, process_excel
+
+# 나이스 출결 엑셀 형태 (번호/성명은 병합 셀이라 학생의 첫 행에만 있음)
+NEIS_ROWS = [
+    (1, 1, '김가온', '2025.03.03.', '질병결석', '감기로 인한 결석'),
+    (2, None, None, '2025.03.04.', '질병 결석', '감기로 인한 결석'),
+    (3, None, None, '2025.03.05.', '출석', None),
+    (4, None, None, '2025.03.06.', '기타결석', '가정 사정'),
+    (5, None, None, '2025.03.07.', ' 기타결석 ', '가정 사정'),
+    (6, None, None, '2025.03.10.', '기타결석', '가정 사정'),
+    (7, None, None, '2025.03.11.', '출석인정결석', '경조사로 인한 출석인정'),
+    (8, 2, '이나래', '2025.03.31.', '질병결석', '장염으로 인한 결석'),
+    (9, None, None, '2025.04.01.', '질병결석', '장염으로 인한 결석'),
+    (10, None, None, '2025.04.02.', '질병지각', '병원 진료'),
+    (11, None, None, '2025.04.03.', '질병결석', '병원 진료로 인한 결석'),
+    (12, None, None, '2025.04.04.', '미인정결석', '무단'),
+]
+
+# 행 단위 반복문으로 병합하던 이전 process_excel의 결과
+# (번호, 성명, 일자, 출결구분, 사유, 결석시작일, 결석종료일, 결석일수)
+BASELINE_RUNS = [
+    (1, '김가온', '2025.03.06 ~ 2025.03.07', '기타결석', '가정 사정', '2025.03.06', '2025.03.07', 2),
+    (1, '김가온', '2025.03.10', '기타결석', '가정 사정', '2025.03.10', '2025.03.10', 1),
+    (1, '김가온', '2025.03.03 ~ 2025.03.04', '질병결석', '감기', '2025.03.03', '2025.03.04', 2),
+    (1, '김가온', '2025.03.11', '출석인정결석', '경조사', '2025.03.11', '2025.03.11', 1),
+    (2, '이나래', '2025.03.31 ~ 2025.04.01', '질병결석', '장염', '2025.03.31', '2025.04.01', 2),
+    (2, '이나래', '2025.04.03', '질병결석', '병원 진료', '2025.04.03', '2025.04.03', 1),
+]
+
+
+def _write_export(path, rows=NEIS_ROWS):
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(['순', '번호', '성명', '일자', '출결구분', '사유'])
+    for row in rows:
+        sheet.append(list(row))
+    workbook.save(path)
+    return path
+
+
+def _run_tuples(data):
+    return sorted(
+        (int(row[0]), *(str(value) for value in row[1:7]), int(row[7]))
+        for row in data.itertuples(index=False, name=None)
+    )
+
+
+def test_process_excel_matches_baseline_runs(tmp_path):
+    result = process_excel(_write_export(tmp_path / "export.xlsx"))
+
+    report_runs = result[result['출결구분'].isin(REPORT_TYPES)]
+    assert _run_tuples(report_runs) == sorted(BASELINE_RUNS)
+
+
+def test_process_excel_keeps_unexcused_absences(tmp_path):
+    result = process_excel(_write_export(tmp_path / "export.xlsx"))
+
+    unexcused = result[result['출결구분'] == '미인정결석']
+    assert _run_tuples(unexcused) == [
+        (2, '이나래', '2025.04.04', '미인정결석', '무단', '2025.04.04', '2025.04.04', 1)
+    ]
+
+
+def test_merge_consecutive_absences_unsorted_input():
+    data = pd.DataFrame({
+        '번호': [3, 3, 3, 3],
+        '성명': ['박다온'] * 4,
+        '일자': pd.to_datetime(['2025.05.14', '2025.05.12', '2025.05.13', '2025.05.20'], format='%Y.%m.%d'),
+        '출결구분': ['질병결석'] * 4,
+        '사유': [None, None, None, '두통'],
+    })
+
+    result = merge_consecutive_absences(data)
+
+    assert _run_tuples(result) == [
+        (3, '박다온', '2025.05.12 ~ 2025.05.14', '질병결석', '사유입력', '2025.05.12', '2025.05.14', 3),
+        (3, '박다온', '2025.05.20', '질병결석', '두통', '2025.05.20', '2025.05.20', 1),
+    ]
+
+
+def test_merge_consecutive_absences_empty():
+    data = pd.DataFrame(columns=['번호', '성명', '일자', '출결구분', '사유'])
+
+    assert merge_consecutive_absences(data).empty
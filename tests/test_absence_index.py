@@ -0,0 +1,55 @@
+import pytest
+
+from app.absence_index import STATUS_CHANGED, STATUS_ISSUED, STATUS_NEW, IssuedReportIndex
+
+# (번호, 성명, 출결구분, 결석시작일, 결석종료일, 사유)
+ISSUED_ROWS = [
+    (1, '김가온', '질병결석', '2025.03.03', '2025.03.04', '감기'),
+    (2, '이나래', '기타결석', '2025.03.10', '2025.03.10', '가정 사정'),
+]
+
+
+@pytest.fixture
+def runs(make_runs):
+    return lambda rows: make_runs(rows, extra=['사유'])
+
+
+@pytest.fixture
+def issued(runs):
+    return runs(ISSUED_ROWS)
+
+
+def test_run_status_without_index_file(tmp_path, issued):
+    index = IssuedReportIndex(tmp_path / "index.sqlite3")
+
+    assert index.run_status(issued, "1", "3").tolist() == [STATUS_NEW, STATUS_NEW]
+    assert not (tmp_path / "index.sqlite3").exists()
+
+
+def test_run_status_after_record(tmp_path, issued, runs):
+    index = IssuedReportIndex(tmp_path / "index.sqlite3")
+    index.record(issued, "1", "3")
+
+    data = runs([
+        (1, '김가온', '질병결석', '2025.03.03', '2025.03.04', '감기'),       # 같은 기간, 같은 사유
+        (1, '김가온', '질병결석', '2025.03.03', '2025.03.05', '감기'),       # 기간이 늘어남
+        (2, '이나래', '기타결석', '2025.03.10', '2025.03.10', '병원 진료'),  # 사유가 바뀜
+        (1, '김가온', '질병결석', '2025.03.20', '2025.03.20', '감기'),       # 겹치지 않는 새 기간
+        (1, '김가온', '기타결석', '2025.03.03', '2025.03.04', '감기'),       # 다른 출결구분
+        (3, '박다온', '질병결석', '2025.03.03', '2025.03.04', '감기'),       # 다른 학생
+    ])
+
+    assert index.run_status(data, "1", "3").tolist() == [
+        STATUS_ISSUED, STATUS_CHANGED, STATUS_CHANGED, STATUS_NEW, STATUS_NEW, STATUS_NEW
+    ]
+    # 다른 학급의 기록과는 비교하지 않음
+    assert index.run_status(data, "1", "4").eq(STATUS_NEW).all()
+    assert index.new_runs(data, "1", "3").index.tolist() == [1, 2, 3, 4, 5]
+
+
+def test_record_same_runs_again_keeps_one_row(tmp_path, issued):
+    index = IssuedReportIndex(tmp_path / "index.sqlite3")
+    index.record(issued, "1", "3")
+    index.record(issued, "1", "3")
+
+    assert len(index.issued_runs("1", "3")) == len(issued)
@@ -0,0 +1,65 @@
+from datetime import date
+
+import pytest
+
+from app.absence_selection import RowSelection, display_frame, filter_runs, page_slice
+
+# (번호, 성명, 출결구분, 결석시작일, 결석종료일, 사유)
+ROWS = [
+    (1, '김가온', '질병결석', '2025.03.03', '2025.03.04', '감기'),
+    (1, '김가온', '질병결석', '2025.03.20', '2025.03.20', '병원 진료'),
+    (2, '이나래', '기타결석', '2025.03.31', '2025.04.01', '가정 사정'),
+    (3, '박다온', '질병결석', '2025.04.07', '2025.04.08', '장염'),
+    (3, '박다온', '출석인정결석', '2025.04.10', '2025.04.10', '경조사'),
+]
+
+
+@pytest.fixture
+def data(make_runs):
+    return make_runs(ROWS, extra=['사유'])
+
+
+def test_selection_survives_paging_and_filtering(data):
+    selection = RowSelection("upload-1")
+    first_page, page_count = page_slice(data, 1, 2)
+    selection.apply_page(first_page.index, [0])
+    second_page, _ = page_slice(data, 2, 2)
+    selection.apply_page(second_page.index, [3])
+
+    assert page_count == 3
+    assert selection.selected_rows(data).index.tolist() == [0, 3]
+
+    # '모두 선택'은 현재 필터에 맞는 행 전체에 적용
+    selection.select(filter_runs(data, numbers=[3]).index)
+    assert selection.selected == {0, 3, 4}
+    # 같은 파일이면 선택 유지, 다른 파일이면 비움
+    selection.reset_for("upload-1")
+    assert selection.selected == {0, 3, 4}
+    selection.reset_for("upload-2")
+    assert selection.selected == set()
+
+
+def test_filter_runs_by_overlapping_period_and_reason(data):
+    in_april = filter_runs(data, date_range=(date(2025, 4, 1), date(2025, 4, 7)))
+    assert in_april.index.tolist() == [2, 3]
+
+    assert filter_runs(data, reason_text="진료").index.tolist() == [1]
+    assert filter_runs(data, numbers=[1, 3], reason_text="장염").index.tolist() == [3]
+
+
+def test_page_slice_clamps_page_number(data):
+    page, page_count = page_slice(data, 99, 2)
+
+    assert page_count == 3
+    assert page.index.tolist() == [4]
+    assert page_slice(data.iloc[:0], 1, 20)[1] == 1
+
+
+def test_display_frame_marks_selected_rows(data):
+    selection = RowSelection()
+    selection.select([1])
+
+    frame = display_frame(data.iloc[:2], selection)
+
+    assert frame.columns.tolist() == ['선택', '번호', '성명', '사유', '결석일수']
+    assert frame['선택'].tolist() == [False, True]
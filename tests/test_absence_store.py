@@ -0,0 +1,68 @@
+import os
+import time
+
+import pytest
+
+from app.absence_store import ProcessedDataStore
+
+pytest.importorskip("pyarrow")
+
+# (번호, 성명, 출결구분, 결석시작일, 결석종료일)
+ROWS = [
+    (1, '김가온', '질병결석', '2025.03.03', '2025.03.04'),
+    (2, '이나래', '기타결석', '2025.04.01', '2025.04.02'),
+]
+
+
+@pytest.fixture
+def data(make_runs):
+    return make_runs(ROWS)
+
+
+def test_get_or_process_reads_saved_result(tmp_path, data):
+    store = ProcessedDataStore(tmp_path)
+    calls = []
+
+    def process(file_bytes):
+        calls.append(file_bytes)
+        return data
+
+    store.get_or_process(b"export", "1", "3", process, "1-3.xlsx")
+    loaded = store.get_or_process(b"export", "1", "3", process, "1-3.xlsx")
+
+    assert calls == [b"export"]
+    assert loaded['성명'].tolist() == ['김가온', '이나래']
+    assert loaded['출결구분'].dtype == 'category'
+    # 키의 달은 업로드 시각이 아니라 데이터의 마지막 결석종료일에서 정함
+    assert store.find(b"export", "1", "3").startswith("1-3_2025-04_")
+    # 다른 학급에서 같은 파일을 올리면 따로 처리
+    store.get_or_process(b"export", "1", "4", process)
+    assert len(calls) == 2
+
+
+def test_recent_is_scoped_to_owner(tmp_path, data):
+    store = ProcessedDataStore(tmp_path)
+    key = store.save_upload(b"export", "1", "3", data, "1-3.xlsx", owner="teacher-a")
+
+    assert [entry["key"] for entry in store.recent("teacher-a", "1", "3")] == [key]
+    assert store.recent("teacher-b", "1", "3") == []
+    assert store.recent("teacher-a", "1", "4") == []
+
+    # 같은 파일을 다른 사용자가 올리면 항목을 새로 만들지 않고 사용자만 추가
+    assert store.save_upload(b"export", "1", "3", data, "1-3.xlsx", owner="teacher-b") == key
+    assert [entry["key"] for entry in store.recent("teacher-b")] == [key]
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+
+def test_expired_entries_are_ignored_and_pruned(tmp_path, data):
+    store = ProcessedDataStore(tmp_path, max_age_days=1)
+    old_key = store.save_upload(b"old", "1", "3", data, owner="teacher-a")
+    stale = time.time() - 2 * 24 * 60 * 60
+    os.utime(tmp_path / f"{old_key}.json", (stale, stale))
+
+    assert store.find(b"old", "1", "3") is None
+    assert store.recent("teacher-a") == []
+
+    store.save_upload(b"new", "1", "3", data, owner="teacher-a")
+    assert not (tmp_path / f"{old_key}.parquet").exists()
+    assert not (tmp_path / f"{old_key}.json").exists()
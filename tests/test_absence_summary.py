@@ -0,0 +1,54 @@
+import io
+
+import pytest
+from openpyxl import load_workbook
+
+from app.absence_summary import (SUMMARY_COLUMNS, TOTALS_COLUMNS, TOTALS_SHEET_TITLE, iter_summary_rows,
+                                 write_summary_workbook)
+
+# (번호, 성명, 출결구분, 결석시작일, 결석종료일, 결석일수)
+ROWS = [
+    (2, '이나래', '기타결석', '2025.03.31', '2025.04.01', 2),
+    (1, '김가온', '질병결석', '2025.03.10', '2025.03.12', 3),
+    (1, '김가온', '질병결석', '2025.03.03', '2025.03.04', 2),
+    (1, '김가온', '미인정결석', '2025.03.20', '2025.03.20', 1),
+]
+
+
+@pytest.fixture
+def data(make_runs):
+    return make_runs(ROWS, extra=['결석일수'])
+
+
+def test_iter_summary_rows_orders_by_number_type_and_start(data):
+    rows = list(iter_summary_rows(data))
+
+    assert [(row[0], row[2], row[3]) for row in rows] == [
+        (1, '미인정결석', '2025.03.20'),
+        (1, '질병결석', '2025.03.03'),
+        (1, '질병결석', '2025.03.10'),
+        (2, '기타결석', '2025.03.31'),
+    ]
+    # 데이터에 없는 열(결석확인일)은 빈 칸
+    assert rows[0][SUMMARY_COLUMNS.index('결석확인일')] is None
+
+
+def test_write_summary_workbook_adds_class_sheets_and_totals(data):
+    content = write_summary_workbook([
+        ("1학년 3반", iter_summary_rows(data)),
+        ("1학년 4반", iter_summary_rows(data.iloc[:1])),
+    ])
+
+    workbook = load_workbook(io.BytesIO(content))
+    assert workbook.sheetnames == ["1학년 3반", "1학년 4반", TOTALS_SHEET_TITLE]
+    class_rows = list(workbook["1학년 3반"].values)
+    assert list(class_rows[0]) == SUMMARY_COLUMNS
+    assert len(class_rows) == 1 + len(ROWS)
+
+    totals = [dict(zip(TOTALS_COLUMNS, row)) for row in list(workbook[TOTALS_SHEET_TITLE].values)[1:]]
+    assert totals[0]['학급'] == "1학년 3반"
+    assert totals[0]['결석 기간 수'] == 4
+    assert totals[0]['질병결석 일수'] == 5
+    assert totals[0]['미인정결석 일수'] == 1
+    assert totals[0]['합계 일수'] == 8
+    assert totals[1]['합계 일수'] == 2
@@ -0,0 +1,42 @@
+from docx import Document
+
+from app.docx_placeholders import join_split_placeholders
+
+
+def _paragraph(document, *texts, bold_first=False):
+    paragraph = document.add_paragraph()
+    for index, text in enumerate(texts):
+        paragraph.add_run(text).bold = bold_first and index == 0
+    return paragraph
+
+
+def test_split_placeholder_is_moved_into_starting_run():
+    document = Document()
+    paragraph = _paragraph(document, "성명: {성", "명}님 ", "{결석", "시작일} 부터", bold_first=True)
+
+    join_split_placeholders(document.element.body)
+
+    assert [run.text for run in paragraph.runs] == ["성명: {성명}", "님 ", "{결석시작일}", " 부터"]
+    assert paragraph.runs[0].bold
+    assert paragraph.text == "성명: {성명}님 {결석시작일} 부터"
+
+
+def test_placeholders_in_table_cells_are_joined():
+    document = Document()
+    cell = document.add_table(rows=1, cols=1).cell(0, 0)
+    paragraph = cell.paragraphs[0]
+    for text in ("{", "1", "}"):
+        paragraph.add_run(text)
+
+    join_split_placeholders(document.element.body)
+
+    assert [run.text for run in paragraph.runs] == ["{1}", "", ""]
+
+
+def test_text_without_complete_placeholder_is_unchanged():
+    document = Document()
+    paragraph = _paragraph(document, "중괄호 {만", " 있는 문장")
+
+    join_split_placeholders(document.element.body)
+
+    assert [run.text for run in paragraph.runs] == ["중괄호 {만", " 있는 문장"]
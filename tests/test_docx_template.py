@@ -0,0 +1,49 @@
+import io
+import os
+
+from docx import Document
+
+from app.docx_template import get_compiled_template
+
+
+def _write_template(path):
+    document = Document()
+    paragraph = document.add_paragraph("성명: ")
+    for text in ("{성", "명}"):
+        paragraph.add_run(text)
+    document.add_table(rows=1, cols=1).cell(0, 0).text = "사유: {사유}"
+    document.save(path)
+    return path
+
+
+def _texts(document):
+    paragraphs = [p.text for p in document.paragraphs]
+    cells = [table.cell(0, 0).text for table in document.tables]
+    return paragraphs, cells
+
+
+def test_render_stamps_one_page_per_record(tmp_path):
+    template = get_compiled_template(_write_template(tmp_path / "template.docx"))
+
+    document = template.render([
+        {"{성명}": "김가온", "{사유}": "감기 & 발열"},
+        {"{성명}": "이나래", "{사유}": "<병원 진료>"},
+    ])
+    # 저장 후 다시 열어도 올바른 문서여야 함 (XML 특수 문자 이스케이프 확인)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    paragraphs, cells = _texts(Document(io.BytesIO(buffer.getvalue())))
+
+    assert template.placeholders == ["{사유}", "{성명}"]
+    assert [text for text in paragraphs if text] == ["성명: 김가온", "성명: 이나래"]
+    assert cells == ["사유: 감기 & 발열", "사유: <병원 진료>"]
+
+
+def test_compiled_template_is_reused_until_file_changes(tmp_path):
+    path = _write_template(tmp_path / "template.docx")
+    first = get_compiled_template(path)
+
+    assert get_compiled_template(path) is first
+
+    os.utime(path, (1, 1))
+    assert get_compiled_template(path) is not first
@@ -0,0 +1,21 @@
+import pytest
+
+from app.font_registry import FontNotFoundError, FontRegistry
+
+
+def test_missing_font_message_lists_files_to_install(tmp_path):
+    registry = FontRegistry(
+        families={"dotum": [tmp_path / "HANDotum.ttf"], "dotum_bold": [tmp_path / "HANDotumB.ttf"]},
+        fallbacks={"dotum_bold": "dotum"},
+    )
+
+    with pytest.raises(FontNotFoundError) as error:
+        registry.get("dotum_bold", 20)
+
+    message = str(error.value)
+    assert "'dotum_bold'" in message
+    assert "fonts-nanum" in message
+    # 대체 폰트 종류의 후보까지 안내함
+    assert str(tmp_path / "HANDotumB.ttf") in message
+    assert str(tmp_path / "HANDotum.ttf") in message
+    assert registry.resolve("dotum_bold") is None
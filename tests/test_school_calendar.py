@@ -0,0 +1,68 @@
+import json
+import os
+from datetime import date
+
+import numpy as np
+
+from app import school_calendar
+from app.school_calendar import SchoolCalendar
+
+
+def _calendar():
+    return SchoolCalendar(
+        2024, 2025,
+        closure_days={"2025-05-02": "재량휴업일"},
+        annual_closure_days={"06-10": "개교기념일"},
+    )
+
+
+def test_count_school_days_skips_weekends_holidays_and_closures():
+    calendar = _calendar()
+
+    # 5/2 재량휴업일, 5/3~4 주말, 5/5 어린이날·부처님오신날, 5/6 대체공휴일
+    assert calendar.count_school_days(date(2025, 5, 1), date(2025, 5, 9)) == 4
+    # 매년 6/10 개교기념일
+    assert calendar.count_school_days(date(2024, 6, 10), date(2024, 6, 10)) == 0
+    assert calendar.count_school_days(date(2025, 6, 9), date(2025, 6, 11)) == 2
+
+
+def test_count_school_days_across_years_and_empty_range():
+    calendar = _calendar()
+
+    # 12/30, 12/31, (1/1 신정), 1/2
+    assert calendar.count_school_days(date(2024, 12, 30), date(2025, 1, 2)) == 3
+    assert calendar.count_school_days(date(2025, 3, 4), date(2025, 3, 3)) == 0
+
+
+def test_next_school_days():
+    calendar = _calendar()
+    days = np.array(["2025-05-02", "2025-05-03", "2025-05-07", "2025-06-10", "2024-12-31"], dtype="datetime64[D]")
+
+    result = calendar.next_school_days(days)
+
+    assert result.astype(str).tolist() == ["2025-05-07", "2025-05-07", "2025-05-07", "2025-06-11", "2024-12-31"]
+
+
+def test_next_school_day():
+    calendar = _calendar()
+
+    assert calendar.next_school_day(date(2025, 5, 1)) == date(2025, 5, 7)
+    assert calendar.next_school_day(date(2025, 5, 7), include_today=True) == date(2025, 5, 7)
+    assert calendar.next_school_day(date(2024, 12, 31)) == date(2025, 1, 2)
+
+
+def test_shared_calendar_reloads_when_config_changes(tmp_path, monkeypatch):
+    config_path = tmp_path / "school_calendar.json"
+    monkeypatch.setattr(school_calendar, "CALENDAR_CONFIG_PATH", config_path)
+    monkeypatch.setattr(school_calendar, "_calendar", None)
+    monkeypatch.setattr(school_calendar, "_calendar_stamp", None)
+    day = date(2025, 5, 2)
+
+    first = school_calendar.get_school_calendar(day)
+    assert first.count_school_days(day, day) == 1
+    assert school_calendar.get_school_calendar(day) is first
+
+    config_path.write_text(json.dumps({"closure_days": {"2025-05-02": "재량휴업일"}}), encoding="utf-8")
+    os.utime(config_path, (1, 1))
+
+    assert school_calendar.get_school_calendar(day).count_school_days(day, day) == 0
@@ -0,0 +1,36 @@
+import pytest
+from PIL import ImageFont
+
+from app.text_layout import ELLIPSIS, text_width, wrap_lines
+
+
+@pytest.fixture(scope="module")
+def font():
+    return ImageFont.load_default(20)
+
+
+def test_trailing_newline_is_not_a_line(font):
+    assert wrap_lines("abc\n", font, 500, max_lines=1) == ["abc"]
+    assert wrap_lines("abc\n\n", font, 500) == ["abc"]
+
+
+def test_hard_newline_keeps_leading_spaces(font):
+    assert wrap_lines("first\n  indented", font, 500) == ["first", "  indented"]
+    assert wrap_lines("  lead", font, 500) == ["  lead"]
+
+
+def test_soft_wrap_drops_leading_space(font):
+    max_width = text_width("aaaa", font)
+
+    assert wrap_lines("aaaa  aaaa", font, max_width) == ["aaaa", "aaaa"]
+
+
+def test_overflow_truncates_last_line(font):
+    max_width = text_width("aaaa", font)
+
+    lines = wrap_lines("aaaa\nbbbb\ncccc", font, max_width, max_lines=2)
+
+    assert len(lines) == 2
+    assert lines[0] == "aaaa"
+    assert lines[1].endswith(ELLIPSIS)
+    assert text_width(lines[1], font) <= max_width